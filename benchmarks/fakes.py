@@ -0,0 +1,318 @@
+"""Offline stand-ins for the YouTube, transcript, LLM and embedding services."""
+
+import asyncio
+import random
+import re
+import time
+import zlib
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from benchmarks.synthetic import VOCABULARY, SyntheticPlaylist
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+# region YOUTUBE
+
+
+class _FakeRequest:
+    def __init__(self, build_response: Callable[[], dict], latency_seconds: float = 0.0):
+        self._build_response = build_response
+        self.latency_seconds = latency_seconds
+
+    def execute(self) -> dict:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return self._build_response()
+
+
+class _FakeResource:
+    def __init__(self, list_request, list_next=None):
+        self._list_request = list_request
+        self._list_next = list_next
+
+    def list(self, **kwargs) -> _FakeRequest:
+        return self._list_request(**kwargs)
+
+    def list_next(self, request, response) -> Optional[_FakeRequest]:
+        return self._list_next(request, response) if self._list_next else None
+
+
+class FakeYouTubeService:
+    """
+    Serves a SyntheticPlaylist through the subset of the YouTube Data API
+    client used by YouTubePlaylistLoader, including pagination.
+    """
+
+    def __init__(
+        self, playlist: SyntheticPlaylist, page_size: int = 50, latency_seconds: float = 0.0
+    ):
+        self.playlist = playlist
+        self.page_size = page_size
+        self.latency_seconds = latency_seconds
+        self.requests = 0
+
+    def _request(self, build_response: Callable[[], dict]) -> _FakeRequest:
+        self.requests += 1
+        return _FakeRequest(build_response, self.latency_seconds)
+
+    def playlists(self) -> _FakeResource:
+        def list_request(**kwargs):
+            return self._request(
+                lambda: {
+                    "items": [
+                        {
+                            "snippet": {
+                                "title": self.playlist.title,
+                                "channelTitle": "Benchmark channel",
+                                "description": "Synthetic playlist for offline benchmarks",
+                                "publishedAt": "2024-01-01T00:00:00Z",
+                                "thumbnails": {},
+                            },
+                            "contentDetails": {"itemCount": self.playlist.videos},
+                        }
+                    ]
+                }
+            )
+
+        return _FakeResource(list_request)
+
+    def _playlist_page(self, offset: int) -> dict:
+        video_ids = self.playlist.video_ids[offset : offset + self.page_size]
+        response: Dict[str, Any] = {
+            "items": [
+                {
+                    "contentDetails": {"videoId": video_id},
+                    "snippet": {
+                        "position": offset + idx,
+                        "title": self.playlist.video_title(offset + idx),
+                        "description": "",
+                        "thumbnails": {},
+                    },
+                }
+                for idx, video_id in enumerate(video_ids)
+            ]
+        }
+        if offset + self.page_size < len(self.playlist.video_ids):
+            response["nextPageToken"] = str(offset + self.page_size)
+        return response
+
+    def playlistItems(self) -> _FakeResource:
+        def list_request(**kwargs):
+            return self._request(lambda: self._playlist_page(0))
+
+        def list_next(request, response):
+            next_offset = response.get("nextPageToken")
+            if next_offset is None:
+                return None
+            return self._request(lambda: self._playlist_page(int(next_offset)))
+
+        return _FakeResource(list_request, list_next)
+
+    def videos(self) -> _FakeResource:
+        duration = self.playlist.video_duration_seconds
+
+        def list_request(id: str = "", **kwargs):
+            return self._request(
+                lambda: {
+                    "items": [
+                        {
+                            "id": video_id,
+                            "contentDetails": {
+                                "duration": f"PT{duration // 60}M{duration % 60}S"
+                            },
+                            "statistics": {"viewCount": "1000", "likeCount": "50"},
+                        }
+                        for video_id in id.split(",")
+                        if video_id
+                    ]
+                }
+            )
+
+        return _FakeResource(list_request)
+
+
+class SyntheticTranscripts:
+    """
+    Transcript source with the TranscriptCache interface.
+
+    YoutubeLoaderWithProxy checks its cache before any network call, so
+    passing this as the loader's cache serves synthetic snippets through
+    the real loading and chunking code. `latency_seconds` simulates the
+    transcript fetch.
+    """
+
+    def __init__(self, playlist: SyntheticPlaylist, latency_seconds: float = 0.0):
+        self.playlist = playlist
+        self.latency_seconds = latency_seconds
+
+    def get(
+        self,
+        video_id: str,
+        language: Union[str, Sequence[str]],
+        translation: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return self.playlist.snippets(video_id)
+
+    def put(self, *args, **kwargs) -> None:
+        return None
+
+
+# region EMBEDDINGS
+
+
+class HashingEmbeddings(Embeddings):
+    """
+    Deterministic bag-of-words embeddings.
+
+    Every word is hashed into one of `size` signed buckets and the vector
+    is L2-normalized, so texts sharing words get similar vectors and
+    retrieval behaves plausibly without a model. `latency_seconds` is
+    added to every call to simulate the provider round trip.
+    """
+
+    def __init__(self, size: int = 256, latency_seconds: float = 0.0):
+        self.size = size
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+        self.texts = 0
+
+    def _embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.size, dtype=np.float32)
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            bucket = zlib.crc32(token.encode("utf-8"))
+            vector[bucket % self.size] += 1.0 if bucket & 0x80000000 else -1.0
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+    def _record(self, texts: int) -> None:
+        self.calls += 1
+        self.texts += texts
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self._record(len(texts))
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        self._record(len(texts))
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        return [self._embed(text) for text in texts]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
+
+
+# region CHAT MODEL
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model that answers with deterministic filler text.
+
+    The first token arrives after `latency_seconds` and the remaining
+    `output_tokens` stream at `tokens_per_second`. Replies break into a new
+    line every few words, so the same model also works as a query
+    expansion model. Usage metadata counts whitespace-separated words.
+    """
+
+    latency_seconds: float = 0.2
+    tokens_per_second: float = 80.0
+    output_tokens: int = 120
+    words_per_line: int = 8
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-benchmark-chat"
+
+    def _reply(self, messages: List[BaseMessage]) -> List[str]:
+        prompt = str(messages[-1].content) if messages else ""
+        rng = random.Random(prompt)
+        tokens = []
+        for idx in range(self.output_tokens):
+            separator = "\n" if (idx + 1) % self.words_per_line == 0 else " "
+            tokens.append(rng.choice(VOCABULARY) + separator)
+        return tokens
+
+    def _usage(self, messages: List[BaseMessage], output_tokens: int) -> dict:
+        input_tokens = sum(len(str(message.content).split()) for message in messages)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+    def _total_seconds(self, tokens: int) -> float:
+        streaming = tokens / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+        return self.latency_seconds + streaming
+
+    def _result(self, messages: List[BaseMessage], tokens: List[str]) -> ChatResult:
+        message = AIMessage(
+            content="".join(tokens).strip(),
+            usage_metadata=self._usage(messages, len(tokens)),
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        tokens = self._reply(messages)
+        time.sleep(self._total_seconds(len(tokens)))
+        return self._result(messages, tokens)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        tokens = self._reply(messages)
+        await asyncio.sleep(self._total_seconds(len(tokens)))
+        return self._result(messages, tokens)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        tokens = self._reply(messages)
+        delay = 1 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+        await asyncio.sleep(self.latency_seconds)
+        for idx, token in enumerate(tokens):
+            if idx:
+                await asyncio.sleep(delay)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(
+                content="", usage_metadata=self._usage(messages, len(tokens))
+            )
+        )
@@ -0,0 +1,180 @@
+"""
+Offline end-to-end benchmark.
+
+Runs ingestion, cold start, retrieval and the full graph against synthetic
+playlists with fake YouTube, embedding and chat model stand-ins, so no
+network access or API key is needed. Results are written as JSON with
+stable keys, to be diffed between releases:
+
+    python -m benchmarks.run --videos 50 --output bench_results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.fakes import FakeChatModel, HashingEmbeddings, SyntheticTranscripts
+from benchmarks.synthetic import SyntheticPlaylist
+
+SCHEMA_VERSION = 1
+
+
+def configure_offline_environment(workdir: Path) -> None:
+    """Point every store at `workdir` and disable the caches that hide work."""
+    os.environ.update(
+        {
+            "GOOGLE_API_KEY": "offline-benchmark",
+            "DEFAULT_CHAT_ID": str(uuid.uuid4()),
+            "LLM_PROVIDER": "fake",
+            "QUERY_MODEL": "fake-query",
+            "GENERATION_MODEL": "fake-generation",
+            "EMBEDDING_PROVIDER": "fake",
+            "EMBEDDING_MODEL": "hashing",
+            "PERSIST_DIR": str(workdir / "chroma"),
+            "BM25_INDEX_DIR": str(workdir / "bm25"),
+            "CHATS_DIR": str(workdir / "chats"),
+            "TRANSCRIPT_CACHE_DIR": str(workdir / "transcripts"),
+            "EMBEDDING_CACHE_PATH": str(workdir / "embeddings_cache.db"),
+            "ENABLE_TRANSCRIPT_CACHE": "false",
+            "ENABLE_EMBEDDING_CACHE": "false",
+            "ENABLE_QUERY_VARIANT_CACHE": "false",
+            "ENABLE_RETRIEVAL_CACHE": "false",
+            "ENABLE_ANSWER_CACHE": "false",
+            "ANONYMIZED_TELEMETRY": "False",
+        }
+    )
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def round_floats(value, digits: int = 6):
+    if isinstance(value, float):
+        return round(value, digits)
+    if isinstance(value, dict):
+        return {key: round_floats(item, digits) for key, item in value.items()}
+    if isinstance(value, list):
+        return [round_floats(item, digits) for item in value]
+    return value
+
+
+async def run_benchmarks(args: argparse.Namespace) -> dict:
+    # Imported here: the application reads its configuration at import time
+    from benchmarks.stages import (
+        bench_cold_start,
+        bench_graph,
+        bench_ingestion,
+        bench_retrieval,
+    )
+    from src.application.graph.helpers import init_vector_db
+
+    spec = SyntheticPlaylist(
+        videos=args.videos, snippets_per_video=args.snippets_per_video, seed=args.seed
+    )
+    embeddings = HashingEmbeddings(size=args.embedding_size, latency_seconds=args.embedding_latency)
+    query_llm = FakeChatModel(
+        latency_seconds=args.llm_latency,
+        tokens_per_second=args.llm_tokens_per_second,
+        output_tokens=args.query_tokens,
+    )
+    generation_llm = FakeChatModel(
+        latency_seconds=args.llm_latency,
+        tokens_per_second=args.llm_tokens_per_second,
+        output_tokens=args.answer_tokens,
+    )
+    transcripts = SyntheticTranscripts(spec, latency_seconds=args.transcript_latency)
+    questions = spec.questions(args.questions)
+
+    started_at = time.perf_counter()
+    ingestion, playlist = await bench_ingestion(
+        vector_store=init_vector_db(embedding_model=embeddings),
+        spec=spec,
+        transcripts=transcripts,
+        max_concurrency=args.transcript_concurrency,
+    )
+    embedding_calls = {"calls": embeddings.calls, "texts": embeddings.texts}
+
+    cold_start, vector_store, retriever = bench_cold_start(
+        embeddings=embeddings, query_llm=query_llm, playlist_id=spec.playlist_id
+    )
+    retrieval = await bench_retrieval(retriever, questions)
+    graph = await bench_graph(
+        retriever=retriever,
+        embeddings=vector_store.embeddings,
+        generation_llm=generation_llm,
+        playlist_id=spec.playlist_id,
+        playlist=playlist,
+        questions=questions,
+        concurrency_levels=args.concurrency,
+    )
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            key: value for key, value in sorted(vars(args).items()) if key not in ("output", "workdir")
+        },
+        "results": {
+            "ingestion": {**ingestion, "embeddings": embedding_calls},
+            "cold_start": cold_start,
+            "retrieval": retrieval,
+            "graph": graph,
+        },
+        "wall_seconds": time.perf_counter() - started_at,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark")
+    parser.add_argument("--videos", type=int, default=20)
+    parser.add_argument("--snippets-per-video", type=int, default=200)
+    parser.add_argument("--questions", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--transcript-concurrency", type=int, default=8)
+    parser.add_argument("--transcript-latency", type=float, default=0.0)
+    parser.add_argument("--embedding-size", type=int, default=256)
+    parser.add_argument("--embedding-latency", type=float, default=0.0)
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds to first token")
+    parser.add_argument("--llm-tokens-per-second", type=float, default=80.0)
+    parser.add_argument("--query-tokens", type=int, default=24)
+    parser.add_argument("--answer-tokens", type=int, default=120)
+    parser.add_argument("--workdir", type=Path, default=None, help="Defaults to a temporary directory")
+    parser.add_argument("--output", type=Path, default=Path("bench_results.json"))
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="yt-bench-") as tmp:
+        workdir = args.workdir or Path(tmp)
+        configure_offline_environment(workdir)
+        report = asyncio.run(run_benchmarks(args))
+
+    args.output.write_text(
+        json.dumps(round_floats(report), indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    print(f"Benchmark results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
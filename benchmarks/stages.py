@@ -0,0 +1,186 @@
+"""
+Benchmark stages. Importing this module imports the application, so the
+offline environment must be configured first (see `benchmarks.run`).
+"""
+
+import io
+import json
+import time
+from typing import Sequence
+
+import numpy as np
+from langchain_chroma import Chroma
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.retrievers import BaseRetriever
+
+from benchmarks.fakes import FakeYouTubeService, SyntheticTranscripts
+from benchmarks.synthetic import SyntheticPlaylist
+from src.application.batch import BatchQuestion, BatchRunner
+from src.application.graph.builder import create_compiled_graph
+from src.application.graph.helpers import (
+    gen_retriever,
+    get_bm25_index,
+    get_llm_chain,
+    init_vector_db,
+    save_transcripts,
+)
+from src.application.services import YouTubePlaylistLoader
+from src.domain.models import YoutubePlaylist
+
+
+def summarize(samples: Sequence[float]) -> dict:
+    """Latency distribution in seconds."""
+    if not samples:
+        return {"count": 0}
+    values = np.asarray(samples, dtype=np.float64)
+    return {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p90": float(np.percentile(values, 90)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+async def bench_ingestion(
+    vector_store: Chroma,
+    spec: SyntheticPlaylist,
+    transcripts: SyntheticTranscripts,
+    max_concurrency: int,
+) -> tuple[dict, YoutubePlaylist]:
+    """Listing, `load_transcript_videos` and `save_transcripts` on a fresh store."""
+    yt_service = YouTubePlaylistLoader(
+        playlist_id=spec.playlist_id,
+        transcript_cache=transcripts,
+        yt_service=FakeYouTubeService(spec),
+    )
+
+    started_at = time.perf_counter()
+    yt_service.load_playlist_details().load_video_details()
+    listing_seconds = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    # The rate limit is lifted so the benchmark measures loading, not throttling
+    await yt_service.load_transcript_videos(
+        max_concurrency=max_concurrency,
+        rate_limit=max(1, spec.videos),
+        rate_period=1,
+    )
+    transcript_seconds = time.perf_counter() - started_at
+    playlist = yt_service.build()
+
+    started_at = time.perf_counter()
+    write_stats = save_transcripts(
+        vector_store=vector_store, playlist=playlist, playlist_id=spec.playlist_id
+    )
+    save_seconds = time.perf_counter() - started_at
+
+    chunks = sum(len(video.transcript) for video in playlist.videos)
+    total = listing_seconds + transcript_seconds + save_seconds
+    return {
+        "videos": len(playlist.videos),
+        "chunks": chunks,
+        "listing_seconds": listing_seconds,
+        "transcript_seconds": transcript_seconds,
+        "save_seconds": save_seconds,
+        "embedding_batches": write_stats["batches"] if write_stats else 0,
+        "total_seconds": total,
+        "videos_per_second": len(playlist.videos) / total if total > 0 else 0.0,
+        "chunks_per_second": chunks / total if total > 0 else 0.0,
+    }, playlist
+
+
+def bench_cold_start(
+    embeddings: Embeddings, query_llm: BaseChatModel, playlist_id: str
+) -> tuple[dict, Chroma, BaseRetriever]:
+    """
+    `init_vector_db` + `gen_retriever` with the BM25 index reloaded from
+    disk. Chroma's client stays warm within one process, so this is a lower
+    bound of a real process start.
+    """
+    # Drops the memory-mapped version, so gen_retriever maps it again
+    get_bm25_index(playlist_id).unload()
+
+    started_at = time.perf_counter()
+    vector_store = init_vector_db(embedding_model=embeddings)
+    init_vector_db_seconds = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    retriever = gen_retriever(vector_store=vector_store, playlist_id=playlist_id, llm=query_llm)
+    gen_retriever_seconds = time.perf_counter() - started_at
+
+    return {
+        "init_vector_db_seconds": init_vector_db_seconds,
+        "gen_retriever_seconds": gen_retriever_seconds,
+        "total_seconds": init_vector_db_seconds + gen_retriever_seconds,
+    }, vector_store, retriever
+
+
+async def bench_retrieval(retriever: BaseRetriever, questions: Sequence[str]) -> dict:
+    """Sequential hybrid searches, with the per-stage timings of each one."""
+    stage_samples: dict[str, list[float]] = {}
+    chunks = []
+    for question in questions:
+        documents, timings = await retriever.asearch(question)
+        chunks.append(len(documents))
+        for stage, seconds in timings.items():
+            stage_samples.setdefault(stage, []).append(seconds)
+
+    return {
+        "questions": len(questions),
+        "mean_chunks": float(np.mean(chunks)) if chunks else 0.0,
+        "latency": summarize(stage_samples.pop("total", [])),
+        "stages": {stage: summarize(samples) for stage, samples in sorted(stage_samples.items())},
+    }
+
+
+async def bench_graph(
+    retriever: BaseRetriever,
+    embeddings: Embeddings,
+    generation_llm: BaseChatModel,
+    playlist_id: str,
+    playlist: YoutubePlaylist,
+    questions: Sequence[str],
+    concurrency_levels: Sequence[int],
+) -> dict:
+    """End-to-end graph latency and throughput through the batch runner."""
+    graph = create_compiled_graph(
+        None,
+        retriever,
+        embeddings=embeddings,
+        llm_chain=get_llm_chain(llm=generation_llm),
+        interactive=False,
+    )
+
+    results = {}
+    for concurrency in concurrency_levels:
+        runner = BatchRunner(
+            graph=graph,
+            playlist_id=playlist_id,
+            playlist=playlist,
+            max_concurrency=concurrency,
+        )
+        output = io.StringIO()
+        stats = await runner.run(
+            (BatchQuestion(index=idx, question=q) for idx, q in enumerate(questions)),
+            output,
+        )
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        metrics = [row["generation_metrics"] for row in rows if row["generation_metrics"]]
+
+        results[str(concurrency)] = {
+            **stats,
+            "latency": summarize([row["latency_seconds"] for row in rows]),
+            "retrieval": summarize(
+                [row["retrieval_timings"]["total"] for row in rows if row["retrieval_timings"]]
+            ),
+            "time_to_first_token": summarize(
+                [m["time_to_first_token"] for m in metrics if m["time_to_first_token"] is not None]
+            ),
+            "output_tokens": int(sum(m["tokens"] for m in metrics)),
+            "input_tokens": int(sum(m["input_tokens"] for m in metrics)),
+        }
+
+    return results
@@ -0,0 +1,69 @@
+import random
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, List
+
+VOCABULARY = (
+    "gradient descent learning rate loss function neural network layer weight bias "
+    "activation softmax embedding vector matrix tensor batch epoch optimizer momentum "
+    "regularization dropout overfitting validation dataset feature label classifier "
+    "regression cluster distance kernel attention transformer token sequence encoder "
+    "decoder convolution pooling recurrent memory state policy reward agent value "
+    "probability distribution sample variance mean entropy likelihood prior posterior"
+).split()
+
+FILLER = "so the idea is that we can see how this works when we take a look at it".split()
+
+
+@dataclass(frozen=True)
+class SyntheticPlaylist:
+    """
+    Deterministic fake playlist: `videos` videos of `snippets_per_video`
+    transcript snippets each. Every snippet lasts 2-5 seconds and holds
+    `min_words`-`max_words` words, like auto-generated YouTube captions.
+    """
+
+    playlist_id: str = "PLbenchmark"
+    title: str = "Synthetic machine learning course"
+    videos: int = 20
+    snippets_per_video: int = 200
+    min_words: int = 6
+    max_words: int = 16
+    seed: int = 0
+
+    @cached_property
+    def video_ids(self) -> List[str]:
+        return [f"bench{self.seed:02d}v{idx:05d}" for idx in range(self.videos)]
+
+    def video_title(self, position: int) -> str:
+        rng = random.Random(f"{self.seed}:title:{position}")
+        return f"Lesson {position + 1}: {' '.join(rng.sample(VOCABULARY, 3))}"
+
+    def snippets(self, video_id: str) -> List[Dict[str, Any]]:
+        rng = random.Random(f"{self.seed}:{video_id}")
+        snippets = []
+        start = 0.0
+        for _ in range(self.snippets_per_video):
+            words = [
+                rng.choice(VOCABULARY) if rng.random() < 0.4 else rng.choice(FILLER)
+                for _ in range(rng.randint(self.min_words, self.max_words))
+            ]
+            text = " ".join(words)
+            if rng.random() < 0.3:
+                text += "."
+            duration = round(rng.uniform(2.0, 5.0), 2)
+            snippets.append({"text": text, "start": round(start, 2), "duration": duration})
+            start += duration
+        return snippets
+
+    @property
+    def video_duration_seconds(self) -> int:
+        # Snippets average 3.5 seconds; listing never needs the exact value
+        return int(self.snippets_per_video * 3.5)
+
+    def questions(self, count: int) -> List[str]:
+        rng = random.Random(f"{self.seed}:questions")
+        return [
+            f"what does the course say about {' and '.join(rng.sample(VOCABULARY, 2))}"
+            for _ in range(count)
+        ]
@@ -1,5 +1,98 @@
-import asyncio
-from src.application.graph import main
+import time
+
+STARTED_AT = time.perf_counter()
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ask questions about a YouTube playlist")
+    parser.add_argument(
+        "--import-report",
+        action="store_true",
+        help="Print how long each startup import and client took",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    serve = commands.add_parser("serve", help="Run the HTTP/SSE server")
+    serve.add_argument("--host", default=None)
+    serve.add_argument("--port", type=int, default=None)
+
+    batch = commands.add_parser("batch", help="Answer questions from a JSONL file")
+    batch.add_argument("questions", type=Path, help="JSONL file with one question per line")
+    batch.add_argument("--playlist", required=True, help="Playlist URL or ID")
+    batch.add_argument("--output", type=Path, default=None)
+    batch.add_argument("--concurrency", type=int, default=None)
+
+    compact = commands.add_parser(
+        "compact", help="Prune old chat checkpoints and reclaim disk space"
+    )
+    compact.add_argument("--keep", type=int, default=None, help="Checkpoints kept per chat")
+    compact.add_argument(
+        "--idle-seconds",
+        type=float,
+        default=None,
+        help="Only drop summarized messages from chats idle this long",
+    )
+    compact.add_argument("--no-vacuum", action="store_true")
+
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+
+    if args.command == "serve":
+        from src.application.server import run_server
+        from src.infrastructure.config import SERVER_HOST, SERVER_PORT
+
+        run_server(host=args.host or SERVER_HOST, port=args.port or SERVER_PORT)
+    elif args.command == "batch":
+        from src.application.batch import run_batch
+        from src.infrastructure.config import BATCH_MAX_CONCURRENCY
+
+        output = args.output or args.questions.with_suffix(".results.jsonl")
+        stats = asyncio.run(
+            run_batch(
+                questions_path=args.questions,
+                output_path=output,
+                playlist=args.playlist,
+                max_concurrency=args.concurrency or BATCH_MAX_CONCURRENCY,
+            )
+        )
+        print(
+            f"Answered {stats['questions']} questions ({stats['failed']} failed) in "
+            f"{stats['total_seconds']:.1f}s, {stats['questions_per_second']:.2f} q/s "
+            f"at concurrency {stats['max_concurrency']} -> {output}"
+        )
+    elif args.command == "compact":
+        from src.application.services.checkpoint_compaction import run_compaction
+        from src.infrastructure.config import (
+            CHECKPOINT_COMPACTION_IDLE_SECONDS,
+            CHECKPOINT_KEEP_LAST,
+        )
+
+        stats = asyncio.run(
+            run_compaction(
+                keep_last=args.keep or CHECKPOINT_KEEP_LAST,
+                idle_seconds=(
+                    args.idle_seconds
+                    if args.idle_seconds is not None
+                    else CHECKPOINT_COMPACTION_IDLE_SECONDS
+                ),
+                vacuum=not args.no_vacuum,
+            )
+        )
+        print(
+            f"Compacted {stats['threads']} chats in {stats['seconds']:.1f}s: "
+            f"{stats['checkpoints_deleted']} checkpoints and {stats['writes_deleted']} writes "
+            f"deleted, {stats['messages_dropped']} summarized messages dropped, "
+            f"{stats['bytes_reclaimed'] / 1024 / 1024:.1f} MB reclaimed "
+            f"({stats['bytes_before']} -> {stats['bytes_after']} bytes)"
+        )
+    else:
+        from src.application.startup import run_interactive
+
+        asyncio.run(run_interactive(started_at=STARTED_AT, import_report=args.import_report))
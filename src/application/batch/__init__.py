@@ -0,0 +1,17 @@
+from .runner import (
+    BatchQuestion,
+    BatchResult,
+    BatchRunner,
+    BatchStats,
+    read_questions,
+    run_batch,
+)
+
+__all__ = [
+    "BatchQuestion",
+    "BatchResult",
+    "BatchRunner",
+    "BatchStats",
+    "read_questions",
+    "run_batch",
+]
@@ -0,0 +1,223 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterable, Iterator, TypedDict
+
+from langchain_core.runnables.config import RunnableConfig
+from langgraph.graph.state import CompiledStateGraph
+
+from src.application.graph.builder import create_compiled_graph, prepare_playlist
+from src.application.graph.helpers import (
+    gen_retriever,
+    get_playlist_id_from_url,
+    init_vector_db,
+)
+from src.application.graph.state import State
+from src.application.services import GenerationMetrics
+from src.domain.exceptions import InvalidBatchInputError
+from src.domain.models import YoutubePlaylist
+from src.infrastructure.config import (
+    BATCH_MAX_CONCURRENCY,
+    ENABLE_RETRIEVAL_CACHE,
+    TELEMETRY_OTLP_PATH,
+)
+from src.infrastructure.telemetry import export_otlp_json, telemetry
+
+
+@dataclass
+class BatchQuestion:
+    index: int
+    question: str
+    question_id: str | None = None
+
+
+class BatchResult(TypedDict):
+    index: int
+    id: str | None
+    question: str
+    answer: str
+    chunk_ids: list[str]
+    latency_seconds: float
+    retrieval_timings: dict[str, float]
+    generation_metrics: GenerationMetrics | None
+    error: str | None
+
+
+class BatchStats(TypedDict):
+    questions: int
+    failed: int
+    total_seconds: float
+    questions_per_second: float
+    max_concurrency: int
+
+
+def read_questions(path: str | Path) -> Iterator[BatchQuestion]:
+    """
+    Read questions lazily from a JSONL file.
+
+    Each line is either a JSON string or an object with a `question` and an
+    optional `id` that is copied to the result. Blank lines are skipped.
+    """
+    index = 0
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise InvalidBatchInputError(str(path), line_number, "invalid JSON") from e
+            if isinstance(record, str):
+                record = {"question": record}
+            if not isinstance(record, dict):
+                raise InvalidBatchInputError(
+                    str(path), line_number, "expected a string or an object"
+                )
+
+            question = str(record.get("question") or "").strip()
+            if not question:
+                raise InvalidBatchInputError(str(path), line_number, "missing 'question'")
+
+            question_id = record.get("id")
+            yield BatchQuestion(
+                index=index,
+                question=question,
+                question_id=str(question_id) if question_id is not None else None,
+            )
+            index += 1
+
+
+async def discard_token(token: str) -> None:
+    return None
+
+
+class BatchRunner:
+    """Answers many questions against one playlist with bounded concurrency."""
+
+    def __init__(
+        self,
+        graph: CompiledStateGraph,
+        playlist_id: str,
+        playlist: YoutubePlaylist,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
+    ):
+        self.graph = graph
+        self.playlist_id = playlist_id
+        self.playlist = playlist.model_copy(update={"videos": []})
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def ask(self, item: BatchQuestion) -> BatchResult:
+        config: RunnableConfig = {"configurable": {"on_token": discard_token}}
+        state: State = {
+            "query": item.question,
+            "context": {"summary": "", "last_messages": ""},
+            "playlist_id": self.playlist_id,
+            "yt_playlist": self.playlist,
+        }
+
+        started_at = time.perf_counter()
+        error = None
+        try:
+            with telemetry.span("graph.turn", question_index=item.index):
+                result = await self.graph.ainvoke(state, config=config)
+        except Exception as e:
+            result = {}
+            error = str(e)
+
+        return {
+            "index": item.index,
+            "id": item.question_id,
+            "question": item.question,
+            "answer": result.get("ai_answer", ""),
+            "chunk_ids": [chunk.id for chunk in result.get("retrieved_chunks", [])],
+            "latency_seconds": time.perf_counter() - started_at,
+            "retrieval_timings": result.get("retrieval_timings", {}),
+            "generation_metrics": result.get("generation_metrics"),
+            "error": error,
+        }
+
+    async def run(self, questions: Iterable[BatchQuestion], output: IO[str]) -> BatchStats:
+        queue: asyncio.Queue[BatchQuestion | None] = asyncio.Queue(
+            maxsize=self.max_concurrency * 2
+        )
+        answered = failed = 0
+
+        async def worker():
+            nonlocal answered, failed
+            while (item := await queue.get()) is not None:
+                result = await self.ask(item)
+                # Writes happen on the event loop thread, so lines never interleave
+                output.write(json.dumps(result, ensure_ascii=False) + "\n")
+                output.flush()
+                answered += 1
+                failed += result["error"] is not None
+
+        async def produce():
+            for item in questions:
+                await queue.put(item)
+            for _ in range(self.max_concurrency):
+                await queue.put(None)
+
+        started_at = time.perf_counter()
+        tasks = [asyncio.create_task(produce())] + [
+            asyncio.create_task(worker()) for _ in range(self.max_concurrency)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        total = time.perf_counter() - started_at
+        return {
+            "questions": answered,
+            "failed": failed,
+            "total_seconds": total,
+            "questions_per_second": answered / total if total > 0 else 0.0,
+            "max_concurrency": self.max_concurrency,
+        }
+
+
+def resolve_playlist_id(playlist: str) -> str:
+    """Accept either a playlist URL or a bare playlist ID."""
+    if "list=" in playlist:
+        return get_playlist_id_from_url(playlist)
+    return playlist
+
+
+async def run_batch(
+    questions_path: str | Path,
+    output_path: str | Path,
+    playlist: str,
+    max_concurrency: int = BATCH_MAX_CONCURRENCY,
+) -> BatchStats:
+    vector_store = init_vector_db()
+    playlist_id = resolve_playlist_id(playlist)
+    yt_playlist = await prepare_playlist(vector_store=vector_store, playlist_id=playlist_id)
+
+    retriever = gen_retriever(vector_store=vector_store, playlist_id=playlist_id)
+    graph = create_compiled_graph(
+        None,
+        retriever,
+        embeddings=vector_store.embeddings,
+        interactive=False,
+        retrieval_cache=ENABLE_RETRIEVAL_CACHE,
+    )
+
+    runner = BatchRunner(
+        graph=graph,
+        playlist_id=playlist_id,
+        playlist=yt_playlist,
+        max_concurrency=max_concurrency,
+    )
+    with open(output_path, "w", encoding="utf-8") as output:
+        stats = await runner.run(read_questions(questions_path), output)
+
+    if TELEMETRY_OTLP_PATH:
+        export_otlp_json(telemetry, TELEMETRY_OTLP_PATH)
+
+    return stats
@@ -1,39 +1,35 @@
-from .state import State
-from .builder import create_compiled_graph, main
-from .helpers import (
-    get_playlist_id_from_url,
-    playlist_exist,
-    init_vector_db,
-    get_similarity_retriever,
-    get_ensemble_retriever,
-    get_query_model,
-    get_llm_chain,
-    format_chunks_for_prompt,
-    seconds_to_hms,
-)
-from .edges import should_load_or_save, should_save_to_db
-from .nodes import (
-    get_relevant_chunks,
-    get_query,
-    ask_answer_llm,
-)
+from importlib import import_module
 
-__all__ = [
-    "State",
-    "create_compiled_graph",
-    "main",
-    "get_playlist_id_from_url",
-    "playlist_exist",
-    "init_vector_db",
-    "get_similarity_retriever",
-    "get_ensemble_retriever",
-    "get_query_model",
-    "get_llm_chain",
-    "format_chunks_for_prompt",
-    "seconds_to_hms",
-    "should_load_or_save",
-    "should_save_to_db",
-    "get_relevant_chunks",
-    "get_query",
-    "ask_answer_llm",
-]
+# Exports are resolved on first access, so importing a light submodule such
+# as `playlist_url` does not pull in Chroma, LangChain and the model clients.
+_EXPORTS = {
+    "State": ".state",
+    "create_compiled_graph": ".builder",
+    "main": ".builder",
+    "get_playlist_id_from_url": ".playlist_url",
+    "playlist_exist": ".helpers",
+    "init_vector_db": ".helpers",
+    "get_similarity_retriever": ".helpers",
+    "get_ensemble_retriever": ".helpers",
+    "get_query_model": ".helpers",
+    "get_llm_chain": ".helpers",
+    "format_chunks_for_prompt": ".helpers",
+    "seconds_to_hms": ".helpers",
+    "should_load_or_save": ".edges",
+    "should_save_to_db": ".edges",
+    "get_relevant_chunks": ".nodes",
+    "get_query": ".nodes",
+    "ask_answer_llm": ".nodes",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = list(_EXPORTS)
@@ -9,32 +9,88 @@ from src.application.graph.helpers import (
     get_llm_chain,
     get_playlist_id,
     gen_retriever,
+    get_retrieval_cache,
     get_playlist_details,
     save_transcripts,
+    sync_playlist,
 )
-from src.infrastructure.config import CHAT_STATE_DIR, DEFAULT_CHAT_ID
-from src.application.services.memory_manager import MemoryManager
+from src.infrastructure.config import (
+    CHAT_STATE_DIR,
+    DEFAULT_CHAT_ID,
+    PLAYLIST_SYNC_MODE,
+    ENABLE_ANSWER_CACHE,
+    TELEMETRY_OTLP_PATH,
+)
+from src.infrastructure.telemetry import export_otlp_json, telemetry, traced
+from src.application.services.chat_store import ChatStore
+from src.application.services.memory_manager import MemoryManager, thread_lock
 from src.application.graph.nodes import (
     get_relevant_chunks,
     get_query,
     ask_answer_llm,
 )
+from langchain_chroma import Chroma
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.retrievers import BaseRetriever
-from src.application.services import YouTubePlaylistLoader
+from langchain_core.runnables import Runnable
+from src.domain.models import YoutubePlaylist
+from src.application.services import AnswerCache, YouTubePlaylistLoader
 
 # region GRAPH
 
 
-def create_compiled_graph(checkpointer: AsyncSqliteSaver, retriever: BaseRetriever):
-    llm_chain = get_llm_chain()
+def create_compiled_graph(
+    checkpointer: AsyncSqliteSaver | None,
+    retriever: BaseRetriever,
+    embeddings: Embeddings | None = None,
+    llm_chain: Runnable | None = None,
+    interactive: bool = True,
+    retrieval_cache: bool = False,
+):
+    """
+    Compile the question-answering graph.
+
+    With `interactive=False` the `get_human_question` node is left out and
+    the question must be passed in the input state as `query`, which is how
+    the server and batch runners drive the graph. Without a checkpointer
+    nothing is persisted between invocations.
+
+    The semantic retrieval cache lives in process memory and costs an
+    extra question embedding per turn, so it is only enabled by callers
+    whose process answers many questions (the server and batch mode).
+    """
+    llm_chain = llm_chain or get_llm_chain()
     graph = StateGraph(State)
 
-    graph.add_node("get_human_question", get_query)
-    graph.add_node("get_relevant_lines", get_relevant_chunks(retriever=retriever))
-    graph.add_node("gen_ai_answer", ask_answer_llm(chain_llm=llm_chain))
+    graph.add_node(
+        "get_relevant_lines",
+        traced(
+            "node.get_relevant_lines",
+            get_relevant_chunks(
+                retriever=retriever,
+                retrieval_cache=get_retrieval_cache() if retrieval_cache else None,
+                embeddings=embeddings,
+            ),
+        ),
+    )
+    graph.add_node(
+        "gen_ai_answer",
+        traced(
+            "node.gen_ai_answer",
+            ask_answer_llm(
+                chain_llm=llm_chain,
+                answer_cache=AnswerCache() if ENABLE_ANSWER_CACHE else None,
+            ),
+        ),
+    )
 
-    graph.add_edge(START, "get_human_question")
-    graph.add_edge("get_human_question", "get_relevant_lines")
+    if interactive:
+        graph.add_node("get_human_question", traced("node.get_human_question", get_query))
+        graph.add_edge(START, "get_human_question")
+        graph.add_edge("get_human_question", "get_relevant_lines")
+    else:
+        graph.add_edge(START, "get_relevant_lines")
     graph.add_edge("get_relevant_lines", "gen_ai_answer")
     graph.add_edge("gen_ai_answer", END)
 
@@ -46,38 +102,79 @@ def create_compiled_graph(checkpointer: AsyncSqliteSaver, retriever: BaseRetriev
 # region RUNNER
 
 
-async def main():
-    vector_store = init_vector_db()
-    playlist_id = get_playlist_id()
-    retriever = gen_retriever(vector_store=vector_store, playlist_id=playlist_id)
+async def prepare_playlist(
+    vector_store: Chroma, playlist_id: str, yt_client=None
+) -> YoutubePlaylist:
+    """Make sure the playlist is ingested according to PLAYLIST_SYNC_MODE."""
+    yt_service = YouTubePlaylistLoader(playlist_id=playlist_id, yt_service=yt_client)
 
-    is_playlist_already_saved = playlist_exist(
-        vector_store=vector_store, playlist_id=playlist_id
-    )
+    if PLAYLIST_SYNC_MODE == "incremental":
+        yt_playlist = await sync_playlist(
+            vector_store=vector_store, yt_service=yt_service, playlist_id=playlist_id
+        )
+    else:
+        is_playlist_already_saved = playlist_exist(
+            vector_store=vector_store, playlist_id=playlist_id
+        )
 
-    yt_service = YouTubePlaylistLoader(playlist_id=playlist_id)
+        yt_playlist = await get_playlist_details(
+            yt_service=yt_service,
+            playlist_id=playlist_id,
+            is_loaded=is_playlist_already_saved,
+        )
 
-    yt_playlist = await get_playlist_details(
-        yt_service=yt_service,
-        playlist_id=playlist_id,
-        is_loaded=is_playlist_already_saved,
+        if not is_playlist_already_saved:
+            save_transcripts(
+                vector_store=vector_store, playlist=yt_playlist, playlist_id=playlist_id
+            )
+
+    return yt_playlist
+
+
+async def main(
+    vector_store: Chroma | None = None,
+    playlist_id: str | None = None,
+    query_llm: BaseChatModel | None = None,
+    llm_chain: Runnable | None = None,
+    yt_client=None,
+):
+    """
+    Run one interactive turn. Anything not passed in is created here; the
+    startup path passes clients it already warmed up in the background.
+    """
+    vector_store = vector_store or init_vector_db()
+    playlist_id = playlist_id or get_playlist_id()
+    yt_playlist = await prepare_playlist(
+        vector_store=vector_store, playlist_id=playlist_id, yt_client=yt_client
     )
 
-    if not is_playlist_already_saved:
-        save_transcripts(
-            vector_store=vector_store, playlist=yt_playlist, playlist_id=playlist_id
-        )
+    retriever = gen_retriever(vector_store=vector_store, playlist_id=playlist_id, llm=query_llm)
 
     async with AsyncSqliteSaver.from_conn_string(CHAT_STATE_DIR) as checkpointer:
-        memory = MemoryManager(chat_id=DEFAULT_CHAT_ID, checkpointer=checkpointer)
-        context = await memory.get_context()
-        config: RunnableConfig = {"configurable": {"thread_id": memory.get_chat_id()}}
-
-        initial_state: State = {"context": context}
-        compiled_graph = create_compiled_graph(checkpointer, retriever)
+        store = ChatStore()
+        compiled_graph = create_compiled_graph(
+            checkpointer, retriever, embeddings=vector_store.embeddings, llm_chain=llm_chain
+        )
 
-        await compiled_graph.ainvoke(initial_state, config=config)
-        await memory.update_chat()
+        async with thread_lock(DEFAULT_CHAT_ID):
+            memory = await MemoryManager.open(checkpointer, store, chat_id=DEFAULT_CHAT_ID)
+            context = await memory.get_context()
+            config: RunnableConfig = {"configurable": {"thread_id": memory.get_chat_id()}}
+
+            initial_state: State = {
+                "context": context,
+                "playlist_id": playlist_id,
+                "yt_playlist": yt_playlist.model_copy(update={"videos": []}),
+            }
+
+            with telemetry.span("graph.turn", chat_id=memory.get_chat_id()):
+                result = await compiled_graph.ainvoke(initial_state, config=config)
+                await memory.update_chat(result.get("messages"))
+        await memory.wait_for_summary()
+        await store.close()
+
+    if TELEMETRY_OTLP_PATH:
+        export_otlp_json(telemetry, TELEMETRY_OTLP_PATH)
 
 
 if __name__ == "__main__":
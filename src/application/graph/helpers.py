@@ -1,5 +1,13 @@
-from urllib.parse import urlparse, parse_qs
-from src.domain.models.youtube import YoutubePlaylist
+import re
+import threading
+from collections import Counter
+from datetime import timedelta
+from functools import cache
+from pathlib import Path
+from typing import Sequence
+from weakref import WeakValueDictionary
+from src.domain.models.youtube import YoutubePlaylist, YoutubeVideo
+from src.application.graph.playlist_url import get_playlist_id_from_url, get_playlist_id  # noqa: F401
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -8,11 +16,20 @@ from langchain_core.retrievers import BaseRetriever
 from langchain_core.runnables import Runnable
 from langchain_chroma import Chroma
 from langchain_classic.chat_models import init_chat_model
-from langchain_classic.retrievers import EnsembleRetriever, MultiQueryRetriever
-from langchain_community.retrievers import BM25Retriever
-from src.application.services import YouTubePlaylistLoader
+from langchain_classic.retrievers.multi_query import (
+    DEFAULT_QUERY_PROMPT,
+    LineListOutputParser,
+)
+from src.application.services import (
+    YouTubePlaylistLoader,
+    PlaylistRegistry,
+    QueryExpander,
+    QueryVariantCache,
+    SemanticRetrievalCache,
+    TranscriptWriter,
+    WriteStats,
+)
 from src.domain.exceptions import (
-    InvalidPlaylistUrlError,
     InvalidEmbeddingModelError,
     PlaylistDocumentsNotFoundError,
     EmptyPlaylistDocumentsError,
@@ -20,48 +37,157 @@ from src.domain.exceptions import (
     LLMInitializationError,
 )
 from src.infrastructure.extensions.embeddings import init_embeddings
+from src.infrastructure.extensions.retrievers import (
+    BM25Index,
+    HybridMultiQueryRetriever,
+    PersistedBM25Retriever,
+)
 from src.infrastructure.config import (
     PERSIST_DIR,
+    BM25_INDEX_DIR,
     EMBEDDING_MODEL,
     EMBEDDING_PROVIDER,
+    ENABLE_EMBEDDING_CACHE,
+    EMBEDDING_CACHE_PATH,
     LLM_PROVIDER,
     QUERY_MODEL,
     GENERATION_MODEL,
     SEARCH_K,
     SEARCH_TYPE,
+    PLAYLIST_SYNC_MAX_AGE_SECONDS,
+    ENABLE_QUERY_VARIANT_CACHE,
 )
 from src.domain.exceptions import (
     PlaylistLoadError,
     TranscriptLoadError,
     VectorStoreWriteError,
+    VideoTranscriptError,
 )
 from src.domain.prompts import SYSTEM_PROMPT, HUMAN_PROMPT
 
+playlist_registry = PlaylistRegistry()
 
-def get_playlist_id_from_url(url: str) -> str:
-    parsed_url = urlparse(url)
-    query_params = parse_qs(parsed_url.query)
+# Indexes in use, shared so every retriever and ingestion of a playlist
+# goes through one writer lock. Held weakly: an index is dropped with the
+# last retriever using it, e.g. when the server evicts the playlist.
+_bm25_indexes: WeakValueDictionary[str, BM25Index] = WeakValueDictionary()
+_bm25_indexes_lock = threading.Lock()
 
-    if "list" in query_params:
-        playlist_id = query_params["list"][0]
-        return playlist_id
 
-    raise InvalidPlaylistUrlError(url)
+def backfill_registry(vector_store: Chroma, playlist_id: str) -> set[str]:
+    """Register a playlist indexed before the registry existed from its chunk metadata."""
+    results = vector_store.get(where={"playlist_id": playlist_id}, include=["metadatas"])
+    metadatas = [metadata for metadata in results.get("metadatas") or [] if metadata]
+    chunks_per_video = Counter(
+        metadata["video_id"] for metadata in metadatas if metadata.get("video_id")
+    )
 
+    if chunks_per_video:
+        playlist_registry.record_videos(
+            playlist_id=playlist_id,
+            chunks_per_video=dict(chunks_per_video),
+            title=metadatas[0].get("playlist_title"),
+            # Chunked before the registry recorded the settings
+            chunker=None,
+        )
 
-def playlist_exist(vector_store: Chroma, playlist_id: str) -> bool:
+    return set(chunks_per_video)
+
+
+def playlist_exist(vector_store: Chroma | None, playlist_id: str) -> bool:
     try:
-        results = vector_store.get(where={"playlist_id": playlist_id})
-        ids = results.get("ids", [])
-        return ids is not None and len(ids) > 0
+        if playlist_registry.exists(playlist_id):
+            return True
+        return vector_store is not None and bool(
+            backfill_registry(vector_store, playlist_id)
+        )
     except Exception as e:
         print(f"Error checking playlist existence: {e}")
         return False
 
 
-def init_vector_db() -> Chroma:
-    embedding_model = init_embeddings(
-        provider=EMBEDDING_PROVIDER, model=EMBEDDING_MODEL
+def get_stored_video_ids(vector_store: Chroma, playlist_id: str) -> set[str]:
+    video_ids = playlist_registry.get_video_ids(playlist_id)
+    if video_ids:
+        return video_ids
+    return backfill_registry(vector_store, playlist_id)
+
+
+def delete_videos(vector_store: Chroma, playlist_id: str, video_ids: set[str]) -> list[str]:
+    if not video_ids:
+        return []
+
+    results = vector_store.get(
+        where={
+            "$and": [
+                {"playlist_id": playlist_id},
+                {"video_id": {"$in": sorted(video_ids)}},
+            ]
+        },
+        include=[],
+    )
+    ids = results.get("ids") or []
+    if ids:
+        vector_store.delete(ids=ids)
+
+    return ids
+
+
+def get_bm25_index(playlist_id: str) -> BM25Index:
+    with _bm25_indexes_lock:
+        bm25_index = _bm25_indexes.get(playlist_id)
+        if bm25_index is None:
+            safe_playlist_id = re.sub(r"[^A-Za-z0-9_-]", "_", playlist_id)
+            bm25_index = BM25Index(Path(BM25_INDEX_DIR) / safe_playlist_id)
+            _bm25_indexes[playlist_id] = bm25_index
+        return bm25_index
+
+
+@cache
+def get_retrieval_cache() -> SemanticRetrievalCache:
+    return SemanticRetrievalCache()
+
+
+def build_bm25_index(vector_store: Chroma, playlist_id: str) -> BM25Index:
+    """Build the playlist's keyword index from the chunks stored in the vector store."""
+    results = vector_store.get(
+        where={"playlist_id": playlist_id}, include=["documents", "metadatas"]
+    )
+    docs = [
+        Document(id=doc_id, page_content=text, metadata=metadata or {})
+        for doc_id, text, metadata in zip(
+            results.get("ids") or [],
+            results.get("documents") or [],
+            results.get("metadatas") or [],
+        )
+        if text and text.strip()
+    ]
+
+    bm25_index = get_bm25_index(playlist_id)
+    bm25_index.update(documents=docs)
+    return bm25_index
+
+
+def update_bm25_index(
+    vector_store: Chroma,
+    playlist_id: str,
+    documents: Sequence[Document] = (),
+    remove_ids: Sequence[str] = (),
+) -> BM25Index:
+    bm25_index = get_bm25_index(playlist_id)
+    if not bm25_index.exists():
+        # Playlists indexed before the keyword index existed are rebuilt in full
+        return build_bm25_index(vector_store, playlist_id)
+
+    bm25_index.update(documents=documents, remove_ids=remove_ids)
+    return bm25_index
+
+
+def init_vector_db(embedding_model: Embeddings | None = None) -> Chroma:
+    embedding_model = embedding_model or init_embeddings(
+        provider=EMBEDDING_PROVIDER,
+        model=EMBEDDING_MODEL,
+        cache_path=EMBEDDING_CACHE_PATH if ENABLE_EMBEDDING_CACHE else None,
     )
 
     if not isinstance(embedding_model, Embeddings):
@@ -87,24 +213,35 @@ def get_ensemble_retriever(
     llm: BaseChatModel, vector_store: Chroma, retriever: BaseRetriever, playlist_id: str
 ) -> BaseRetriever:
 
-    docs = vector_store.get(where={"playlist_id": playlist_id})["documents"]
-
-    if not docs or len(docs) == 0:
+    if not playlist_exist(vector_store=vector_store, playlist_id=playlist_id):
         raise PlaylistDocumentsNotFoundError(playlist_id)
 
-    docs = [doc for doc in docs if doc and doc.strip()]
+    bm25_index = get_bm25_index(playlist_id)
+    if not bm25_index.exists():
+        bm25_index = build_bm25_index(vector_store, playlist_id)
 
-    if len(docs) == 0:
+    bm25_version = bm25_index.load()
+    if bm25_version is None or bm25_version.n_docs == 0:
         raise EmptyPlaylistDocumentsError(playlist_id)
 
-    bm25_retriever = BM25Retriever.from_texts(docs)
-    bm25_retriever.k = SEARCH_K
+    bm25_retriever = PersistedBM25Retriever(index=bm25_index, k=SEARCH_K)
 
-    ensemble_retriever = EnsembleRetriever(
-        retrievers=[bm25_retriever, retriever], weights=[0.4, 0.6]
+    return HybridMultiQueryRetriever(
+        keyword_retriever=bm25_retriever,
+        vector_retriever=retriever,
+        query_generator=get_query_generator(llm=llm, playlist_id=playlist_id),
+        weights=[0.4, 0.6],
     )
 
-    return MultiQueryRetriever.from_llm(retriever=ensemble_retriever, llm=llm)
+
+def get_query_generator(llm: BaseChatModel, playlist_id: str) -> Runnable:
+    query_chain = DEFAULT_QUERY_PROMPT | llm | LineListOutputParser()
+    expander = QueryExpander(
+        query_chain=query_chain,
+        playlist_id=playlist_id,
+        cache=QueryVariantCache() if ENABLE_QUERY_VARIANT_CACHE else None,
+    )
+    return expander.as_runnable()
 
 
 def get_query_model() -> BaseChatModel:
@@ -114,11 +251,12 @@ def get_query_model() -> BaseChatModel:
         raise LLMInitializationError(LLM_PROVIDER, QUERY_MODEL, e) from e
 
 
-def get_llm_chain() -> Runnable:
-    try:
-        llm = init_chat_model(model_provider=LLM_PROVIDER, model=GENERATION_MODEL)
-    except Exception as e:
-        raise LLMInitializationError(LLM_PROVIDER, GENERATION_MODEL, e) from e
+def get_llm_chain(llm: BaseChatModel | None = None) -> Runnable:
+    if llm is None:
+        try:
+            llm = init_chat_model(model_provider=LLM_PROVIDER, model=GENERATION_MODEL)
+        except Exception as e:
+            raise LLMInitializationError(LLM_PROVIDER, GENERATION_MODEL, e) from e
 
     template = ChatPromptTemplate.from_messages([SYSTEM_PROMPT, HUMAN_PROMPT])
     return template | llm
@@ -141,18 +279,8 @@ def seconds_to_hms(seconds: float | int | None) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
-def get_playlist_id():
-    yt_playlist_url = input(
-        f"{'='*50}\n\nChoose a playlist for the model to learn from:\n\n{'='*50}\n\n- "
-    )
-    yt_playlist_id = get_playlist_id_from_url(yt_playlist_url)
-    print("\n\n")
-
-    return yt_playlist_id
-
-
-def gen_retriever(vector_store: Chroma, playlist_id: str):
-    llm = get_query_model()
+def gen_retriever(vector_store: Chroma, playlist_id: str, llm: BaseChatModel | None = None):
+    llm = llm or get_query_model()
 
     base_retriever = get_similarity_retriever(
         vector_store=vector_store, playlist_id=playlist_id
@@ -172,23 +300,135 @@ async def get_playlist_details(
 ):
     try:
         yt_service.load_playlist_details()
-        yt_service.load_video_details()
+        if is_loaded:
+            yt_service.load_video_details()
+        else:
+            await yt_service.load_videos_with_transcripts()
+    except VideoTranscriptError as e:
+        raise TranscriptLoadError(playlist_id, e) from e
     except Exception as e:
         raise PlaylistLoadError(playlist_id, e) from e
 
-    if not is_loaded:
+    return yt_service.build()
+
+
+def save_transcripts(
+    vector_store: Chroma, playlist: YoutubePlaylist, playlist_id: str
+) -> WriteStats | None:
+    if playlist:
+        return write_videos(
+            vector_store=vector_store,
+            videos=playlist.videos,
+            playlist_id=playlist_id,
+            playlist_title=playlist.title,
+        )
+
+
+def write_videos(
+    vector_store: Chroma,
+    videos: list[YoutubeVideo],
+    playlist_id: str,
+    playlist_title: str | None = None,
+) -> WriteStats:
+    try:
+        writer = TranscriptWriter(vector_store=vector_store, playlist_id=playlist_id)
+        stats = writer.write(videos)
+        update_bm25_index(
+            vector_store=vector_store,
+            playlist_id=playlist_id,
+            documents=[chunk for video in videos for chunk in video.transcript],
+        )
+    except Exception as e:
+        raise VectorStoreWriteError(playlist_id, e) from e
+
+    playlist_registry.record_videos(
+        playlist_id=playlist_id,
+        chunks_per_video={video.video_id: len(video.transcript) for video in videos},
+        title=playlist_title,
+    )
+    get_retrieval_cache().invalidate(playlist_id)
+
+    return stats
+
+
+async def sync_playlist(
+    vector_store: Chroma, yt_service: YouTubePlaylistLoader, playlist_id: str
+) -> YoutubePlaylist:
+    """
+    Bring the stored chunks of a playlist in line with its current videos.
+
+    Only videos missing from the vector store, or chunked with settings
+    other than the current TRANSCRIPT_CHUNKER, are fetched and embedded;
+    chunks of videos no longer in the playlist, and the old chunks of
+    re-chunked videos, are deleted. A playlist with nothing stored yet goes
+    through the streaming full ingestion.
+    """
+    max_age = timedelta(seconds=PLAYLIST_SYNC_MAX_AGE_SECONDS)
+    if PLAYLIST_SYNC_MAX_AGE_SECONDS and playlist_registry.is_fresh(playlist_id, max_age):
         try:
-            await yt_service.load_transcript_videos()
+            return yt_service.load_playlist_details().build()
         except Exception as e:
-            raise TranscriptLoadError(playlist_id, e) from e
+            raise PlaylistLoadError(playlist_id, e) from e
 
-    return yt_service.build()
+    stored_video_ids = get_stored_video_ids(vector_store, playlist_id)
 
+    if not stored_video_ids:
+        yt_playlist = await get_playlist_details(
+            yt_service=yt_service, playlist_id=playlist_id, is_loaded=False
+        )
+        save_transcripts(vector_store=vector_store, playlist=yt_playlist, playlist_id=playlist_id)
+        return yt_playlist
 
-def save_transcripts(vector_store: Chroma, playlist: YoutubePlaylist, playlist_id: str):
-    if playlist:
+    yt_playlist = await get_playlist_details(
+        yt_service=yt_service, playlist_id=playlist_id, is_loaded=True
+    )
+
+    current_video_ids = {video.video_id for video in yt_playlist.videos}
+    outdated_video_ids = playlist_registry.get_outdated_video_ids(playlist_id) & current_video_ids
+    added_videos = [
+        video
+        for video in yt_playlist.videos
+        if video.video_id not in stored_video_ids or video.video_id in outdated_video_ids
+    ]
+    removed_video_ids = stored_video_ids - current_video_ids
+
+    if added_videos:
         try:
-            for video in playlist.videos:
-                vector_store.add_documents(video.transcript)
+            await yt_service.load_transcript_videos(videos=added_videos)
         except Exception as e:
-            raise VectorStoreWriteError(playlist_id, e) from e
+            raise TranscriptLoadError(playlist_id, e) from e
+
+    try:
+        # Old chunks go before the new ones are written under the same videos
+        deleted_ids = delete_videos(
+            vector_store, playlist_id, removed_video_ids | outdated_video_ids
+        )
+        if deleted_ids:
+            update_bm25_index(
+                vector_store=vector_store, playlist_id=playlist_id, remove_ids=deleted_ids
+            )
+            get_retrieval_cache().invalidate(playlist_id)
+    except Exception as e:
+        raise VectorStoreWriteError(playlist_id, e) from e
+
+    if added_videos:
+        write_videos(
+            vector_store=vector_store,
+            videos=added_videos,
+            playlist_id=playlist_id,
+            playlist_title=yt_playlist.title,
+        )
+
+    if removed_video_ids:
+        playlist_registry.remove_videos(playlist_id, removed_video_ids)
+    elif not added_videos:
+        playlist_registry.touch(playlist_id, title=yt_playlist.title)
+
+    print(
+        f"Playlist synced: {len(added_videos) - len(outdated_video_ids)} new, "
+        f"{len(outdated_video_ids)} re-chunked, {len(removed_video_ids)} removed "
+        f"({len(deleted_ids)} chunks deleted), "
+        f"{len(current_video_ids) - len(added_videos)} unchanged"
+    )
+
+    return yt_playlist
@@ -1,7 +1,18 @@
+import asyncio
 from src.application.graph.state import State
 from src.application.graph.helpers import format_chunks_for_prompt
+from src.application.services import (
+    AnswerCache,
+    GenerationTimer,
+    TokenCallback,
+    areplay_answer,
+    print_token,
+)
 from src.domain.exceptions import LLMStreamError
+from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.runnables import Runnable
+from langchain_core.runnables.config import RunnableConfig
+from src.infrastructure.telemetry import telemetry
 
 
 def get_query(state: State):
@@ -14,23 +25,50 @@ def get_query(state: State):
     return {"query": human_question}
 
 
-def ask_answer_llm_cls(chain_llm: Runnable):
-    def ask_answer_llm(state: State):
+def ask_answer_llm_cls(chain_llm: Runnable, answer_cache: AnswerCache | None = None):
+    async def ask_answer_llm(state: State, config: RunnableConfig):
         relevant_lines = state.get("retrieved_chunks")
         playlist = state.get("yt_playlist")
         context = state.get("context")
         summary = context.get("summary") if context else ""
         messages = context.get("last_messages") if context else ""
-        full_answer = ""
+        question = state.get("query", "")
+        playlist_id = state.get("playlist_id", "")
+        on_token: TokenCallback | None = config.get("configurable", {}).get("on_token")
+        to_stdout = on_token is None
+        on_token = on_token or print_token
+        answer_parts: list[str] = []
 
-        print("\n\n\n", end="", flush=True)
-        if relevant_lines:
-            try:
-                for chunk in chain_llm.stream(
+        if to_stdout:
+            await on_token("\n\n\n")
+        if not relevant_lines:
+            return {"ai_answer": ""}
+
+        cache_key = cached_answer = None
+        if answer_cache is not None:
+            with telemetry.span("generation.cache_lookup"):
+                cache_key = answer_cache.make_key(
+                    playlist_id, question, relevant_lines, f"{summary}\0{messages}"
+                )
+                cached_answer = await asyncio.to_thread(answer_cache.get, cache_key)
+            telemetry.increment(
+                "cache_lookups",
+                cache="answer",
+                result="miss" if cached_answer is None else "hit",
+            )
+
+        timer = GenerationTimer(cached=cached_answer is not None)
+        try:
+            if cached_answer is not None:
+                stream = areplay_answer(cached_answer)
+            else:
+                with telemetry.span("generation.format_prompt"):
+                    chunks_data = format_chunks_for_prompt(relevant_lines)
+                stream = chain_llm.astream(
                     {
                         "pruned_history_summary": summary,
                         "last_messages": messages,
-                        "question": state.get("query"),
+                        "question": question,
                         "playlist_title": playlist.title if playlist else "",
                         "playlist_author": playlist.author if playlist else "",
                         "playlist_description": (
@@ -39,15 +77,51 @@ def ask_answer_llm_cls(chain_llm: Runnable):
                         "playlist_thumbnail_url": (
                             playlist.thumbnail_url if playlist else ""
                         ),
-                        "chunks_data": format_chunks_for_prompt(relevant_lines),
+                        "chunks_data": chunks_data,
                     }
-                ):
-                    print(chunk.content, end="", flush=True)
-                    full_answer += chunk.content
-                print()
+                )
+
+            input_tokens = output_tokens = 0
+            with telemetry.span("generation.stream", cached=cached_answer is not None):
+                async for chunk in stream:
+                    usage = getattr(chunk, "usage_metadata", None)
+                    if usage:
+                        input_tokens += usage.get("input_tokens", 0)
+                        output_tokens += usage.get("output_tokens", 0)
+                    if not chunk.content:
+                        continue
+                    timer.record(chunk.content)
+                    answer_parts.append(chunk.content)
+                    await on_token(chunk.content)
+            if to_stdout:
+                await on_token("\n")
+
+            if output_tokens:
+                timer.set_token_count(output_tokens)
+            timer.set_input_token_count(input_tokens)
+        except Exception as e:
+            raise LLMStreamError(e) from e
+
+        metrics = timer.metrics()
+        if metrics["time_to_first_token"] is not None:
+            telemetry.observe("time_to_first_token_seconds", metrics["time_to_first_token"])
+        telemetry.increment("llm_input_tokens", input_tokens, model="generation")
+        telemetry.increment("llm_output_tokens", output_tokens, model="generation")
+
+        full_answer = "".join(answer_parts)
+        if answer_cache is not None and cached_answer is None:
+            try:
+                await asyncio.to_thread(
+                    answer_cache.put, cache_key, playlist_id, question, full_answer
+                )
             except Exception as e:
-                raise LLMStreamError(e) from e
+                # The answer is already streamed; a failed cache write must not lose it
+                print(f"Error caching answer: {e}")
 
-        return {"ai_answer": full_answer}
+        return {
+            "ai_answer": full_answer,
+            "generation_metrics": metrics,
+            "messages": [HumanMessage(content=question), AIMessage(content=full_answer)],
+        }
 
     return ask_answer_llm
@@ -1,20 +1,76 @@
+import time
 from src.application.graph.state import State
+from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever
+from src.application.services import SemanticRetrievalCache
 from src.domain.exceptions import RetrieverError
+from src.infrastructure.extensions.retrievers import HybridMultiQueryRetriever
+from src.infrastructure.telemetry import telemetry
 
 
-def get_relevant_chunks_cls(retriever: BaseRetriever):
-    def get_relevant_chunks(state: State):
+def get_relevant_chunks_cls(
+    retriever: BaseRetriever,
+    retrieval_cache: SemanticRetrievalCache | None = None,
+    embeddings: Embeddings | None = None,
+):
+    use_cache = retrieval_cache is not None and embeddings is not None
+
+    async def search(question: str):
+        if isinstance(retriever, HybridMultiQueryRetriever):
+            relevant_chunks, timings = await retriever.asearch(question)
+        else:
+            started_at = time.perf_counter()
+            relevant_chunks = await retriever.ainvoke(question)
+            timings = {"total": time.perf_counter() - started_at}
+
+        telemetry.increment("retrieved_chunks", len(relevant_chunks))
+        return relevant_chunks, timings
+
+    async def get_relevant_chunks(state: State):
         question = state.get("query", "")
+        playlist_id = state.get("playlist_id", "")
 
         if not retriever:
             return {"retrieved_chunks": []}
 
         try:
-            relevant_chunks = retriever.invoke(question)
+            if not use_cache:
+                relevant_chunks, timings = await search(question)
+                return {"retrieved_chunks": relevant_chunks, "retrieval_timings": timings}
+
+            lookup_started_at = time.perf_counter()
+            with telemetry.span("retrieval.cache_lookup"):
+                query_embedding = await embeddings.aembed_query(question)
+                lookup_seconds = time.perf_counter() - lookup_started_at
+                hit = retrieval_cache.get(playlist_id, query_embedding, lookup_seconds)
+
+            telemetry.increment(
+                "cache_lookups", cache="retrieval", result="miss" if hit is None else "hit"
+            )
+            if hit is not None:
+                telemetry.increment("retrieved_chunks", len(hit.entry.documents))
+                timings = {
+                    "cache_lookup": lookup_seconds,
+                    "cache_similarity": hit.similarity,
+                    "total": time.perf_counter() - lookup_started_at,
+                }
+                return {
+                    "retrieved_chunks": list(hit.entry.documents),
+                    "retrieval_timings": timings,
+                }
+
+            relevant_chunks, timings = await search(question)
+            retrieval_cache.put(
+                playlist_id,
+                question,
+                query_embedding,
+                relevant_chunks,
+                retrieval_seconds=timings["total"],
+            )
+            timings = {**timings, "cache_lookup": lookup_seconds}
         except Exception as e:
             raise RetrieverError(question, e) from e
 
-        return {"retrieved_chunks": relevant_chunks}
+        return {"retrieved_chunks": relevant_chunks, "retrieval_timings": timings}
 
     return get_relevant_chunks
@@ -0,0 +1,23 @@
+from urllib.parse import urlparse, parse_qs
+from src.domain.exceptions import InvalidPlaylistUrlError
+
+
+def get_playlist_id_from_url(url: str) -> str:
+    parsed_url = urlparse(url)
+    query_params = parse_qs(parsed_url.query)
+
+    if "list" in query_params:
+        playlist_id = query_params["list"][0]
+        return playlist_id
+
+    raise InvalidPlaylistUrlError(url)
+
+
+def get_playlist_id():
+    yt_playlist_url = input(
+        f"{'='*50}\n\nChoose a playlist for the model to learn from:\n\n{'='*50}\n\n- "
+    )
+    yt_playlist_id = get_playlist_id_from_url(yt_playlist_url)
+    print("\n\n")
+
+    return yt_playlist_id
@@ -1,6 +1,9 @@
-from typing import TypedDict, NotRequired
+from typing import Annotated, TypedDict, NotRequired
 from langchain_core.documents import Document
+from langchain_core.messages import AnyMessage
+from langgraph.graph.message import add_messages
 from src.domain.models import YoutubePlaylist
+from src.application.services.token_stream import GenerationMetrics
 
 
 class ContextDict(TypedDict):
@@ -13,5 +16,8 @@ class State(TypedDict):
     playlist_id: NotRequired[str]
     yt_playlist: NotRequired[YoutubePlaylist]
     retrieved_chunks: NotRequired[list[Document]]
+    retrieval_timings: NotRequired[dict[str, float]]
     ai_answer: NotRequired[str]
+    generation_metrics: NotRequired[GenerationMetrics]
     context: NotRequired[ContextDict]
+    messages: Annotated[list[AnyMessage], add_messages]
@@ -0,0 +1,12 @@
+from .admission import AdmissionController, AdmissionStats
+from .runtime import PlaylistRuntime, PlaylistRuntimes
+from .app import create_app, run_server
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionStats",
+    "PlaylistRuntime",
+    "PlaylistRuntimes",
+    "create_app",
+    "run_server",
+]
@@ -0,0 +1,71 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, TypedDict
+
+from src.domain.exceptions import ServerBusyError
+from src.infrastructure.config import (
+    SERVER_MAX_CONCURRENT_REQUESTS,
+    SERVER_MAX_QUEUED_REQUESTS,
+    SERVER_QUEUE_TIMEOUT_SECONDS,
+)
+
+
+class AdmissionStats(TypedDict):
+    active: int
+    queued: int
+    admitted: int
+    rejected: int
+    max_concurrent: int
+    max_queued: int
+
+
+class AdmissionController:
+    """Caps concurrent questions and rejects the overflow with `ServerBusyError`."""
+
+    def __init__(
+        self,
+        max_concurrent: int = SERVER_MAX_CONCURRENT_REQUESTS,
+        max_queued: int = SERVER_MAX_QUEUED_REQUESTS,
+        timeout: float = SERVER_QUEUE_TIMEOUT_SECONDS,
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self.active = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._semaphore.locked() and self.queued >= self.max_queued:
+            self.rejected += 1
+            raise ServerBusyError(self.active, self.queued)
+
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.timeout)
+        except asyncio.TimeoutError as e:
+            self.rejected += 1
+            raise ServerBusyError(self.active, self.queued - 1) from e
+        finally:
+            self.queued -= 1
+
+        self.active += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+    def stats(self) -> AdmissionStats:
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+        }
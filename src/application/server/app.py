@@ -0,0 +1,288 @@
+import asyncio
+import json
+from uuid import UUID, uuid4
+
+from aiohttp import web
+from langchain_chroma import Chroma
+from langchain_core.runnables.config import RunnableConfig
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from src.application.graph.helpers import (
+    get_playlist_id_from_url,
+    get_retrieval_cache,
+    init_vector_db,
+    sync_playlist,
+)
+from src.application.graph.state import State
+from src.application.server.admission import AdmissionController
+from src.application.server.runtime import PlaylistRuntimes
+from src.application.services import ChatStore, TokenStream, YouTubePlaylistLoader
+from src.application.services.checkpoint_compaction import (
+    CheckpointCompactor,
+    run_compaction_schedule,
+)
+from src.application.services.memory_manager import (
+    MemoryManager,
+    thread_lock,
+    wait_for_pending_summaries,
+)
+from src.domain.exceptions import (
+    EmptyPlaylistDocumentsError,
+    InvalidPlaylistUrlError,
+    PlaylistDocumentsNotFoundError,
+    ServerBusyError,
+)
+from src.infrastructure.config import (
+    CHAT_STATE_DIR,
+    CHECKPOINT_COMPACTION_INTERVAL_SECONDS,
+    SERVER_HOST,
+    SERVER_MAX_CONCURRENT_INGESTS,
+    SERVER_PORT,
+    TELEMETRY_OTLP_PATH,
+)
+from src.infrastructure.telemetry import export_otlp_json, render_prometheus, telemetry
+
+VECTOR_STORE = web.AppKey("vector_store", Chroma)
+CHECKPOINTER = web.AppKey("checkpointer", AsyncSqliteSaver)
+RUNTIMES = web.AppKey("runtimes", PlaylistRuntimes)
+ADMISSION = web.AppKey("admission", AdmissionController)
+INGEST_SLOTS = web.AppKey("ingest_slots", asyncio.Semaphore)
+CHAT_STORE = web.AppKey("chat_store", ChatStore)
+
+# region HELPERS
+
+
+async def read_json(request: web.Request) -> dict:
+    try:
+        body = await request.json()
+    except json.JSONDecodeError as e:
+        raise web.HTTPBadRequest(text="Request body must be JSON") from e
+    if not isinstance(body, dict):
+        raise web.HTTPBadRequest(text="Request body must be a JSON object")
+    return body
+
+
+def parse_chat_id(chat_id: str) -> str:
+    try:
+        return str(UUID(chat_id))
+    except ValueError as e:
+        raise web.HTTPBadRequest(text=f"Invalid chat_id: {chat_id}") from e
+
+
+def busy_response(error: ServerBusyError) -> web.Response:
+    return web.json_response({"error": str(error)}, status=503, headers={"Retry-After": "1"})
+
+
+async def send_event(response: web.StreamResponse, event: str, data) -> None:
+    await response.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+
+
+def run_ingestion(vector_store, playlist_id: str):
+    yt_service = YouTubePlaylistLoader(playlist_id=playlist_id)
+    return asyncio.run(
+        sync_playlist(vector_store=vector_store, yt_service=yt_service, playlist_id=playlist_id)
+    )
+
+
+# region HANDLERS
+
+
+async def ingest_playlist(request: web.Request) -> web.Response:
+    body = await read_json(request)
+    playlist_id = body.get("playlist_id")
+    if not playlist_id:
+        try:
+            playlist_id = get_playlist_id_from_url(body.get("url", ""))
+        except InvalidPlaylistUrlError as e:
+            raise web.HTTPBadRequest(text=str(e)) from e
+
+    async with request.app[INGEST_SLOTS]:
+        # Ingestion does blocking YouTube and vector store I/O, so it runs on
+        # its own thread and event loop to keep answer streams flowing.
+        yt_playlist = await asyncio.to_thread(
+            run_ingestion, request.app[VECTOR_STORE], playlist_id
+        )
+
+    request.app[RUNTIMES].set_playlist(playlist_id, yt_playlist)
+
+    return web.json_response(
+        {
+            "playlist_id": playlist_id,
+            "title": yt_playlist.title,
+            "videos": len(yt_playlist.videos),
+        }
+    )
+
+
+async def ask_question(request: web.Request) -> web.StreamResponse:
+    playlist_id = request.match_info["playlist_id"]
+    body = await read_json(request)
+    question = (body.get("question") or "").strip()
+    if not question:
+        raise web.HTTPBadRequest(text="'question' is required")
+    chat_id = parse_chat_id(body["chat_id"]) if body.get("chat_id") else str(uuid4())
+
+    try:
+        async with request.app[ADMISSION].slot():
+            try:
+                runtime = await request.app[RUNTIMES].get(playlist_id)
+            except (PlaylistDocumentsNotFoundError, EmptyPlaylistDocumentsError) as e:
+                raise web.HTTPNotFound(text=str(e)) from e
+
+            # Held for the whole turn, so compaction never rewrites this chat's
+            # checkpoints between reading the chat and saving the answer
+            async with thread_lock(chat_id):
+                memory = await MemoryManager.open(
+                    request.app[CHECKPOINTER], request.app[CHAT_STORE], chat_id
+                )
+                context = await memory.get_context()
+
+                tokens = TokenStream()
+                config: RunnableConfig = {
+                    "configurable": {"thread_id": memory.get_chat_id(), "on_token": tokens}
+                }
+                state: State = {
+                    "query": question,
+                    "context": context,
+                    "playlist_id": playlist_id,
+                    "yt_playlist": runtime.playlist,
+                }
+
+                async def generate():
+                    try:
+                        with telemetry.span(
+                            "graph.turn", chat_id=memory.get_chat_id(), playlist_id=playlist_id
+                        ):
+                            return await runtime.graph.ainvoke(state, config=config)
+                    finally:
+                        await tokens.aclose()
+
+                response = web.StreamResponse(
+                    headers={
+                        "Content-Type": "text/event-stream",
+                        "Cache-Control": "no-cache",
+                        "X-Accel-Buffering": "no",
+                    }
+                )
+                await response.prepare(request)
+
+                generation = asyncio.create_task(generate())
+                try:
+                    await send_event(response, "chat", {"chat_id": memory.get_chat_id()})
+                    async for token in tokens:
+                        await send_event(response, "token", token)
+                    result = await generation
+                except ConnectionResetError:
+                    raise
+                except Exception as e:
+                    await send_event(response, "error", {"error": str(e)})
+                    return response
+                finally:
+                    # Stops the LLM call when the client goes away mid-answer.
+                    if not generation.done():
+                        generation.cancel()
+                        await asyncio.gather(generation, return_exceptions=True)
+
+                await send_event(
+                    response,
+                    "done",
+                    {
+                        "chat_id": memory.get_chat_id(),
+                        "chunk_ids": [chunk.id for chunk in result.get("retrieved_chunks", [])],
+                        "retrieval_timings": result.get("retrieval_timings", {}),
+                        "generation_metrics": result.get("generation_metrics"),
+                    },
+                )
+                await memory.update_chat(result.get("messages"))
+                return response
+    except ServerBusyError as e:
+        return busy_response(e)
+
+
+async def get_chat_messages(request: web.Request) -> web.Response:
+    chat_id = parse_chat_id(request.match_info["chat_id"])
+    checkpoint = await request.app[CHECKPOINTER].aget(
+        {"configurable": {"thread_id": chat_id}}
+    )
+    if checkpoint is None:
+        raise web.HTTPNotFound(text=f"Chat not found: {chat_id}")
+
+    messages = checkpoint["channel_values"].get("messages", [])
+    return web.json_response(
+        {
+            "chat_id": chat_id,
+            "messages": [
+                {"role": "human" if message.type == "human" else "ai", "content": message.content}
+                for message in messages
+            ],
+        }
+    )
+
+
+async def get_stats(request: web.Request) -> web.Response:
+    return web.json_response(
+        {
+            "admission": request.app[ADMISSION].stats(),
+            "retrievers": request.app[RUNTIMES].registry.stats(),
+            "retrieval_cache": get_retrieval_cache().stats(),
+        }
+    )
+
+
+async def get_metrics(request: web.Request) -> web.Response:
+    if not telemetry.enabled:
+        raise web.HTTPNotFound(text="Telemetry is disabled (set TELEMETRY_ENABLED=true)")
+    return web.Response(
+        body=render_prometheus(telemetry).encode("utf-8"),
+        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
+
+
+# region APP
+
+
+async def open_resources(app: web.Application):
+    vector_store = init_vector_db()
+    async with AsyncSqliteSaver.from_conn_string(CHAT_STATE_DIR) as checkpointer:
+        app[VECTOR_STORE] = vector_store
+        app[CHECKPOINTER] = checkpointer
+        app[RUNTIMES] = PlaylistRuntimes(vector_store=vector_store, checkpointer=checkpointer)
+        app[ADMISSION] = AdmissionController()
+        app[INGEST_SLOTS] = asyncio.Semaphore(max(1, SERVER_MAX_CONCURRENT_INGESTS))
+        app[CHAT_STORE] = ChatStore()
+
+        compaction = None
+        if CHECKPOINT_COMPACTION_INTERVAL_SECONDS > 0:
+            compactor = CheckpointCompactor(checkpointer, app[CHAT_STORE])
+            compaction = asyncio.create_task(
+                run_compaction_schedule(compactor, CHECKPOINT_COMPACTION_INTERVAL_SECONDS)
+            )
+
+        yield
+
+        if compaction is not None:
+            compaction.cancel()
+        await wait_for_pending_summaries()
+        await app[CHAT_STORE].close()
+
+    if TELEMETRY_OTLP_PATH:
+        export_otlp_json(telemetry, TELEMETRY_OTLP_PATH)
+
+
+def create_app() -> web.Application:
+    app = web.Application()
+    app.cleanup_ctx.append(open_resources)
+    app.add_routes(
+        [
+            web.post("/playlists", ingest_playlist),
+            web.post("/playlists/{playlist_id}/ask", ask_question),
+            web.get("/chats/{chat_id}/messages", get_chat_messages),
+            web.get("/stats", get_stats),
+            web.get("/metrics", get_metrics),
+        ]
+    )
+    return app
+
+
+def run_server(host: str = SERVER_HOST, port: int = SERVER_PORT) -> None:
+    web.run_app(create_app(), host=host, port=port)
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+
+from langchain_chroma import Chroma
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import Runnable
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph.state import CompiledStateGraph
+
+from src.application.graph.builder import create_compiled_graph
+from src.application.graph.helpers import gen_retriever, get_llm_chain, playlist_registry
+from src.application.services import RetrieverRegistry
+from src.domain.models import YoutubePlaylist
+from src.infrastructure.config import ENABLE_RETRIEVAL_CACHE
+
+
+@dataclass
+class PlaylistRuntime:
+    playlist_id: str
+    playlist: YoutubePlaylist
+    retriever: BaseRetriever
+    graph: CompiledStateGraph
+
+
+class PlaylistRuntimes:
+    """
+    Warm retriever and compiled graph per playlist, shared by every chat.
+
+    Runtimes live in a RetrieverRegistry: they are built on first use and
+    the least recently used playlists are evicted once their retrievers
+    exceed the memory budget.
+    """
+
+    def __init__(self, vector_store: Chroma, checkpointer: AsyncSqliteSaver):
+        self.vector_store = vector_store
+        self.checkpointer = checkpointer
+        self._llm_chain: Runnable | None = None
+        self.registry: RetrieverRegistry[PlaylistRuntime] = RetrieverRegistry(self._build)
+
+    def __len__(self) -> int:
+        return len(self.registry)
+
+    async def get(self, playlist_id: str) -> PlaylistRuntime:
+        return await self.registry.get(playlist_id)
+
+    def _build(self, playlist_id: str) -> PlaylistRuntime:
+        retriever = gen_retriever(vector_store=self.vector_store, playlist_id=playlist_id)
+
+        if self._llm_chain is None:
+            self._llm_chain = get_llm_chain()
+
+        graph = create_compiled_graph(
+            self.checkpointer,
+            retriever,
+            embeddings=self.vector_store.embeddings,
+            llm_chain=self._llm_chain,
+            interactive=False,
+            retrieval_cache=ENABLE_RETRIEVAL_CACHE,
+        )
+
+        indexed_playlist = playlist_registry.get_playlist(playlist_id)
+        playlist = YoutubePlaylist(
+            title=indexed_playlist.title or "" if indexed_playlist else ""
+        )
+
+        return PlaylistRuntime(
+            playlist_id=playlist_id, playlist=playlist, retriever=retriever, graph=graph
+        )
+
+    def set_playlist(self, playlist_id: str, playlist: YoutubePlaylist) -> None:
+        runtime = self.registry.peek(playlist_id)
+        if runtime is not None:
+            runtime.playlist = playlist.model_copy(update={"videos": []})
+
+    def invalidate(self, playlist_id: str) -> None:
+        self.registry.remove(playlist_id)
@@ -1,3 +1,60 @@
+from src.application.services.answer_cache import (
+    AnswerCache,
+    areplay_answer,
+    replay_answer,
+)
+from src.application.services.chat_store import ChatStore
+from src.application.services.conversation_view import ConversationView, format_message
 from src.application.services.playlist_loader import YouTubePlaylistLoader
+from src.application.services.playlist_registry import PlaylistRegistry
+from src.application.services.query_expansion import (
+    QueryExpander,
+    QueryVariantCache,
+    should_expand_query,
+)
+from src.application.services.retrieval_cache import (
+    RetrievalCacheStats,
+    SemanticRetrievalCache,
+)
+from src.application.services.retriever_registry import (
+    RetrieverRegistry,
+    RetrieverRegistryStats,
+)
+from src.application.services.token_stream import (
+    GenerationMetrics,
+    GenerationTimer,
+    TokenCallback,
+    TokenStream,
+    print_token,
+)
+from src.application.services.transcript_writer import (
+    TranscriptWriter,
+    WriteStats,
+    make_chunk_id,
+)
 
-__all__ = ["YouTubePlaylistLoader"]
+__all__ = [
+    "AnswerCache",
+    "replay_answer",
+    "areplay_answer",
+    "ChatStore",
+    "ConversationView",
+    "format_message",
+    "YouTubePlaylistLoader",
+    "PlaylistRegistry",
+    "QueryExpander",
+    "QueryVariantCache",
+    "should_expand_query",
+    "RetrievalCacheStats",
+    "SemanticRetrievalCache",
+    "RetrieverRegistry",
+    "RetrieverRegistryStats",
+    "GenerationMetrics",
+    "GenerationTimer",
+    "TokenCallback",
+    "TokenStream",
+    "print_token",
+    "TranscriptWriter",
+    "WriteStats",
+    "make_chunk_id",
+]
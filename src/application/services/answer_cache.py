@@ -0,0 +1,110 @@
+import hashlib
+import re
+from datetime import timedelta
+from typing import AsyncIterator, Iterator, Sequence
+
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessageChunk
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, select
+
+from src.application.services.query_expansion import normalize_question
+from src.domain.models import AnswerEntry
+from src.domain.models.Registry import utc_now
+from src.infrastructure.config import (
+    GENERATION_MODEL,
+    ANSWER_CACHE_INCLUDE_HISTORY,
+    ANSWER_CACHE_TTL_SECONDS,
+    get_engine,
+)
+
+REPLAY_PATTERN = re.compile(r"\s*\S+\s*")
+
+
+def hash_chunks(chunks: Sequence[Document]) -> str:
+    chunk_ids = sorted(chunk.id or chunk.page_content for chunk in chunks)
+    return hashlib.sha256("\0".join(chunk_ids).encode("utf-8")).hexdigest()
+
+
+def replay_answer(answer: str) -> Iterator[AIMessageChunk]:
+    """Yield a cached answer word by word, like a model stream."""
+    for piece in REPLAY_PATTERN.findall(answer):
+        yield AIMessageChunk(content=piece)
+
+
+async def areplay_answer(answer: str) -> AsyncIterator[AIMessageChunk]:
+    for chunk in replay_answer(answer):
+        yield chunk
+
+
+class AnswerCache:
+    """Persistent cache of generated answers, keyed by model, playlist, retrieved chunks and question."""
+
+    def __init__(
+        self,
+        engine=None,
+        ttl_seconds: int = ANSWER_CACHE_TTL_SECONDS,
+        include_history: bool = ANSWER_CACHE_INCLUDE_HISTORY,
+    ):
+        self.engine = engine or get_engine()
+        self.ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else None
+        self.include_history = include_history
+
+    def make_key(
+        self,
+        playlist_id: str,
+        question: str,
+        chunks: Sequence[Document],
+        history: str = "",
+    ) -> str:
+        parts = [
+            GENERATION_MODEL or "",
+            playlist_id,
+            hash_chunks(chunks),
+            normalize_question(question),
+        ]
+        if self.include_history:
+            parts.append(history)
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> str | None:
+        with Session(self.engine) as session:
+            entry = session.exec(
+                select(AnswerEntry).where(AnswerEntry.cache_key == cache_key)
+            ).first()
+
+            if entry is None:
+                return None
+
+            if self.ttl is not None and utc_now() - entry.created_at > self.ttl:
+                session.delete(entry)
+                session.commit()
+                return None
+
+            entry.hits += 1
+            session.add(entry)
+            session.commit()
+
+            return entry.answer
+
+    def put(self, cache_key: str, playlist_id: str, question: str, answer: str) -> None:
+        if not answer:
+            return
+
+        created_at = utc_now()
+        # Upsert, so two requests that missed on the same key both succeed
+        statement = insert(AnswerEntry).values(
+            cache_key=cache_key,
+            playlist_id=playlist_id,
+            question=question,
+            answer=answer,
+            hits=0,
+            created_at=created_at,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[AnswerEntry.cache_key],
+            set_={"answer": answer, "created_at": created_at},
+        )
+        with Session(self.engine) as session:
+            session.execute(statement)
+            session.commit()
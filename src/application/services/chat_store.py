@@ -0,0 +1,155 @@
+import asyncio
+import uuid
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.models import Chat, ChatPreference, Message
+from src.infrastructure.config import CHATS_DB_FLUSH_INTERVAL_SECONDS, get_async_engine
+from src.infrastructure.telemetry import telemetry
+
+
+class ChatStore:
+    """
+    Async persistence of chats, their messages and preferences.
+
+    Reads go through a bounded pool of async SQLite connections, so chat
+    bookkeeping never blocks the event loop. Column updates to existing
+    chats are buffered for `flush_interval` seconds and committed in one
+    transaction; later values for the same column replace earlier ones, so
+    a burst of message-counter updates costs a single write. Reads apply
+    the buffered values, so callers always see their own updates.
+
+    Call `close()` before the event loop ends to commit buffered updates.
+    """
+
+    def __init__(self, engine=None, flush_interval: float = CHATS_DB_FLUSH_INTERVAL_SECONDS):
+        self._engine = engine
+        self.flush_interval = flush_interval
+        self._pending: dict[int, dict[str, Any]] = {}
+        self._flush_task: asyncio.Task | None = None
+        # SQLite has a single writer; waiting here is cheaper than on busy_timeout
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            self._engine = get_async_engine()
+        return self._engine
+
+    def _session(self) -> AsyncSession:
+        return AsyncSession(self.engine, expire_on_commit=False)
+
+    def _apply_pending(self, chat: Chat | None) -> Chat | None:
+        if chat is not None:
+            for column, value in self._pending.get(chat.id, {}).items():
+                setattr(chat, column, value)
+        return chat
+
+    # region CHATS
+
+    async def get_chat(self, chat_id: UUID) -> Chat | None:
+        async with self._session() as session:
+            result = await session.exec(select(Chat).where(Chat.chat_id == chat_id))
+            return self._apply_pending(result.first())
+
+    async def create_chat(self, chat_id: UUID | None = None) -> Chat:
+        chat = Chat(chat_id=chat_id or uuid.uuid4())
+        async with self._write_lock, self._session() as session:
+            session.add(chat)
+            try:
+                await session.commit()
+            except IntegrityError:
+                # Created by a concurrent request for the same chat
+                await session.rollback()
+                existing = await self.get_chat(chat.chat_id)
+                if existing is None:
+                    raise
+                return existing
+
+        return chat
+
+    async def get_or_create_chat(self, chat_id: UUID) -> tuple[Chat, bool]:
+        chat = await self.get_chat(chat_id)
+        if chat is not None:
+            return chat, False
+        return await self.create_chat(chat_id), True
+
+    async def update_chat(self, chat_pk: int, **values: Any) -> None:
+        """Buffer column updates for a chat; see the class docstring."""
+        self._pending.setdefault(chat_pk, {}).update(values)
+
+        if self.flush_interval <= 0:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"Error saving chat updates: {e}")
+
+    async def flush(self) -> int:
+        """Commit buffered updates in one transaction. Returns the chats written."""
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        try:
+            async with self._write_lock, self._session() as session:
+                with telemetry.span("chat_store.flush", chats=len(pending)):
+                    for chat_pk, values in pending.items():
+                        await session.execute(
+                            update(Chat).where(Chat.id == chat_pk).values(**values)
+                        )
+                    await session.commit()
+        except Exception:
+            # Keep the updates for the next flush, without overriding newer values
+            for chat_pk, values in pending.items():
+                self._pending[chat_pk] = {**values, **self._pending.get(chat_pk, {})}
+            raise
+
+        telemetry.increment("chat_store_flushed_chats", len(pending))
+        return len(pending)
+
+    async def close(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush()
+
+    # region MESSAGES AND PREFERENCES
+
+    async def get_messages(self, chat_pk: int, limit: int | None = None) -> list[Message]:
+        """Messages of a chat, oldest first; the last `limit` when given."""
+        query = select(Message).where(Message.chat_id == chat_pk).order_by(Message.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        async with self._session() as session:
+            messages = (await session.exec(query)).all()
+        return list(reversed(messages))
+
+    async def add_messages(self, chat_pk: int, messages: Sequence[Message]) -> None:
+        if not messages:
+            return
+        async with self._write_lock, self._session() as session:
+            for message in messages:
+                message.chat_id = chat_pk
+                session.add(message)
+            await session.commit()
+
+    async def get_preferences(self, chat_pk: int) -> list[ChatPreference]:
+        query = select(ChatPreference).where(ChatPreference.chat_id == chat_pk)
+        async with self._session() as session:
+            return list((await session.exec(query)).all())
+
+    async def add_preference(self, chat_pk: int, preference: str) -> ChatPreference:
+        chat_preference = ChatPreference(chat_id=chat_pk, preference=preference)
+        async with self._write_lock, self._session() as session:
+            session.add(chat_preference)
+            await session.commit()
+        return chat_preference
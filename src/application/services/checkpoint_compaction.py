@@ -0,0 +1,273 @@
+import asyncio
+import os
+from datetime import datetime, timezone
+from typing import TypedDict
+from uuid import UUID
+
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from src.application.services.chat_store import ChatStore
+from src.application.services.memory_manager import has_pending_summary, thread_lock
+from src.infrastructure.config import (
+    CHAT_STATE_DIR,
+    CHECKPOINT_COMPACTION_IDLE_SECONDS,
+    CHECKPOINT_KEEP_LAST,
+)
+from src.infrastructure.telemetry import telemetry
+
+# SQLite auto_vacuum modes, as reported by PRAGMA auto_vacuum
+AUTO_VACUUM_INCREMENTAL = 2
+
+PRUNE_CHECKPOINTS_SQL = """
+DELETE FROM checkpoints WHERE rowid IN (
+    SELECT rowid FROM (
+        SELECT rowid, ROW_NUMBER() OVER (
+            PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+        ) AS position
+        FROM checkpoints
+    )
+    WHERE position > ?
+)
+"""
+
+PRUNE_WRITES_SQL = """
+DELETE FROM writes WHERE NOT EXISTS (
+    SELECT 1 FROM checkpoints
+    WHERE checkpoints.thread_id = writes.thread_id
+      AND checkpoints.checkpoint_ns = writes.checkpoint_ns
+      AND checkpoints.checkpoint_id = writes.checkpoint_id
+)
+"""
+
+
+class CompactionStats(TypedDict):
+    threads: int
+    checkpoints_deleted: int
+    writes_deleted: int
+    messages_dropped: int
+    bytes_before: int
+    bytes_after: int
+    bytes_reclaimed: int
+    seconds: float
+
+
+def file_size(path: str) -> int:
+    # The WAL holds pages not yet checkpointed into the main file
+    return sum(
+        os.path.getsize(candidate)
+        for candidate in (path, f"{path}-wal")
+        if os.path.exists(candidate)
+    )
+
+
+class CheckpointCompactor:
+    """
+    Retention and compaction for the AsyncSqliteSaver state database.
+
+    A compaction run:
+    1. keeps the latest `keep_last` checkpoints per thread and namespace,
+       and deletes the others with their pending writes;
+    2. drops the messages of idle chats that are already folded into
+       `pruned_history_summary`, from every kept checkpoint, and rebases the
+       chat's summary watermark and message count to match;
+    3. runs an incremental vacuum so the freed pages go back to the file
+       system. The first run switches the database to incremental
+       auto-vacuum, which needs one full VACUUM.
+
+    Chats whose latest checkpoint is younger than `idle_seconds` are left
+    untouched. Messages are dropped while holding the chat's `thread_lock`,
+    which a turn holds from reading the context to saving the answer, and
+    only if no checkpoint was written since the chat was read.
+    """
+
+    def __init__(
+        self,
+        checkpointer: AsyncSqliteSaver,
+        store: ChatStore,
+        database_path: str = CHAT_STATE_DIR,
+        keep_last: int = CHECKPOINT_KEEP_LAST,
+        idle_seconds: float = CHECKPOINT_COMPACTION_IDLE_SECONDS,
+    ):
+        self.checkpointer = checkpointer
+        self.store = store
+        self.database_path = database_path
+        self.keep_last = max(1, keep_last)
+        self.idle_seconds = idle_seconds
+
+    async def compact(self, vacuum: bool = True) -> CompactionStats:
+        started_at = asyncio.get_running_loop().time()
+        await self.checkpointer.setup()
+        bytes_before = file_size(self.database_path)
+
+        with telemetry.span("checkpoints.compact", keep_last=self.keep_last):
+            checkpoints_deleted, writes_deleted = await self._prune_history()
+            threads, messages_dropped = await self._drop_summarized_messages()
+            if vacuum:
+                await self._vacuum()
+
+        bytes_after = file_size(self.database_path)
+        telemetry.increment("checkpoints_deleted", checkpoints_deleted)
+        telemetry.increment("checkpoint_messages_dropped", messages_dropped)
+
+        return {
+            "threads": threads,
+            "checkpoints_deleted": checkpoints_deleted,
+            "writes_deleted": writes_deleted,
+            "messages_dropped": messages_dropped,
+            "bytes_before": bytes_before,
+            "bytes_after": bytes_after,
+            "bytes_reclaimed": max(0, bytes_before - bytes_after),
+            "seconds": asyncio.get_running_loop().time() - started_at,
+        }
+
+    async def _prune_history(self) -> tuple[int, int]:
+        conn = self.checkpointer.conn
+        async with self.checkpointer.lock:
+            checkpoints = await conn.execute(PRUNE_CHECKPOINTS_SQL, (self.keep_last,))
+            writes = await conn.execute(PRUNE_WRITES_SQL)
+            await conn.commit()
+        return checkpoints.rowcount, writes.rowcount
+
+    async def _thread_ids(self) -> list[str]:
+        async with self.checkpointer.lock:
+            async with self.checkpointer.conn.execute(
+                "SELECT DISTINCT thread_id FROM checkpoints WHERE checkpoint_ns = ''"
+            ) as cursor:
+                return [row[0] for row in await cursor.fetchall()]
+
+    async def _drop_summarized_messages(self) -> tuple[int, int]:
+        thread_ids = await self._thread_ids()
+        messages_dropped = 0
+
+        for thread_id in thread_ids:
+            try:
+                chat_id = UUID(thread_id)
+            except ValueError:
+                continue
+            async with thread_lock(thread_id):
+                if has_pending_summary(thread_id):
+                    continue
+                chat = await self.store.get_chat(chat_id)
+                if chat is None or chat.summarized_messages_count == 0:
+                    continue
+                messages_dropped += await self._drop_thread_messages(thread_id, chat)
+
+        await self.store.flush()
+        return len(thread_ids), messages_dropped
+
+    def _is_idle(self, checkpoint) -> bool:
+        ts = checkpoint.get("ts")
+        if not ts:
+            return False
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(ts)
+        return age.total_seconds() >= self.idle_seconds
+
+    async def _drop_thread_messages(self, thread_id: str, chat) -> int:
+        config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+        latest = await self.checkpointer.aget_tuple(config)
+        if latest is None or not self._is_idle(latest.checkpoint):
+            return 0
+
+        messages = latest.checkpoint["channel_values"].get("messages", [])
+        watermark = min(chat.summarized_messages_count, len(messages))
+        folded_ids = {message.id for message in messages[:watermark]}
+        if not folded_ids or None in folded_ids:
+            return 0
+
+        conn = self.checkpointer.conn
+        serde = self.checkpointer.serde
+        async with self.checkpointer.lock:
+            # A turn in another process may have saved a checkpoint since
+            async with conn.execute(
+                "SELECT checkpoint_id FROM checkpoints "
+                "WHERE thread_id = ? AND checkpoint_ns = '' "
+                "ORDER BY checkpoint_id DESC LIMIT 1",
+                (thread_id,),
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None or row[0] != latest.config["configurable"]["checkpoint_id"]:
+                return 0
+
+            async with conn.execute(
+                "SELECT checkpoint_id, type, checkpoint FROM checkpoints "
+                "WHERE thread_id = ? AND checkpoint_ns = ''",
+                (thread_id,),
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            for checkpoint_id, type_, blob in rows:
+                checkpoint = serde.loads_typed((type_, blob))
+                channel_values = checkpoint["channel_values"]
+                kept = [
+                    message
+                    for message in channel_values.get("messages", [])
+                    if message.id not in folded_ids
+                ]
+                if len(kept) == len(channel_values.get("messages", [])):
+                    continue
+                channel_values["messages"] = kept
+                await conn.execute(
+                    "UPDATE checkpoints SET type = ?, checkpoint = ? "
+                    "WHERE thread_id = ? AND checkpoint_ns = '' AND checkpoint_id = ?",
+                    (*serde.dumps_typed(checkpoint), thread_id, checkpoint_id),
+                )
+            await conn.commit()
+
+        # The dropped messages were the summarized prefix, so the watermark
+        # now starts at the first message still in the checkpoint
+        await self.store.update_chat(
+            chat.id,
+            summarized_messages_count=chat.summarized_messages_count - watermark,
+            messages_count=len(messages) - watermark,
+        )
+        return watermark
+
+    async def _vacuum(self) -> None:
+        conn = self.checkpointer.conn
+        async with self.checkpointer.lock:
+            async with conn.execute("PRAGMA auto_vacuum") as cursor:
+                (mode,) = await cursor.fetchone()
+            if mode != AUTO_VACUUM_INCREMENTAL:
+                # Only takes effect after a full VACUUM rebuilds the file
+                await conn.execute(f"PRAGMA auto_vacuum = {AUTO_VACUUM_INCREMENTAL}")
+                await conn.commit()
+                await conn.execute("VACUUM")
+            else:
+                # Frees one page per step, so the rows must be consumed
+                async with conn.execute("PRAGMA incremental_vacuum") as cursor:
+                    await cursor.fetchall()
+                await conn.commit()
+            await conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+async def run_compaction(
+    keep_last: int = CHECKPOINT_KEEP_LAST,
+    idle_seconds: float = CHECKPOINT_COMPACTION_IDLE_SECONDS,
+    vacuum: bool = True,
+) -> CompactionStats:
+    """One-off compaction of CHAT_STATE_DIR, for `python main.py compact`."""
+    store = ChatStore()
+    async with AsyncSqliteSaver.from_conn_string(CHAT_STATE_DIR) as checkpointer:
+        compactor = CheckpointCompactor(
+            checkpointer, store, keep_last=keep_last, idle_seconds=idle_seconds
+        )
+        try:
+            return await compactor.compact(vacuum=vacuum)
+        finally:
+            await store.close()
+
+
+async def run_compaction_schedule(compactor: CheckpointCompactor, interval_seconds: float):
+    """Compact every `interval_seconds` until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            stats = await compactor.compact()
+        except Exception as e:
+            print(f"Error compacting checkpoints: {e}")
+            continue
+        print(
+            f"Compacted checkpoints: {stats['checkpoints_deleted']} deleted, "
+            f"{stats['messages_dropped']} messages dropped, "
+            f"{stats['bytes_reclaimed']} bytes reclaimed"
+        )
@@ -0,0 +1,58 @@
+from collections import deque
+from typing import Sequence
+
+from langchain_core.messages import BaseMessage
+
+
+def format_message(message: BaseMessage) -> str:
+    role = "Human" if message.type == "human" else "AI"
+    return f"[{role}]: {message.content}\n\n"
+
+
+class ConversationView:
+    """
+    Formatted tail of one conversation, loaded from its checkpoint once.
+
+    Only the last `capacity` messages are kept, each formatted once when it
+    is appended, so building the context and the summary delta joins
+    ready-made strings and memory stays constant however long the chat is.
+    Positions are absolute message indexes in the checkpoint, the same ones
+    `Chat.summarized_messages_count` refers to.
+    """
+
+    def __init__(self, capacity: int):
+        self.messages_count = 0
+        self._window: deque[str] = deque(maxlen=max(1, capacity))
+
+    @classmethod
+    def from_messages(cls, messages: Sequence[BaseMessage], capacity: int) -> "ConversationView":
+        view = cls(capacity)
+        tail = messages[-view._window.maxlen :] if messages else []
+        view.messages_count = len(messages) - len(tail)
+        view.append(tail)
+        return view
+
+    @property
+    def first_position(self) -> int:
+        return self.messages_count - len(self._window)
+
+    def append(self, messages: Sequence[BaseMessage]) -> None:
+        self._window.extend(format_message(message) for message in messages)
+        self.messages_count += len(messages)
+
+    def sync(self, messages: Sequence[BaseMessage]) -> None:
+        """Append the messages of `messages` (the full list) not seen yet."""
+        if len(messages) > self.messages_count:
+            self.append(messages[self.messages_count :])
+
+    def covers(self, start: int) -> bool:
+        return start >= self.first_position
+
+    def text(self, start: int, end: int | None = None) -> str:
+        """Formatted messages in [start, end), clipped to the kept window."""
+        first = self.first_position
+        end = self.messages_count if end is None else min(end, self.messages_count)
+        start = max(start, first)
+        if start >= end:
+            return ""
+        return "".join(self._window[i - first] for i in range(start, end))
@@ -1,23 +1,26 @@
-import uuid
+import asyncio
+from functools import cache
 from uuid import UUID
 from typing import List
+from weakref import WeakValueDictionary
 from typing_extensions import TypedDict, Annotated
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 from src.domain.models import Chat
-from sqlmodel import Session, select
 from langchain_classic.chat_models import init_chat_model
 from langchain_core.prompts import ChatPromptTemplate
 from src.application.graph.state import ContextDict
+from src.application.services.chat_store import ChatStore
+from src.application.services.conversation_view import ConversationView, format_message
 
 from src.infrastructure.config import (
-    ENGINE,
     MAX_MSG_SUMMARY,
     LLM_PROVIDER,
     QUERY_MODEL,
 )
 
 from src.domain.prompts import HUMAN_PROMPT, SUMMARY_PROMPT
+from src.infrastructure.telemetry import telemetry
 
 
 class MemoryState(TypedDict):
@@ -27,98 +30,178 @@ class MemoryState(TypedDict):
     chat_id: str
 
 
+# Summaries still being written, per chat, so two turns of the same chat
+# (or two MemoryManagers in the server) never fold the same messages twice.
+_summary_tasks: dict[str, asyncio.Task] = {}
+
+# One lock per chat, held by a turn from reading the context to saving the
+# answer, and by compaction while it rewrites the chat's checkpoints.
+_thread_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
+SUMMARY_INSTRUCTION = "Update the summary with the new messages."
+
+# Unsummarized messages shown in the context; more than MAX_MSG_SUMMARY
+# only while a summary is pending
+CONTEXT_WINDOW = 2 * MAX_MSG_SUMMARY
+
+
+@cache
+def get_summarization_chain():
+    """Summarization chain shared by every chat, built once per process."""
+    llm = init_chat_model(model_provider=LLM_PROVIDER, model=QUERY_MODEL)
+    template = ChatPromptTemplate.from_messages([SUMMARY_PROMPT, HUMAN_PROMPT])
+
+    return template | llm
+
+
+async def wait_for_pending_summaries():
+    """Let background summaries finish before the event loop shuts down."""
+    if _summary_tasks:
+        await asyncio.gather(*_summary_tasks.values(), return_exceptions=True)
+
+
+def thread_lock(chat_id: str) -> asyncio.Lock:
+    lock = _thread_locks.get(chat_id)
+    if lock is None:
+        lock = _thread_locks[chat_id] = asyncio.Lock()
+    return lock
+
+
+def has_pending_summary(chat_id: str) -> bool:
+    return chat_id in _summary_tasks
+
+
+def get_checkpoint_messages(checkpoint) -> list[BaseMessage]:
+    if not checkpoint:
+        return []
+    return checkpoint.get("channel_values", {}).get("messages", [])
+
+
 class MemoryManager:
+    """Chat record and rolling summary of one conversation."""
 
-    def __init__(self, checkpointer, chat_id: str | None = None):
+    def __init__(self, checkpointer, store: ChatStore, chat_instance: Chat, new_chat: bool):
         self.checkpointer = checkpointer
-        self.config = None
+        self.store = store
+        self.chat_instance = chat_instance
+        self.chat_id = str(chat_instance.chat_id)
+        self.new_chat = new_chat
+        self.config = {"configurable": {"thread_id": self.chat_id}}
+        self._view: ConversationView | None = None
 
+    @classmethod
+    async def open(
+        cls, checkpointer, store: ChatStore, chat_id: str | None = None
+    ) -> "MemoryManager":
         if chat_id:
-            self.chat_id = chat_id
-            self.chat_instance = self._get_chat(chat_id)
-            self.new_chat = False
+            chat_instance, new_chat = await store.get_or_create_chat(UUID(chat_id))
         else:
-            self.chat_instance = self._create_new_chat()
-            self.chat_id = str(self.chat_instance.chat_id)
-            self.new_chat = True
+            chat_instance, new_chat = await store.create_chat(), True
 
-        self.config = {"configurable": {"thread_id": self.chat_id}}
+        return cls(checkpointer, store, chat_instance, new_chat)
 
     def is_new_chat(self):
         return self.new_chat or False
 
-    def _create_new_chat(self) -> Chat:
-        new_chat_id = uuid.uuid4()
-        new_chat = Chat(chat_id=new_chat_id)
-        with Session(ENGINE) as session:
-            session.add(new_chat)
-            session.commit()
-            session.refresh(new_chat)
-
-        return new_chat
-
-    def _get_chat(self, chat_id: str):
-        with Session(ENGINE) as session:
-            query = select(Chat).where(Chat.chat_id == UUID(chat_id))
-            chat = session.exec(query).first()
-
-        return chat
-
-    def _gen_summary(self, prev_messages):
-        if self.chat_instance:
-            current_summary = self.chat_instance.pruned_history_summary or ""
-            chain_summary = self._get_summarization_chain()
-            response = chain_summary.invoke(
-                {"previous_summary": current_summary, "messages": prev_messages}
-            )
+    async def _read_messages(self) -> list[BaseMessage]:
+        return get_checkpoint_messages(await self.checkpointer.aget(self.config))
 
-            return response.content
+    async def get_view(self) -> ConversationView:
+        if self._view is None:
+            self._view = ConversationView.from_messages(
+                await self._read_messages(), capacity=CONTEXT_WINDOW
+            )
+        return self._view
+
+    async def _gen_summary(self, current_summary: str, new_messages: str) -> str:
+        with telemetry.span("memory.summarize"):
+            response = await get_summarization_chain().ainvoke(
+                {
+                    "previous_summary": current_summary,
+                    "messages": new_messages,
+                    "question": SUMMARY_INSTRUCTION,
+                }
+            )
 
-    def _get_summarization_chain(self):
-        llm = init_chat_model(model_provider=LLM_PROVIDER, model=QUERY_MODEL)
-        template = ChatPromptTemplate.from_messages([SUMMARY_PROMPT, HUMAN_PROMPT])
+        usage = getattr(response, "usage_metadata", None) or {}
+        telemetry.increment("llm_input_tokens", usage.get("input_tokens", 0), model="summary")
+        telemetry.increment("llm_output_tokens", usage.get("output_tokens", 0), model="summary")
 
-        return template | llm
+        return response.content
 
-    def _save_changes(self):
-        with Session(ENGINE) as session:
-            session.add(self.chat_instance)
-            session.commit()
+    async def _save_changes(self, **values):
+        # Only the given columns are written, so the message counter and a
+        # summary finishing in the background never overwrite each other.
+        await self.store.update_chat(self.chat_instance.id, **values)
 
     def get_chat_id(self):
         return self.chat_id
 
-    async def update_chat(self):
-        state = await self.checkpointer.aget(self.config)
-        messages = state.get("messages", []) if state else []
+    async def update_chat(self, messages: list[BaseMessage] | None = None):
+        """
+        Record the new message count and start folding messages that left
+        the recent window into the summary, without waiting for it.
+
+        `messages` is the message list of the turn's final state (the graph
+        result); without it the checkpoint is read again.
+        """
+        with telemetry.span("memory.update_chat"):
+            await self._update_chat(messages)
+
+    async def _update_chat(self, messages: list[BaseMessage] | None):
+        view = await self.get_view()
+        view.sync(messages if messages is not None else await self._read_messages())
+
+        self.chat_instance.messages_count = view.messages_count
+        await self._save_changes(messages_count=view.messages_count)
+
+        watermark = self.chat_instance.summarized_messages_count
+        new_watermark = view.messages_count - MAX_MSG_SUMMARY
+        if new_watermark <= watermark or self.chat_id in _summary_tasks:
+            # Nothing left the window, or a summary is still running; its
+            # delta is picked up by a later turn.
+            return
+
+        if view.covers(watermark):
+            new_messages = view.text(watermark, new_watermark)
+        else:
+            # Earlier summaries failed and the delta outgrew the view
+            new_messages = self._format_messages_for_summary(
+                (await self._read_messages())[watermark:new_watermark]
+            )
+
+        task = asyncio.create_task(self._fold_into_summary(new_messages, new_watermark))
+        _summary_tasks[self.chat_id] = task
+        task.add_done_callback(lambda _: _summary_tasks.pop(self.chat_id, None))
 
-        if len(messages) > MAX_MSG_SUMMARY:
-            old_messages = messages[:-MAX_MSG_SUMMARY]
-            formatted_messages = self._format_messages_for_summary(old_messages)
-            new_summary = self._gen_summary(formatted_messages)
-            if self.chat_instance:
-                self.chat_instance.pruned_history_summary = new_summary
+    async def _fold_into_summary(self, new_messages: str, watermark: int):
+        try:
+            summary = await self._gen_summary(
+                self.chat_instance.pruned_history_summary or "", new_messages
+            )
+            await self._save_changes(
+                pruned_history_summary=summary, summarized_messages_count=watermark
+            )
+        except Exception as e:
+            print(f"Error summarizing chat {self.chat_id}: {e}")
+            return
 
-        if self.chat_instance:
-            self.chat_instance.messages_count = len(messages)
-            self._save_changes()
+        self.chat_instance.pruned_history_summary = summary
+        self.chat_instance.summarized_messages_count = watermark
+
+    async def wait_for_summary(self):
+        """Wait for this chat's background summary, e.g. before the process exits."""
+        task = _summary_tasks.get(self.chat_id)
+        if task is not None:
+            await asyncio.shield(task)
 
     def _format_messages_for_summary(self, messages) -> str:
-        formatted_msgs = ""
-        for message in messages:
-            role = "Human" if message.type == "human" else "AI"
-            formatted_msgs += f"[{role}]: {message.content}\n\n"
-        return formatted_msgs
+        return "".join(format_message(message) for message in messages)
 
     async def get_context(self) -> ContextDict:
-        state = await self.checkpointer.aget(self.config)
-        messages = state.get("messages", []) if state else []
-        last_messages = messages[-MAX_MSG_SUMMARY:] if messages else []
-
-        if self.chat_instance:
-            return {
-                "summary": self.chat_instance.pruned_history_summary,
-                "last_messages": self._format_messages_for_summary(last_messages),
-            }
-
-        return {"summary": "", "last_messages": ""}
+        view = await self.get_view()
+        # Messages not in the summary yet, clipped to CONTEXT_WINDOW
+        return {
+            "summary": self.chat_instance.pruned_history_summary,
+            "last_messages": view.text(start=self.chat_instance.summarized_messages_count),
+        }
@@ -1,6 +1,9 @@
 import asyncio
 import re
+from functools import cache
+from typing import AsyncIterator, Awaitable, Callable, Iterator
 
+from aiolimiter import AsyncLimiter
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
@@ -13,7 +16,8 @@ from src.domain.exceptions import (
 )
 from src.infrastructure.extensions.loaders import (
     YoutubeLoaderWithProxy,
-    TranscriptFormat,
+    TranscriptCache,
+    chunk_transcript,
 )
 from src.infrastructure.config import (
     GOOGLE_API_KEY,
@@ -22,22 +26,54 @@ from src.infrastructure.config import (
     LANG,
     PROXY_USER,
     PROXY_PASS,
+    TRANSCRIPT_MAX_CONCURRENCY,
+    TRANSCRIPT_RATE_LIMIT,
+    TRANSCRIPT_RATE_PERIOD,
+    TRANSCRIPT_CHUNK_TOKENS,
+    TRANSCRIPT_CHUNK_OVERLAP_TOKENS,
+    ENABLE_TRANSCRIPT_CACHE,
+    TRANSCRIPT_CACHE_DIR,
+    TRANSCRIPT_CACHE_MAX_MB,
+    TRANSCRIPT_CACHE_TTL_SECONDS,
 )
 
+API_MAX_RESULTS = 50
+
+
+@cache
+def get_transcript_cache() -> TranscriptCache | None:
+    if not ENABLE_TRANSCRIPT_CACHE:
+        return None
+
+    return TranscriptCache(
+        cache_dir=TRANSCRIPT_CACHE_DIR,
+        max_bytes=TRANSCRIPT_CACHE_MAX_MB * 1024 * 1024,
+        ttl_seconds=TRANSCRIPT_CACHE_TTL_SECONDS,
+    )
+
+
+def build_youtube_client():
+    """YouTube Data API client; each loader thread should use its own."""
+    try:
+        return build(API_SERVICE_NAME, API_VERSION, developerKey=GOOGLE_API_KEY)
+    except Exception as e:
+        raise YouTubeAPIKeyError(e) from e
+
 
 class YouTubePlaylistLoader:
     yt_playlist_id: str
     yt_service = None
     yt_playlist: YoutubePlaylist
 
-    def __init__(self, playlist_id: str):
+    def __init__(
+        self,
+        playlist_id: str,
+        transcript_cache: TranscriptCache | None = None,
+        yt_service=None,
+    ):
         self.yt_playlist_id = playlist_id
-        try:
-            self.yt_service = build(
-                API_SERVICE_NAME, API_VERSION, developerKey=GOOGLE_API_KEY
-            )
-        except Exception as e:
-            raise YouTubeAPIKeyError(e) from e
+        self.transcript_cache = transcript_cache or get_transcript_cache()
+        self.yt_service = yt_service or build_youtube_client()
         self.yt_playlist = YoutubePlaylist()
 
     def load_playlist_details(self):
@@ -72,78 +108,112 @@ class YouTubePlaylistLoader:
 
         return self
 
-    def load_video_details(self):
+    def _iter_playlist_pages(self) -> Iterator[list[dict]]:
         request = self.yt_service.playlistItems().list(
             part="snippet, contentDetails",
             playlistId=self.yt_playlist_id,
-            maxResults=20,
+            maxResults=API_MAX_RESULTS,
         )
 
-        try:
-            result = request.execute()
-            items = result.get("items", [])
-
-            if not items:
-                return self
+        while request is not None:
+            response = request.execute()
+            items = response.get("items", [])
+            if items:
+                yield items
+            request = self.yt_service.playlistItems().list_next(request, response)
 
-            video_ids = [item["contentDetails"]["videoId"] for item in items]
+    def _load_videos_extra_data(self, video_ids: list[str]) -> dict[str, dict]:
+        videos_extra_data = {}
+        for idx in range(0, len(video_ids), API_MAX_RESULTS):
             videos_request = self.yt_service.videos().list(
-                part="contentDetails,statistics", id=",".join(video_ids)
+                part="contentDetails,statistics",
+                id=",".join(video_ids[idx : idx + API_MAX_RESULTS]),
             )
             videos_response = videos_request.execute()
 
-            videos_extra_data = {
-                v["id"]: {
-                    "duration": v["contentDetails"]["duration"],
-                    "view_count": v["statistics"].get("viewCount"),
-                    "like_count": v["statistics"].get("likeCount"),
+            videos_extra_data.update(
+                {
+                    v["id"]: {
+                        "duration": v["contentDetails"]["duration"],
+                        "view_count": v["statistics"].get("viewCount"),
+                        "like_count": v["statistics"].get("likeCount"),
+                    }
+                    for v in videos_response.get("items", [])
                 }
-                for v in videos_response.get("items", [])
-            }
-
-            for video in items:
-                video_details = video.get("contentDetails", {})
-                video_snippet = video.get("snippet", {})
-
-                video_id = video_details.get("videoId")
-                video_position = video_snippet.get("position")
-                video_title = video_snippet.get("title")
-                video_description = video_snippet.get("description")
-
-                thumbnails = video_snippet.get("thumbnails", {})
-                thumbnail = thumbnails.get("standard") or thumbnails.get("high") or thumbnails.get("default") or {}
-                video_thumbnail = thumbnail.get("url", "")
-
-                extra = videos_extra_data.get(video_id, {})
-                video_duration = self.duration_to_secs(extra.get("duration", ""))
-                video_views = int(extra.get("view_count") or 0)
-                video_likes = int(extra.get("like_count") or 0)
-
-                self.yt_playlist.duration += video_duration
-                self.yt_playlist.total_views += video_views
-
-                yt_video = YoutubeVideo(
-                    title=video_title,
-                    video_id=video_id,
-                    description=video_description,
-                    thumbnail_url=video_thumbnail,
-                    transcript=[],
-                    position=video_position,
-                    likes=video_likes,
-                    views=video_views,
-                    duration=video_duration,
-                )
-
-                self.yt_playlist.videos.append(yt_video)
+            )
 
+        return videos_extra_data
+
+    def _build_videos(self, items: list[dict]) -> list[YoutubeVideo]:
+        video_ids = [item["contentDetails"]["videoId"] for item in items]
+        videos_extra_data = self._load_videos_extra_data(video_ids)
+        videos = []
+
+        for video in items:
+            video_details = video.get("contentDetails", {})
+            video_snippet = video.get("snippet", {})
+
+            video_id = video_details.get("videoId")
+            video_position = video_snippet.get("position")
+            video_title = video_snippet.get("title")
+            video_description = video_snippet.get("description")
+
+            thumbnails = video_snippet.get("thumbnails", {})
+            thumbnail = thumbnails.get("standard") or thumbnails.get("high") or thumbnails.get("default") or {}
+            video_thumbnail = thumbnail.get("url", "")
+
+            extra = videos_extra_data.get(video_id, {})
+            video_duration = self.duration_to_secs(extra.get("duration", ""))
+            video_views = int(extra.get("view_count") or 0)
+            video_likes = int(extra.get("like_count") or 0)
+
+            self.yt_playlist.duration += video_duration
+            self.yt_playlist.total_views += video_views
+
+            yt_video = YoutubeVideo(
+                title=video_title,
+                video_id=video_id,
+                description=video_description,
+                thumbnail_url=video_thumbnail,
+                transcript=[],
+                position=video_position,
+                likes=video_likes,
+                views=video_views,
+                duration=video_duration,
+            )
+
+            self.yt_playlist.videos.append(yt_video)
+            videos.append(yt_video)
+
+        return videos
+
+    def _iter_video_pages(self) -> Iterator[list[YoutubeVideo]]:
+        try:
+            for items in self._iter_playlist_pages():
+                yield self._build_videos(items)
         except HttpError as e:
             raise VideoDetailsLoadError(self.yt_playlist_id, e) from e
 
-        return self
+    def iter_video_details(self) -> Iterator[YoutubeVideo]:
+        """Walk every playlist page, yielding each video as its page is loaded."""
+        for videos in self._iter_video_pages():
+            yield from videos
+
+    async def stream_video_details(self) -> AsyncIterator[YoutubeVideo]:
+        """Async variant of `iter_video_details` that fetches pages off the event loop."""
+        pages = self._iter_video_pages()
+        while True:
+            videos = await asyncio.to_thread(next, pages, None)
+            if videos is None:
+                break
+            for video in videos:
+                yield video
 
-    @staticmethod
-    def calculate_end_sec(start_sec: float) -> float:
-        return start_sec + 29
+    def load_video_details(self):
+        for _ in self.iter_video_details():
+            pass
+
+        return self
 
     @staticmethod
     def duration_to_secs(duration: str) -> int:
@@ -157,46 +227,111 @@ class YouTubePlaylistLoader:
 
         return hours * 3600 + minutes * 60 + seconds
 
-    async def load_transcript_videos(self, delay_seconds: int = 3):
-        for idx, video in enumerate(self.yt_playlist.videos):
-            try:
-                yt_loader = YoutubeLoaderWithProxy(
-                    video_id=video.video_id,
-                    language=LANG,
-                    chunk_size_seconds=30,
-                    transcript_format=TranscriptFormat.CHUNKS,
-                    webshare_username=PROXY_USER,
-                    webshare_password=PROXY_PASS,
-                )
-                transcript_lines = yt_loader.load()
-            except Exception as e:
-                raise VideoTranscriptError(video.video_id, e) from e
-
-            previous_chars_overlap = ""
-            for transcript_line in transcript_lines:
-                start_sec = transcript_line.metadata.get("start_seconds", 0)
-                transcript_line.metadata.update(
-                    {
-                        "source_type": "video",
-                        "video_id": video.video_id,
-                        "video_title": video.title,
-                        "video_position": video.position,
-                        "playlist_id": self.yt_playlist_id,
-                        "playlist_title": self.yt_playlist.title,
-                        "end_seconds": self.calculate_end_sec(start_sec),
-                    }
-                )
-                if previous_chars_overlap:
-                    transcript_line.page_content = (
-                        f"{previous_chars_overlap}"
-                        f"{transcript_line.page_content}"
-                    )
-                previous_chars_overlap = transcript_line.page_content[-100:]
-
-            video.transcript = list(transcript_lines)
-
-            if idx < len(self.yt_playlist.videos) - 1:
-                await asyncio.sleep(delay_seconds)
+    def _load_video_transcript(self, video: YoutubeVideo) -> YoutubeVideo:
+        try:
+            yt_loader = YoutubeLoaderWithProxy(
+                video_id=video.video_id,
+                language=LANG,
+                webshare_username=PROXY_USER,
+                webshare_password=PROXY_PASS,
+                cache=self.transcript_cache,
+            )
+            snippets = yt_loader.load_snippets() or []
+        except Exception as e:
+            raise VideoTranscriptError(video.video_id, e) from e
+
+        transcript_chunks = chunk_transcript(
+            snippets,
+            max_tokens=TRANSCRIPT_CHUNK_TOKENS,
+            overlap_tokens=TRANSCRIPT_CHUNK_OVERLAP_TOKENS,
+        )
+        for transcript_chunk in transcript_chunks:
+            transcript_chunk.metadata.update(
+                {
+                    "source": f"https://www.youtube.com/watch?v={video.video_id}"
+                    f"&t={int(transcript_chunk.metadata['start_seconds'])}s",
+                    "source_type": "video",
+                    "video_id": video.video_id,
+                    "video_title": video.title,
+                    "video_position": video.position,
+                    "playlist_id": self.yt_playlist_id,
+                    "playlist_title": self.yt_playlist.title,
+                }
+            )
+
+        video.transcript = transcript_chunks
+        return video
+
+    def _transcript_fetcher(
+        self, max_concurrency: int, rate_limit: float, rate_period: float
+    ) -> Callable[[YoutubeVideo], Awaitable[YoutubeVideo]]:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        if rate_limit < 1:
+            # AsyncLimiter rejects acquiring more than its capacity, so one
+            # request per (rate_period / rate_limit) seconds instead
+            rate_limit, rate_period = 1, rate_period / rate_limit
+        limiter = AsyncLimiter(rate_limit, rate_period)
+
+        async def fetch(video: YoutubeVideo) -> YoutubeVideo:
+            async with semaphore, limiter:
+                return await asyncio.to_thread(self._load_video_transcript, video)
+
+        return fetch
+
+    @staticmethod
+    async def _gather_transcripts(tasks: list[asyncio.Task]):
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def load_transcript_videos(
+        self,
+        videos: list[YoutubeVideo] | None = None,
+        max_concurrency: int = TRANSCRIPT_MAX_CONCURRENCY,
+        rate_limit: float = TRANSCRIPT_RATE_LIMIT,
+        rate_period: float = TRANSCRIPT_RATE_PERIOD,
+    ):
+        """
+        Fetch the transcripts of the loaded playlist videos concurrently.
+
+        Only `videos` are fetched when given, otherwise every loaded video.
+        At most `max_concurrency` blocking loads run at once, each in a worker
+        thread, and new loads start at no more than `rate_limit` per
+        `rate_period` seconds. Videos keep their playlist order.
+        """
+        if videos is None:
+            videos = self.yt_playlist.videos
+
+        fetch = self._transcript_fetcher(max_concurrency, rate_limit, rate_period)
+        tasks = [asyncio.create_task(fetch(video)) for video in videos]
+        await self._gather_transcripts(tasks)
+
+        return self
+
+    async def load_videos_with_transcripts(
+        self,
+        max_concurrency: int = TRANSCRIPT_MAX_CONCURRENCY,
+        rate_limit: float = TRANSCRIPT_RATE_LIMIT,
+        rate_period: float = TRANSCRIPT_RATE_PERIOD,
+    ):
+        """
+        Stream the playlist listing and start fetching each video's transcript
+        as soon as its page arrives, instead of waiting for the full listing.
+        """
+        fetch = self._transcript_fetcher(max_concurrency, rate_limit, rate_period)
+        tasks = []
+        try:
+            async for video in self.stream_video_details():
+                tasks.append(asyncio.create_task(fetch(video)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        await self._gather_transcripts(tasks)
 
         return self
 
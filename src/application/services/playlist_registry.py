@@ -0,0 +1,138 @@
+from datetime import timedelta
+
+from sqlmodel import Session, delete, func, select
+
+from src.domain.models import IndexedPlaylist, IndexedVideo
+from src.domain.models.Registry import utc_now
+from src.infrastructure.config import EMBEDDING_MODEL, TRANSCRIPT_CHUNKER, get_engine
+
+
+class PlaylistRegistry:
+    """
+    Index of ingested playlists and videos kept in the chats database.
+
+    Existence, freshness and stored-video lookups hit indexed rows here
+    instead of scanning the vector store's metadata.
+    """
+
+    def __init__(self, engine=None):
+        self._engine = engine
+
+    @property
+    def engine(self):
+        # Resolved on first query, so creating the module-level registry
+        # does not open the database at import time
+        if self._engine is None:
+            self._engine = get_engine()
+        return self._engine
+
+    def get_playlist(self, playlist_id: str) -> IndexedPlaylist | None:
+        with Session(self.engine) as session:
+            query = select(IndexedPlaylist).where(
+                IndexedPlaylist.playlist_id == playlist_id
+            )
+            return session.exec(query).first()
+
+    def exists(self, playlist_id: str) -> bool:
+        playlist = self.get_playlist(playlist_id)
+        return playlist is not None and playlist.chunks_count > 0
+
+    def is_fresh(self, playlist_id: str, max_age: timedelta | None = None) -> bool:
+        playlist = self.get_playlist(playlist_id)
+        if playlist is None or playlist.chunks_count == 0:
+            return False
+        if playlist.embedding_model != EMBEDDING_MODEL:
+            return False
+        if self.get_outdated_video_ids(playlist_id):
+            return False
+        if max_age is not None and utc_now() - playlist.updated_at > max_age:
+            return False
+        return True
+
+    def get_video_ids(self, playlist_id: str) -> set[str]:
+        with Session(self.engine) as session:
+            query = select(IndexedVideo.video_id).where(
+                IndexedVideo.playlist_id == playlist_id
+            )
+            return set(session.exec(query).all())
+
+    def get_outdated_video_ids(self, playlist_id: str) -> set[str]:
+        """Videos not chunked with the current TRANSCRIPT_CHUNKER settings."""
+        with Session(self.engine) as session:
+            query = select(IndexedVideo.video_id).where(
+                IndexedVideo.playlist_id == playlist_id,
+                func.coalesce(IndexedVideo.chunker, "") != TRANSCRIPT_CHUNKER,
+            )
+            return set(session.exec(query).all())
+
+    def record_videos(
+        self,
+        playlist_id: str,
+        chunks_per_video: dict[str, int],
+        title: str | None = None,
+        chunker: str | None = TRANSCRIPT_CHUNKER,
+    ) -> None:
+        with Session(self.engine) as session:
+            existing = {
+                video.video_id: video
+                for video in session.exec(
+                    select(IndexedVideo).where(
+                        IndexedVideo.playlist_id == playlist_id,
+                        IndexedVideo.video_id.in_(list(chunks_per_video)),
+                    )
+                ).all()
+            }
+
+            for video_id, chunks_count in chunks_per_video.items():
+                video = existing.get(video_id) or IndexedVideo(
+                    playlist_id=playlist_id, video_id=video_id
+                )
+                video.chunks_count = chunks_count
+                video.chunker = chunker
+                video.ingested_at = utc_now()
+                session.add(video)
+
+            self._refresh_playlist(session, playlist_id, title)
+            session.commit()
+
+    def remove_videos(self, playlist_id: str, video_ids: set[str]) -> None:
+        with Session(self.engine) as session:
+            if video_ids:
+                session.execute(
+                    delete(IndexedVideo).where(
+                        IndexedVideo.playlist_id == playlist_id,
+                        IndexedVideo.video_id.in_(list(video_ids)),
+                    )
+                )
+            self._refresh_playlist(session, playlist_id)
+            session.commit()
+
+    def touch(self, playlist_id: str, title: str | None = None) -> None:
+        with Session(self.engine) as session:
+            self._refresh_playlist(session, playlist_id, title)
+            session.commit()
+
+    def _refresh_playlist(
+        self, session: Session, playlist_id: str, title: str | None = None
+    ) -> None:
+        session.flush()
+        videos_count, chunks_count = session.exec(
+            select(
+                func.count(IndexedVideo.id),
+                func.coalesce(func.sum(IndexedVideo.chunks_count), 0),
+            ).where(IndexedVideo.playlist_id == playlist_id)
+        ).one()
+
+        playlist = session.exec(
+            select(IndexedPlaylist).where(IndexedPlaylist.playlist_id == playlist_id)
+        ).first() or IndexedPlaylist(
+            playlist_id=playlist_id, embedding_model=EMBEDDING_MODEL
+        )
+
+        if title:
+            playlist.title = title
+        playlist.embedding_model = EMBEDDING_MODEL
+        playlist.videos_count = videos_count
+        playlist.chunks_count = chunks_count
+        playlist.updated_at = utc_now()
+        session.add(playlist)
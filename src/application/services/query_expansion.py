@@ -0,0 +1,179 @@
+import asyncio
+import hashlib
+import json
+import re
+from datetime import timedelta
+
+from langchain_core.runnables import Runnable, RunnableLambda
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, select
+
+from src.domain.models import QueryVariantEntry
+from src.domain.models.Registry import utc_now
+from src.infrastructure.config import (
+    QUERY_MODEL,
+    QUERY_EXPANSION_MIN_WORDS,
+    QUERY_VARIANT_CACHE_TTL_SECONDS,
+    get_engine,
+)
+from src.infrastructure.telemetry import telemetry
+
+WORD_PATTERN = re.compile(r"[\w'`\".:()\-/]+")
+QUOTED_PATTERN = re.compile(r"[\"`“].+?[\"`”]")
+TERM_PATTERN = re.compile(
+    r"""
+    \w+\(\)            # call: map()
+    | \w+(?:\.\w+)+    # dotted path: os.path
+    | \w+::\w+         # scoped name: std::vector
+    | --?\w[\w-]*      # flag: --force
+    | \w*_\w+          # snake_case
+    | [a-z]+[A-Z]\w*   # camelCase
+    | [A-Z]{2,}\w*     # acronym: HTTP, JSON
+    """,
+    re.VERBOSE,
+)
+
+
+def normalize_question(question: str) -> str:
+    normalized = re.sub(r"\s+", " ", question.strip().lower())
+    return normalized.rstrip("?!. ")
+
+
+def should_expand_query(question: str, min_words: int = QUERY_EXPANSION_MIN_WORDS) -> bool:
+    """
+    Cheap check for whether a question benefits from LLM query expansion.
+
+    Short questions, quoted phrases and questions made mostly of exact terms
+    (identifiers, flags, acronyms) are searched as-is: rewriting them only
+    dilutes the keyword match.
+    """
+    words = WORD_PATTERN.findall(question)
+    if len(words) < min_words:
+        return False
+    if QUOTED_PATTERN.search(question):
+        return False
+
+    terms = [word for word in words if TERM_PATTERN.fullmatch(word.strip("?!.,"))]
+    return len(terms) * 2 < len(words)
+
+
+class QueryVariantCache:
+    """Persistent cache of generated query variants per playlist and question."""
+
+    def __init__(self, engine=None, ttl_seconds: int = QUERY_VARIANT_CACHE_TTL_SECONDS):
+        self.engine = engine or get_engine()
+        self.ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else None
+
+    @staticmethod
+    def make_key(playlist_id: str, question: str) -> str:
+        raw_key = f"{QUERY_MODEL}\0{playlist_id}\0{normalize_question(question)}"
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def get(self, playlist_id: str, question: str) -> list[str] | None:
+        cache_key = self.make_key(playlist_id, question)
+        with Session(self.engine) as session:
+            entry = session.exec(
+                select(QueryVariantEntry).where(QueryVariantEntry.cache_key == cache_key)
+            ).first()
+
+            if entry is None:
+                return None
+
+            if self.ttl is not None and utc_now() - entry.created_at > self.ttl:
+                session.delete(entry)
+                session.commit()
+                return None
+
+            entry.hits += 1
+            session.add(entry)
+            session.commit()
+
+            return json.loads(entry.variants)
+
+    def put(self, playlist_id: str, question: str, variants: list[str]) -> None:
+        cache_key = self.make_key(playlist_id, question)
+        serialized = json.dumps(variants)
+        created_at = utc_now()
+        # Upsert, so the same question expanded twice at once does not conflict
+        statement = insert(QueryVariantEntry).values(
+            cache_key=cache_key,
+            playlist_id=playlist_id,
+            question=question,
+            variants=serialized,
+            hits=0,
+            created_at=created_at,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[QueryVariantEntry.cache_key],
+            set_={"variants": serialized, "created_at": created_at},
+        )
+        with Session(self.engine) as session:
+            session.execute(statement)
+            session.commit()
+
+
+def record_lookup(cached_variants: list[str] | None) -> None:
+    telemetry.increment(
+        "cache_lookups",
+        cache="query_variant",
+        result="miss" if cached_variants is None else "hit",
+    )
+
+
+class QueryExpander:
+    """Multi-query generation with an adaptive bypass and a persistent variant cache."""
+
+    def __init__(
+        self,
+        query_chain: Runnable,
+        playlist_id: str,
+        cache: QueryVariantCache | None = None,
+    ):
+        self.query_chain = query_chain
+        self.playlist_id = playlist_id
+        self.cache = cache
+
+    def expand(self, question: str) -> list[str]:
+        if not should_expand_query(question):
+            return []
+
+        if self.cache is not None:
+            cached_variants = self.cache.get(self.playlist_id, question)
+            record_lookup(cached_variants)
+            if cached_variants is not None:
+                return cached_variants
+
+        variants = self.query_chain.invoke({"question": question})
+        if self.cache is not None:
+            try:
+                self.cache.put(self.playlist_id, question, variants)
+            except Exception as e:
+                print(f"Error caching query variants: {e}")
+        return variants
+
+    async def aexpand(self, question: str) -> list[str]:
+        if not should_expand_query(question):
+            return []
+
+        if self.cache is not None:
+            cached_variants = await asyncio.to_thread(
+                self.cache.get, self.playlist_id, question
+            )
+            record_lookup(cached_variants)
+            if cached_variants is not None:
+                return cached_variants
+
+        variants = await self.query_chain.ainvoke({"question": question})
+        if self.cache is not None:
+            try:
+                await asyncio.to_thread(self.cache.put, self.playlist_id, question, variants)
+            except Exception as e:
+                # The variants are already generated; retrieval goes on without caching
+                print(f"Error caching query variants: {e}")
+        return variants
+
+    def as_runnable(self) -> Runnable:
+        async def aexpand(inputs: dict) -> list[str]:
+            return await self.aexpand(inputs["question"])
+
+        return RunnableLambda(lambda inputs: self.expand(inputs["question"]), afunc=aexpand)
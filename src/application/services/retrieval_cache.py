@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Sequence, TypedDict
+
+import numpy as np
+from langchain_core.documents import Document
+
+from src.infrastructure.config import (
+    EMBEDDING_MODEL,
+    RETRIEVAL_CACHE_MAX_ENTRIES,
+    RETRIEVAL_CACHE_SIMILARITY_THRESHOLD,
+    RETRIEVAL_CACHE_TTL_SECONDS,
+)
+
+
+class RetrievalCacheStats(TypedDict):
+    hits: int
+    misses: int
+    hit_rate: float
+    entries: int
+    latency_saved_seconds: float
+
+
+@dataclass
+class RetrievalCacheEntry:
+    question: str
+    embedding: np.ndarray
+    documents: list[Document]
+    retrieval_seconds: float
+    created_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class RetrievalCacheHit:
+    entry: RetrievalCacheEntry
+    similarity: float
+
+
+class SemanticRetrievalCache:
+    """In-process cache reusing the retrieval results of semantically similar questions."""
+
+    def __init__(
+        self,
+        threshold: float = RETRIEVAL_CACHE_SIMILARITY_THRESHOLD,
+        max_entries: int = RETRIEVAL_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = RETRIEVAL_CACHE_TTL_SECONDS,
+        embedding_model: str = EMBEDDING_MODEL,
+    ):
+        self.threshold = threshold
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.embedding_model = embedding_model
+        self._scopes: dict[tuple[str, str], OrderedDict[int, RetrievalCacheEntry]] = {}
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved = 0.0
+
+    def _scope(self, playlist_id: str) -> OrderedDict[int, RetrievalCacheEntry]:
+        return self._scopes.setdefault((playlist_id, self.embedding_model), OrderedDict())
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _expire(self, entries: OrderedDict[int, RetrievalCacheEntry]) -> None:
+        if not self.ttl_seconds:
+            return
+        now = time.monotonic()
+        expired = [
+            key
+            for key, entry in entries.items()
+            if now - entry.created_at > self.ttl_seconds
+        ]
+        for key in expired:
+            del entries[key]
+
+    def get(
+        self,
+        playlist_id: str,
+        embedding: Sequence[float],
+        lookup_seconds: float = 0.0,
+    ) -> RetrievalCacheHit | None:
+        """
+        Return the most similar live entry of the playlist, if close enough.
+
+        `lookup_seconds` is the time spent getting here (e.g. embedding the
+        question) and is subtracted from the latency a hit saves.
+        """
+        started_at = time.perf_counter()
+        vector = self._normalize(embedding)
+
+        with self._lock:
+            entries = self._scope(playlist_id)
+            self._expire(entries)
+
+            best_key, best_similarity = None, -1.0
+            if entries:
+                keys = list(entries)
+                matrix = np.stack([entries[key].embedding for key in keys])
+                similarities = matrix @ vector
+                best = int(np.argmax(similarities))
+                best_key, best_similarity = keys[best], float(similarities[best])
+
+            if best_key is None or best_similarity < self.threshold:
+                self.misses += 1
+                return None
+
+            entries.move_to_end(best_key)
+            entry = entries[best_key]
+            self.hits += 1
+            overhead = lookup_seconds + time.perf_counter() - started_at
+            self.latency_saved += max(0.0, entry.retrieval_seconds - overhead)
+
+            return RetrievalCacheHit(entry=entry, similarity=best_similarity)
+
+    def put(
+        self,
+        playlist_id: str,
+        question: str,
+        embedding: Sequence[float],
+        documents: list[Document],
+        retrieval_seconds: float,
+    ) -> None:
+        entry = RetrievalCacheEntry(
+            question=question,
+            embedding=self._normalize(embedding),
+            documents=list(documents),
+            retrieval_seconds=retrieval_seconds,
+        )
+
+        with self._lock:
+            entries = self._scope(playlist_id)
+            entries[self._next_key] = entry
+            self._next_key += 1
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def invalidate(self, playlist_id: str) -> None:
+        with self._lock:
+            for scope in [scope for scope in self._scopes if scope[0] == playlist_id]:
+                del self._scopes[scope]
+
+    def stats(self) -> RetrievalCacheStats:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": sum(len(entries) for entries in self._scopes.values()),
+            "latency_saved_seconds": self.latency_saved,
+        }
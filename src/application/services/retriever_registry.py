@@ -0,0 +1,124 @@
+import asyncio
+from collections import OrderedDict
+from typing import Callable, Generic, TypedDict, TypeVar
+
+from src.infrastructure.config import RETRIEVER_REGISTRY_MEMORY_BUDGET_MB
+
+T = TypeVar("T")
+
+
+class RetrieverRegistryStats(TypedDict):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    memory_bytes: int
+    budget_bytes: int
+
+
+def estimate_memory_bytes(value) -> int:
+    """Memory reported by the value itself, or by its `retriever` attribute."""
+    for candidate in (value, getattr(value, "retriever", None)):
+        if hasattr(candidate, "memory_bytes"):
+            return candidate.memory_bytes()
+    return 0
+
+
+def release(value) -> None:
+    for candidate in (value, getattr(value, "retriever", None)):
+        if hasattr(candidate, "release"):
+            candidate.release()
+            return
+
+
+class RetrieverRegistry(Generic[T]):
+    """
+    Lazily built, shared retriever stacks keyed by playlist.
+
+    `factory` builds a playlist's entry (a retriever, or anything exposing
+    one as `.retriever`) on first use, off the event loop; concurrent first
+    requests for a playlist share one build. Entries report their footprint
+    through `memory_bytes()`, and once the total exceeds the memory budget
+    the least recently used playlists are evicted and released.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], T],
+        memory_budget_bytes: int = RETRIEVER_REGISTRY_MEMORY_BUDGET_MB * 1024 * 1024,
+        size_of: Callable[[T], int] = estimate_memory_bytes,
+        on_evict: Callable[[T], None] = release,
+    ):
+        self.factory = factory
+        self.memory_budget_bytes = memory_budget_bytes
+        self.size_of = size_of
+        self.on_evict = on_evict
+        self._entries: OrderedDict[str, T] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._builds: dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def peek(self, key: str) -> T | None:
+        return self._entries.get(key)
+
+    async def get(self, key: str) -> T:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            # Indexes grow on re-sync, so sizes are refreshed on use.
+            self._sizes[key] = self.size_of(entry)
+            self._evict()
+            return entry
+
+        build = self._builds.get(key)
+        if build is None:
+            self.misses += 1
+            build = asyncio.ensure_future(self._build(key))
+            build.add_done_callback(lambda _: self._builds.pop(key, None))
+            self._builds[key] = build
+        else:
+            self.hits += 1
+
+        # Shielded so a cancelled request does not abort a build others wait on.
+        return await asyncio.shield(build)
+
+    async def _build(self, key: str) -> T:
+        entry = await asyncio.to_thread(self.factory, key)
+        self._entries[key] = entry
+        self._sizes[key] = self.size_of(entry)
+        self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        while self.memory_bytes() > self.memory_budget_bytes and len(self._entries) > 1:
+            self.remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        self._sizes.pop(key, None)
+        if entry is not None:
+            self.on_evict(entry)
+
+    def memory_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def stats(self) -> RetrieverRegistryStats:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "memory_bytes": self.memory_bytes(),
+            "budget_bytes": self.memory_budget_bytes,
+        }
@@ -0,0 +1,108 @@
+import asyncio
+import sys
+import time
+from typing import AsyncIterator, Awaitable, Callable, TypedDict
+
+TokenCallback = Callable[[str], Awaitable[None]]
+
+
+class GenerationMetrics(TypedDict):
+    time_to_first_token: float | None
+    total_seconds: float
+    tokens: int
+    input_tokens: int
+    tokens_per_second: float
+    cached: bool
+
+
+class TokenStream:
+    """
+    Bounded async channel between a generation and its consumer.
+
+    The generation awaits the stream as a callback for every token; a
+    consumer (an SSE response, a UI) iterates it with `async for`. Once
+    `max_pending` tokens are buffered the producer waits, so a slow client
+    slows the generation down instead of growing memory.
+    """
+
+    _DONE = object()
+
+    def __init__(self, max_pending: int = 64):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_pending))
+        self._closed = False
+
+    async def __call__(self, token: str) -> None:
+        if self._closed:
+            raise RuntimeError("TokenStream is closed")
+        await self._queue.put(token)
+
+    async def aclose(self) -> None:
+        # Never blocks, so a cancelled producer can always close the stream;
+        # when the buffer is full the consumer stops once it has drained it.
+        if not self._closed:
+            self._closed = True
+            try:
+                self._queue.put_nowait(self._DONE)
+            except asyncio.QueueFull:
+                pass
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[str]:
+        while True:
+            if self._closed and self._queue.empty():
+                return
+            token = await self._queue.get()
+            if token is self._DONE:
+                return
+            yield token
+
+
+async def print_token(token: str) -> None:
+    sys.stdout.write(token)
+    sys.stdout.flush()
+
+
+class GenerationTimer:
+    """Tracks time-to-first-token and throughput of one generation."""
+
+    def __init__(self, cached: bool = False):
+        self.cached = cached
+        self.started_at = time.perf_counter()
+        self.first_token_at: float | None = None
+        self.tokens = 0
+        self.input_tokens = 0
+
+    def record(self, token: str) -> None:
+        if not token:
+            return
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.tokens += 1
+
+    def set_token_count(self, tokens: int) -> None:
+        """Replace the chunk count with the provider-reported output tokens."""
+        self.tokens = tokens
+
+    def set_input_token_count(self, tokens: int) -> None:
+        self.input_tokens = tokens
+
+    def metrics(self) -> GenerationMetrics:
+        total = time.perf_counter() - self.started_at
+        ttft = (
+            self.first_token_at - self.started_at
+            if self.first_token_at is not None
+            else None
+        )
+        streaming_seconds = total - (ttft or 0.0)
+        return {
+            "time_to_first_token": ttft,
+            "total_seconds": total,
+            "tokens": self.tokens,
+            "input_tokens": self.input_tokens,
+            "tokens_per_second": (
+                self.tokens / streaming_seconds if streaming_seconds > 0 else 0.0
+            ),
+            "cached": self.cached,
+        }
@@ -0,0 +1,89 @@
+import time
+import uuid
+from typing import Iterable, Iterator, TypedDict
+
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+
+from src.domain.models import YoutubeVideo
+from src.infrastructure.config import EMBEDDING_BATCH_SIZE
+
+
+class WriteStats(TypedDict):
+    chunks: int
+    batches: int
+    seconds: float
+    chunks_per_second: float
+
+
+def make_chunk_id(playlist_id: str, video_id: str, start_seconds: float | int) -> str:
+    return str(
+        uuid.uuid5(
+            uuid.NAMESPACE_URL, f"{playlist_id}/{video_id}/{float(start_seconds):.3f}"
+        )
+    )
+
+
+class TranscriptWriter:
+    """
+    Writes transcript chunks to the vector store in provider-sized batches.
+
+    Chunks from consecutive videos are grouped into batches of `batch_size`
+    and upserted under IDs derived from (playlist_id, video_id,
+    start_seconds), so re-running an interrupted ingestion overwrites the
+    chunks it already wrote instead of duplicating them.
+    """
+
+    def __init__(
+        self,
+        vector_store: Chroma,
+        playlist_id: str,
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+    ):
+        self.vector_store = vector_store
+        self.playlist_id = playlist_id
+        self.batch_size = max(1, batch_size)
+
+    def iter_batches(self, videos: Iterable[YoutubeVideo]) -> Iterator[dict[str, Document]]:
+        batch: dict[str, Document] = {}
+        for video in videos:
+            for chunk in video.transcript:
+                chunk_id = make_chunk_id(
+                    self.playlist_id,
+                    video.video_id,
+                    chunk.metadata.get("start_seconds", 0),
+                )
+                chunk.id = chunk_id
+                batch[chunk_id] = chunk
+
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = {}
+
+        if batch:
+            yield batch
+
+    def write(self, videos: Iterable[YoutubeVideo]) -> WriteStats:
+        started_at = time.perf_counter()
+        chunks = 0
+        batches = 0
+
+        for batch in self.iter_batches(videos):
+            self.vector_store.add_documents(list(batch.values()), ids=list(batch))
+            chunks += len(batch)
+            batches += 1
+
+        seconds = time.perf_counter() - started_at
+        stats: WriteStats = {
+            "chunks": chunks,
+            "batches": batches,
+            "seconds": seconds,
+            "chunks_per_second": chunks / seconds if seconds > 0 else 0.0,
+        }
+
+        print(
+            f"Saved {chunks} chunks in {batches} batches of up to {self.batch_size} "
+            f"({stats['chunks_per_second']:.1f} chunks/s)"
+        )
+
+        return stats
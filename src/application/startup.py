@@ -0,0 +1,138 @@
+import asyncio
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib import import_module
+from typing import Any, Callable
+
+# Imported in this order on the warmup thread; each one is timed separately
+# so the import report shows which dependency dominates startup.
+HEAVY_MODULES = (
+    "langchain_core.runnables",
+    "langgraph.graph",
+    "langchain_chroma",
+    "langchain_classic.chat_models",
+    "langchain_community.document_loaders.youtube",
+    "langchain_voyageai",
+    "googleapiclient.discovery",
+    "src.application.graph.builder",
+)
+
+HELPERS_MODULE = "src.application.graph.helpers"
+PLAYLIST_LOADER_MODULE = "src.application.services.playlist_loader"
+
+
+def call(module: str, name: str) -> Any:
+    return getattr(import_module(module), name)()
+
+
+class Warmup:
+    """
+    Runs startup steps in order on one background thread.
+
+    Heavy imports and client construction happen while the main thread is
+    blocked on `input()`, and `result()` only waits for a step that has not
+    finished yet. A single worker keeps imports sequential, since parallel
+    imports would just contend on the import lock. Step durations are kept
+    for the import report.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="warmup")
+        self._futures: dict[str, Future] = {}
+        self.timings: dict[str, float] = {}
+
+    def submit(self, name: str, func: Callable, *args) -> None:
+        def run():
+            started_at = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.timings[name] = time.perf_counter() - started_at
+
+        self._futures[name] = self._executor.submit(run)
+
+    async def result(self, name: str) -> Any:
+        return await asyncio.wrap_future(self._futures[name])
+
+    async def wait(self) -> None:
+        await asyncio.gather(
+            *(asyncio.wrap_future(future) for future in self._futures.values()),
+            return_exceptions=True,
+        )
+
+    def errors(self) -> dict[str, BaseException]:
+        return {
+            name: future.exception()
+            for name, future in self._futures.items()
+            if future.done() and not future.cancelled() and future.exception()
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def start_warmup() -> Warmup:
+    warmup = Warmup()
+    for module in HEAVY_MODULES:
+        warmup.submit(f"import {module}", import_module, module)
+    warmup.submit("init_vector_db", call, HELPERS_MODULE, "init_vector_db")
+    warmup.submit("query model", call, HELPERS_MODULE, "get_query_model")
+    warmup.submit("generation chain", call, HELPERS_MODULE, "get_llm_chain")
+    warmup.submit("youtube client", call, PLAYLIST_LOADER_MODULE, "build_youtube_client")
+    return warmup
+
+
+def print_import_report(warmup: Warmup, time_to_prompt: float) -> None:
+    errors = warmup.errors()
+    width = max(len(name) for name in warmup.timings) if warmup.timings else 0
+
+    lines = [f"{'time to prompt':<{width}}  {time_to_prompt:7.3f}s", ""]
+    for name, seconds in warmup.timings.items():
+        suffix = f"  ({type(errors[name]).__name__})" if name in errors else ""
+        lines.append(f"{name:<{width}}  {seconds:7.3f}s{suffix}")
+    lines.append(f"{'warmup total':<{width}}  {sum(warmup.timings.values()):7.3f}s")
+
+    print("\n".join(["", "Startup report", "=" * 14, *lines, ""]), file=sys.stderr)
+
+
+async def run_interactive(started_at: float | None = None, import_report: bool = False):
+    """
+    Fast-start interactive session.
+
+    The playlist prompt is shown as soon as the light URL parser is
+    imported; LangChain, Chroma, the model clients and the YouTube client
+    are loaded on the warmup thread in the meantime and handed to `main`.
+    """
+    started_at = started_at if started_at is not None else time.perf_counter()
+    # Light, and validates the environment before the user types anything
+    import src.infrastructure.config  # noqa: F401
+
+    warmup = start_warmup()
+    try:
+        from src.application.graph.playlist_url import get_playlist_id
+
+        time_to_prompt = time.perf_counter() - started_at
+        playlist_id = get_playlist_id()
+
+        vector_store, query_llm, llm_chain, yt_client = await asyncio.gather(
+            warmup.result("init_vector_db"),
+            warmup.result("query model"),
+            warmup.result("generation chain"),
+            warmup.result("youtube client"),
+        )
+        if import_report:
+            await warmup.wait()
+            print_import_report(warmup, time_to_prompt)
+
+        from src.application.graph.builder import main
+
+        await main(
+            vector_store=vector_store,
+            playlist_id=playlist_id,
+            query_llm=query_llm,
+            llm_chain=llm_chain,
+            yt_client=yt_client,
+        )
+    finally:
+        warmup.shutdown()
@@ -20,6 +20,8 @@ from .llm import (
     LLMInitializationError,
     LLMStreamError,
 )
+from .server import ServerBusyError
+from .batch import InvalidBatchInputError
 
 __all__ = [
     # Playlist
@@ -41,4 +43,8 @@ __all__ = [
     "InvalidEmbeddingModelError",
     "LLMInitializationError",
     "LLMStreamError",
+    # Server
+    "ServerBusyError",
+    # Batch
+    "InvalidBatchInputError",
 ]
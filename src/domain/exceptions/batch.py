@@ -0,0 +1,8 @@
+class InvalidBatchInputError(ValueError):
+    """A line of the batch questions file could not be read."""
+
+    def __init__(self, path: str, line_number: int, reason: str):
+        super().__init__(f"{path}:{line_number}: {reason}")
+        self.path = path
+        self.line_number = line_number
+        self.reason = reason
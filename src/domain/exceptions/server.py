@@ -0,0 +1,9 @@
+class ServerBusyError(RuntimeError):
+    """The server has no free slot or queue position for the request."""
+
+    def __init__(self, active: int, queued: int):
+        super().__init__(
+            f"Server is busy ({active} requests running, {queued} queued)"
+        )
+        self.active = active
+        self.queued = queued
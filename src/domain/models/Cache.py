@@ -0,0 +1,23 @@
+from datetime import datetime
+from sqlmodel import Field, SQLModel
+from src.domain.models.Registry import utc_now
+
+
+class QueryVariantEntry(SQLModel, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    cache_key: str = Field(index=True, unique=True)
+    playlist_id: str = Field(index=True)
+    question: str
+    variants: str
+    hits: int = 0
+    created_at: datetime = Field(default_factory=utc_now)
+
+
+class AnswerEntry(SQLModel, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    cache_key: str = Field(index=True, unique=True)
+    playlist_id: str = Field(index=True)
+    question: str
+    answer: str
+    hits: int = 0
+    created_at: datetime = Field(default_factory=utc_now)
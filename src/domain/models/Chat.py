@@ -25,6 +25,8 @@ class Chat(SQLModel, table=True):
     chat_id: UUID = Field(index=True, unique=True)
     title: str | None = None
     pruned_history_summary: str | None = None
+    # Messages already folded into pruned_history_summary, oldest first
+    summarized_messages_count: int = 0
     messages_count: int = 0
 
     messages: list[Message] = Relationship(back_populates="chat")
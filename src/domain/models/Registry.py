@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+from sqlmodel import Field, SQLModel, UniqueConstraint
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class IndexedPlaylist(SQLModel, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    playlist_id: str = Field(index=True, unique=True)
+    title: str | None = None
+    embedding_model: str
+    videos_count: int = 0
+    chunks_count: int = 0
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+
+class IndexedVideo(SQLModel, table=True):
+    __table_args__ = (UniqueConstraint("playlist_id", "video_id"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+    playlist_id: str = Field(index=True)
+    video_id: str = Field(index=True)
+    chunks_count: int = 0
+    # TRANSCRIPT_CHUNKER the chunks were cut with; None when unknown
+    chunker: str | None = None
+    ingested_at: datetime = Field(default_factory=utc_now)
@@ -1,4 +1,16 @@
 from src.domain.models.youtube import YoutubeVideo, YoutubePlaylist
 from src.domain.models.Chat import Chat, Message, ChatPreference
+from src.domain.models.Registry import IndexedPlaylist, IndexedVideo
+from src.domain.models.Cache import QueryVariantEntry, AnswerEntry
 
-__all__ = ["YoutubeVideo", "YoutubePlaylist", "Chat", "Message", "ChatPreference"]
+__all__ = [
+    "YoutubeVideo",
+    "YoutubePlaylist",
+    "Chat",
+    "Message",
+    "ChatPreference",
+    "IndexedPlaylist",
+    "IndexedVideo",
+    "QueryVariantEntry",
+    "AnswerEntry",
+]
@@ -5,24 +5,86 @@ from src.infrastructure.config.config import (
     LANG,
     PROXY_USER,
     PROXY_PASS,
+    TRANSCRIPT_MAX_CONCURRENCY,
+    TRANSCRIPT_RATE_LIMIT,
+    TRANSCRIPT_RATE_PERIOD,
+    PLAYLIST_SYNC_MODE,
+    PLAYLIST_SYNC_MAX_AGE_SECONDS,
+    TRANSCRIPT_CHUNK_TOKENS,
+    TRANSCRIPT_CHUNK_OVERLAP_TOKENS,
+    TRANSCRIPT_CHUNKER,
+    ENABLE_TRANSCRIPT_CACHE,
+    TRANSCRIPT_CACHE_DIR,
+    TRANSCRIPT_CACHE_MAX_MB,
+    TRANSCRIPT_CACHE_TTL_SECONDS,
     PERSIST_DIR,
+    BM25_INDEX_DIR,
     LLM_PROVIDER,
     QUERY_MODEL,
     GENERATION_MODEL,
     EMBEDDING_PROVIDER,
     EMBEDDING_MODEL,
+    ENABLE_EMBEDDING_CACHE,
+    EMBEDDING_CACHE_PATH,
+    EMBEDDING_BATCH_SIZE,
     SEARCH_TYPE,
     MMR_DIVERSITY_LAMBDA,
     MMR_FETCH_K,
     SEARCH_K,
     ENABLE_HYBRID_SEARCH,
+    QUERY_EXPANSION_MIN_WORDS,
+    ENABLE_QUERY_VARIANT_CACHE,
+    QUERY_VARIANT_CACHE_TTL_SECONDS,
+    ENABLE_RETRIEVAL_CACHE,
+    RETRIEVAL_CACHE_SIMILARITY_THRESHOLD,
+    RETRIEVAL_CACHE_MAX_ENTRIES,
+    RETRIEVAL_CACHE_TTL_SECONDS,
+    ENABLE_ANSWER_CACHE,
+    ANSWER_CACHE_INCLUDE_HISTORY,
+    ANSWER_CACHE_TTL_SECONDS,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_MAX_CONCURRENT_REQUESTS,
+    SERVER_MAX_QUEUED_REQUESTS,
+    SERVER_QUEUE_TIMEOUT_SECONDS,
+    SERVER_MAX_CONCURRENT_INGESTS,
+    RETRIEVER_REGISTRY_MEMORY_BUDGET_MB,
+    BATCH_MAX_CONCURRENCY,
+    TELEMETRY_ENABLED,
+    TELEMETRY_OTLP_PATH,
+    TELEMETRY_MAX_SPANS,
     CHATS_DIR,
     MAX_MSG_SUMMARY,
     CHAT_STATE_DIR,
+    CHECKPOINT_KEEP_LAST,
+    CHECKPOINT_COMPACTION_IDLE_SECONDS,
+    CHECKPOINT_COMPACTION_INTERVAL_SECONDS,
     DEFAULT_CHAT_ID,
+    DB_ECHO,
+    CHATS_DB_POOL_SIZE,
+    CHATS_DB_FLUSH_INTERVAL_SECONDS,
 )
 
-from src.infrastructure.config.database import engine as ENGINE
+
+def get_engine():
+    # Imported on first use: sqlmodel and the table definitions are not needed
+    # until something touches the chats database.
+    from src.infrastructure.config.database import get_engine as _get_engine
+
+    return _get_engine()
+
+
+def get_async_engine():
+    from src.infrastructure.config.database import get_async_engine as _get_async_engine
+
+    return _get_async_engine()
+
+
+def __getattr__(name: str):
+    if name == "ENGINE":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "GOOGLE_API_KEY",
@@ -31,20 +93,65 @@ __all__ = [
     "LANG",
     "PROXY_USER",
     "PROXY_PASS",
+    "TRANSCRIPT_MAX_CONCURRENCY",
+    "TRANSCRIPT_RATE_LIMIT",
+    "TRANSCRIPT_RATE_PERIOD",
+    "PLAYLIST_SYNC_MODE",
+    "PLAYLIST_SYNC_MAX_AGE_SECONDS",
+    "TRANSCRIPT_CHUNK_TOKENS",
+    "TRANSCRIPT_CHUNK_OVERLAP_TOKENS",
+    "TRANSCRIPT_CHUNKER",
+    "ENABLE_TRANSCRIPT_CACHE",
+    "TRANSCRIPT_CACHE_DIR",
+    "TRANSCRIPT_CACHE_MAX_MB",
+    "TRANSCRIPT_CACHE_TTL_SECONDS",
     "PERSIST_DIR",
+    "BM25_INDEX_DIR",
     "LLM_PROVIDER",
     "QUERY_MODEL",
     "GENERATION_MODEL",
     "EMBEDDING_PROVIDER",
     "EMBEDDING_MODEL",
+    "ENABLE_EMBEDDING_CACHE",
+    "EMBEDDING_CACHE_PATH",
+    "EMBEDDING_BATCH_SIZE",
     "SEARCH_TYPE",
     "MMR_DIVERSITY_LAMBDA",
     "MMR_FETCH_K",
     "SEARCH_K",
     "ENABLE_HYBRID_SEARCH",
+    "QUERY_EXPANSION_MIN_WORDS",
+    "ENABLE_QUERY_VARIANT_CACHE",
+    "QUERY_VARIANT_CACHE_TTL_SECONDS",
+    "ENABLE_RETRIEVAL_CACHE",
+    "RETRIEVAL_CACHE_SIMILARITY_THRESHOLD",
+    "RETRIEVAL_CACHE_MAX_ENTRIES",
+    "RETRIEVAL_CACHE_TTL_SECONDS",
+    "ENABLE_ANSWER_CACHE",
+    "ANSWER_CACHE_INCLUDE_HISTORY",
+    "ANSWER_CACHE_TTL_SECONDS",
+    "SERVER_HOST",
+    "SERVER_PORT",
+    "SERVER_MAX_CONCURRENT_REQUESTS",
+    "SERVER_MAX_QUEUED_REQUESTS",
+    "SERVER_QUEUE_TIMEOUT_SECONDS",
+    "SERVER_MAX_CONCURRENT_INGESTS",
+    "RETRIEVER_REGISTRY_MEMORY_BUDGET_MB",
+    "BATCH_MAX_CONCURRENCY",
+    "TELEMETRY_ENABLED",
+    "TELEMETRY_OTLP_PATH",
+    "TELEMETRY_MAX_SPANS",
     "CHATS_DIR",
     "ENGINE",
+    "get_engine",
+    "get_async_engine",
+    "DB_ECHO",
+    "CHATS_DB_POOL_SIZE",
+    "CHATS_DB_FLUSH_INTERVAL_SECONDS",
     "MAX_MSG_SUMMARY",
     "CHAT_STATE_DIR",
+    "CHECKPOINT_KEEP_LAST",
+    "CHECKPOINT_COMPACTION_IDLE_SECONDS",
+    "CHECKPOINT_COMPACTION_INTERVAL_SECONDS",
     "DEFAULT_CHAT_ID",
 ]
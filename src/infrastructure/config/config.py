@@ -7,14 +7,29 @@ load_dotenv()
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 PERSIST_DIR: str = os.getenv("PERSIST_DIR", str(PROJECT_ROOT / "db"))
+BM25_INDEX_DIR: str = os.getenv("BM25_INDEX_DIR", str(PROJECT_ROOT / "db" / "bm25"))
 
-CHATS_DIR = os.path.join(PROJECT_ROOT, "db", "chats")
+CHATS_DIR: str = os.getenv("CHATS_DIR", os.path.join(PROJECT_ROOT, "db", "chats"))
 os.makedirs(CHATS_DIR, exist_ok=True)
 
-CHATS_DB_PATH = PROJECT_ROOT / "db" / "chats" / "chats.db"
+CHATS_DB_PATH = Path(CHATS_DIR) / "chats.db"
 CHATS_DB_URL = f"sqlite:///{CHATS_DB_PATH}"
-
-CHAT_STATE_DIR = os.path.join(PROJECT_ROOT, "db", "chats", "states.db")
+CHATS_DB_ASYNC_URL = f"sqlite+aiosqlite:///{CHATS_DB_PATH}"
+# Connections of the async chat store; in WAL mode readers do not wait for the writer
+CHATS_DB_POOL_SIZE: int = int(os.getenv("CHATS_DB_POOL_SIZE", "5"))
+# Small chat updates (message counters, summaries) are buffered this long and
+# committed together; 0 commits each update immediately
+CHATS_DB_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("CHATS_DB_FLUSH_INTERVAL_SECONDS", "0.5"))
+
+CHAT_STATE_DIR = os.path.join(CHATS_DIR, "states.db")
+# Checkpoint retention in CHAT_STATE_DIR (python main.py compact, or on a schedule in server mode)
+CHECKPOINT_KEEP_LAST: int = int(os.getenv("CHECKPOINT_KEEP_LAST", "5"))
+# Summarized messages are only dropped from chats without a checkpoint this recent
+CHECKPOINT_COMPACTION_IDLE_SECONDS: float = float(os.getenv("CHECKPOINT_COMPACTION_IDLE_SECONDS", "600"))
+# 0 disables scheduled compaction in server mode
+CHECKPOINT_COMPACTION_INTERVAL_SECONDS: float = float(os.getenv("CHECKPOINT_COMPACTION_INTERVAL_SECONDS", "3600"))
+# Log every SQL statement of the chats database
+DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
 
 DEFAULT_CHAT_ID: str | None = os.getenv("DEFAULT_CHAT_ID", "")
 if not DEFAULT_CHAT_ID:
@@ -36,6 +51,36 @@ LANG: str = os.getenv("LANG", "en")
 PROXY_USER: str | None = os.getenv("PROXY_USER")
 PROXY_PASS: str | None = os.getenv("PROXY_PASS")
 
+# Transcript fetching - OPTIONAL
+TRANSCRIPT_MAX_CONCURRENCY: int = int(os.getenv("TRANSCRIPT_MAX_CONCURRENCY", "4"))
+TRANSCRIPT_RATE_LIMIT: float = float(os.getenv("TRANSCRIPT_RATE_LIMIT", "2"))
+TRANSCRIPT_RATE_PERIOD: float = float(os.getenv("TRANSCRIPT_RATE_PERIOD", "1"))
+if TRANSCRIPT_RATE_LIMIT <= 0:
+    raise ValueError("TRANSCRIPT_RATE_LIMIT must be greater than 0")
+if TRANSCRIPT_RATE_PERIOD <= 0:
+    raise ValueError("TRANSCRIPT_RATE_PERIOD must be greater than 0")
+
+# "incremental" syncs new/removed videos, "skip" leaves indexed playlists untouched
+PLAYLIST_SYNC_MODE: str = os.getenv("PLAYLIST_SYNC_MODE", "incremental").lower()
+# Skip re-listing playlists synced within this many seconds (0 always syncs)
+PLAYLIST_SYNC_MAX_AGE_SECONDS: int = int(os.getenv("PLAYLIST_SYNC_MAX_AGE_SECONDS", "0"))
+
+# Transcript chunks: estimated tokens per chunk, and tokens repeated from the previous chunk
+TRANSCRIPT_CHUNK_TOKENS: int = int(os.getenv("TRANSCRIPT_CHUNK_TOKENS", "256"))
+TRANSCRIPT_CHUNK_OVERLAP_TOKENS: int = int(os.getenv("TRANSCRIPT_CHUNK_OVERLAP_TOKENS", "32"))
+# Recorded with each indexed video; syncing re-chunks videos indexed with other settings
+TRANSCRIPT_CHUNKER: str = (
+    f"tokens={TRANSCRIPT_CHUNK_TOKENS},overlap={TRANSCRIPT_CHUNK_OVERLAP_TOKENS}"
+)
+
+ENABLE_TRANSCRIPT_CACHE: bool = os.getenv("ENABLE_TRANSCRIPT_CACHE", "true").lower() == "true"
+TRANSCRIPT_CACHE_DIR: str = os.getenv(
+    "TRANSCRIPT_CACHE_DIR", str(PROJECT_ROOT / "db" / "transcripts")
+)
+TRANSCRIPT_CACHE_MAX_MB: int = int(os.getenv("TRANSCRIPT_CACHE_MAX_MB", "512"))
+# 0 disables expiration
+TRANSCRIPT_CACHE_TTL_SECONDS: int = int(os.getenv("TRANSCRIPT_CACHE_TTL_SECONDS", "0"))
+
 LLM_PROVIDER: str | None = os.getenv("LLM_PROVIDER", "anthropic")
 if not LLM_PROVIDER:
     raise ValueError("LLM_PROVIDER environment variable is required")
@@ -56,6 +101,12 @@ EMBEDDING_MODEL: str | None = os.getenv("EMBEDDING_MODEL")
 if not EMBEDDING_MODEL:
     raise ValueError("EMBEDDING_MODEL environment variable is required")
 
+ENABLE_EMBEDDING_CACHE: bool = os.getenv("ENABLE_EMBEDDING_CACHE", "true").lower() == "true"
+EMBEDDING_CACHE_PATH: str = os.getenv(
+    "EMBEDDING_CACHE_PATH", str(PROJECT_ROOT / "db" / "embeddings_cache.db")
+)
+EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "128"))
+
 
 SEARCH_TYPE: str = os.getenv("SEARCH_TYPE", "similarity")
 SEARCH_K: int = int(os.getenv("SEARCH_K", "2"))
@@ -64,4 +115,48 @@ ENABLE_HYBRID_SEARCH: bool = os.getenv("ENABLE_HYBRID_SEARCH", "true").lower() =
 MMR_DIVERSITY_LAMBDA: float = float(os.getenv("MMR_DIVERSITY_LAMBDA", "0.7"))
 MMR_FETCH_K: int = int(os.getenv("MMR_FETCH_K", "20"))
 
+# Questions shorter than this (in words) skip LLM query expansion
+QUERY_EXPANSION_MIN_WORDS: int = int(os.getenv("QUERY_EXPANSION_MIN_WORDS", "4"))
+ENABLE_QUERY_VARIANT_CACHE: bool = os.getenv("ENABLE_QUERY_VARIANT_CACHE", "true").lower() == "true"
+# 0 disables expiration
+QUERY_VARIANT_CACHE_TTL_SECONDS: int = int(os.getenv("QUERY_VARIANT_CACHE_TTL_SECONDS", "0"))
+
+# Semantic cache of retrieval results, per playlist and embedding model. It is kept in
+# memory, so only server and batch mode use it; the CLI answers one question per process
+ENABLE_RETRIEVAL_CACHE: bool = os.getenv("ENABLE_RETRIEVAL_CACHE", "true").lower() == "true"
+# Minimum cosine similarity between question embeddings for a cache hit
+RETRIEVAL_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("RETRIEVAL_CACHE_SIMILARITY_THRESHOLD", "0.92"))
+RETRIEVAL_CACHE_MAX_ENTRIES: int = int(os.getenv("RETRIEVAL_CACHE_MAX_ENTRIES", "256"))
+# 0 disables expiration
+RETRIEVAL_CACHE_TTL_SECONDS: int = int(os.getenv("RETRIEVAL_CACHE_TTL_SECONDS", "3600"))
+
+# Opt-in cache of generated answers, keyed by playlist, retrieved chunks and question
+ENABLE_ANSWER_CACHE: bool = os.getenv("ENABLE_ANSWER_CACHE", "false").lower() == "true"
+# Set to false to share cached answers across chats regardless of their history
+ANSWER_CACHE_INCLUDE_HISTORY: bool = os.getenv("ANSWER_CACHE_INCLUDE_HISTORY", "true").lower() == "true"
+# 0 disables expiration
+ANSWER_CACHE_TTL_SECONDS: int = int(os.getenv("ANSWER_CACHE_TTL_SECONDS", "0"))
+
+# HTTP server mode (python main.py serve)
+SERVER_HOST: str = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT: int = int(os.getenv("SERVER_PORT", "8080"))
+# Questions answered at the same time; further ones wait in a bounded queue
+SERVER_MAX_CONCURRENT_REQUESTS: int = int(os.getenv("SERVER_MAX_CONCURRENT_REQUESTS", "8"))
+SERVER_MAX_QUEUED_REQUESTS: int = int(os.getenv("SERVER_MAX_QUEUED_REQUESTS", "32"))
+SERVER_QUEUE_TIMEOUT_SECONDS: float = float(os.getenv("SERVER_QUEUE_TIMEOUT_SECONDS", "30"))
+SERVER_MAX_CONCURRENT_INGESTS: int = int(os.getenv("SERVER_MAX_CONCURRENT_INGESTS", "1"))
+# Memory budget for warm per-playlist retrievers; least recently used ones are evicted
+RETRIEVER_REGISTRY_MEMORY_BUDGET_MB: int = int(os.getenv("RETRIEVER_REGISTRY_MEMORY_BUDGET_MB", "512"))
+
+# Batch question mode (python main.py batch): questions answered at the same time
+BATCH_MAX_CONCURRENCY: int = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+
+# Per-node spans and pipeline counters, served at GET /metrics in server mode
+TELEMETRY_ENABLED: bool = os.getenv("TELEMETRY_ENABLED", "false").lower() == "true"
+# OTLP/JSON file the CLI, batch and server append spans and metrics to ("" disables it)
+TELEMETRY_OTLP_PATH: str = os.getenv(
+    "TELEMETRY_OTLP_PATH", str(PROJECT_ROOT / "db" / "telemetry" / "otlp.jsonl")
+)
+TELEMETRY_MAX_SPANS: int = int(os.getenv("TELEMETRY_MAX_SPANS", "10000"))
+
 MAX_MSG_SUMMARY = 6
@@ -1,6 +1,78 @@
+from functools import cache
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import create_engine, SQLModel
-from .config import CHATS_DB_URL
-from src.domain.models import Chat  # noqa: F401
+from .config import CHATS_DB_ASYNC_URL, CHATS_DB_POOL_SIZE, CHATS_DB_URL, DB_ECHO
+from src.domain.models import (  # noqa: F401
+    Chat,
+    IndexedPlaylist,
+    IndexedVideo,
+    QueryVariantEntry,
+    AnswerEntry,
+)
+
+# Columns added to existing tables; create_all only creates missing tables
+ADDED_COLUMNS = {
+    "chat": {"summarized_messages_count": "INTEGER NOT NULL DEFAULT 0"},
+    "indexedvideo": {"chunker": "VARCHAR"},
+}
+
+# Applied to every new connection. WAL lets readers run while one writer
+# commits; NORMAL sync is durable across application crashes in WAL mode
+# and skips an fsync per commit; busy_timeout waits for the write lock
+# instead of failing with "database is locked".
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": "5000",
+    "foreign_keys": "ON",
+    "temp_store": "MEMORY",
+    "cache_size": "-16000",
+}
+
+
+def set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def add_missing_columns(connection) -> None:
+    for table, columns in ADDED_COLUMNS.items():
+        existing = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")}
+        for column, definition in columns.items():
+            if column not in existing:
+                connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+@cache
+def get_engine():
+    """Create the chats database engine and its tables on first use."""
+    engine = create_engine(CHATS_DB_URL, echo=DB_ECHO)
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        add_missing_columns(connection)
+    return engine
+
+
+@cache
+def get_async_engine():
+    """
+    Async engine over the same chats database, used by the chat store.
 
-engine = create_engine(CHATS_DB_URL, echo=True)
-SQLModel.metadata.create_all(engine)
+    The pool is bounded, so concurrent requests queue for a connection
+    instead of opening one each. Tables are created through `get_engine()`
+    the first time this is called.
+    """
+    get_engine()
+    engine = create_async_engine(
+        CHATS_DB_ASYNC_URL,
+        echo=DB_ECHO,
+        pool_size=max(1, CHATS_DB_POOL_SIZE),
+        max_overflow=0,
+    )
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    return engine
@@ -1,5 +1,11 @@
 from src.infrastructure.extensions.embeddings.init_embedding_extended import (
     init_embeddings,
 )
+from src.infrastructure.extensions.embeddings.cached_embeddings import (
+    CachedEmbeddings,
+)
+from src.infrastructure.extensions.embeddings.traced_embeddings import (
+    TracedEmbeddings,
+)
 
-__all__ = ["init_embeddings"]
+__all__ = ["init_embeddings", "CachedEmbeddings", "TracedEmbeddings"]
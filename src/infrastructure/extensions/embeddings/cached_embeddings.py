@@ -0,0 +1,121 @@
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+from langchain_core.embeddings import Embeddings
+
+from src.infrastructure.telemetry import telemetry
+
+SQLITE_MAX_VARIABLES = 500
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that only sends texts missing from a SQLite cache to the provider."""
+
+    def __init__(self, underlying: Embeddings, namespace: str, cache_path: str):
+        self.underlying = underlying
+        self.namespace = namespace
+        self.cache_path = cache_path
+        self.hits = 0
+        self.misses = 0
+
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _key(self, kind: str, text: str) -> str:
+        raw_key = f"{self.namespace}\0{kind}\0{text}"
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys: Iterable[str]) -> dict[str, list[float]]:
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            for idx in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                batch = keys[idx : idx + SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("d", blob).tolist()
+        return found
+
+    def _store(self, items: dict[str, list[float]]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, array("d", vector).tobytes()) for key, vector in items.items()],
+            )
+            self._conn.commit()
+
+    def _split(self, kind: str, texts: list[str]):
+        keys = [self._key(kind, text) for text in texts]
+        cached = self._lookup(set(keys))
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        hits = sum(1 for key in keys if key in cached)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(missing)
+        telemetry.increment("cache_lookups", hits, cache="embedding", result="hit")
+        telemetry.increment("cache_lookups", len(missing), cache="embedding", result="miss")
+
+        return keys, cached, missing
+
+    def _merge(self, keys, cached, missing_keys, missing_vectors) -> list[list[float]]:
+        new_vectors = dict(zip(missing_keys, missing_vectors))
+        if new_vectors:
+            self._store(new_vectors)
+        cached.update(new_vectors)
+        return [cached[key] for key in keys]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, cached, missing = self._split("document", texts)
+        vectors = (
+            self.underlying.embed_documents(list(missing.values())) if missing else []
+        )
+        return self._merge(keys, cached, list(missing), vectors)
+
+    def embed_query(self, text: str) -> list[float]:
+        keys, cached, missing = self._split("query", [text])
+        vectors = [self.underlying.embed_query(text)] if missing else []
+        return self._merge(keys, cached, list(missing), vectors)[0]
+
+    # The async variants run the blocking SQLite reads and writes on a
+    # worker thread, so cache I/O never stalls the event loop
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, cached, missing = await asyncio.to_thread(self._split, "document", texts)
+        vectors = (
+            await self.underlying.aembed_documents(list(missing.values()))
+            if missing
+            else []
+        )
+        return await asyncio.to_thread(self._merge, keys, cached, list(missing), vectors)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        keys, cached, missing = await asyncio.to_thread(self._split, "query", [text])
+        vectors = [await self.underlying.aembed_query(text)] if missing else []
+        return (await asyncio.to_thread(self._merge, keys, cached, list(missing), vectors))[0]
+
+    def stats(self) -> dict[str, int | float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
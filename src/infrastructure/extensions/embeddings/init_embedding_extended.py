@@ -6,15 +6,40 @@ from langchain_classic.embeddings import init_embeddings as _init_embeddings
 
 from langchain_voyageai import VoyageAIEmbeddings
 
+from src.infrastructure.extensions.embeddings.cached_embeddings import CachedEmbeddings
+from src.infrastructure.extensions.embeddings.traced_embeddings import TracedEmbeddings
+from src.infrastructure.telemetry import telemetry
 
-def init_embeddings(model: str, *, provider: str | None = None, **kwargs) -> Embeddings | Runnable[Any, list[float]]:
+
+def init_embeddings(
+    model: str,
+    *,
+    provider: str | None = None,
+    cache_path: str | None = None,
+    **kwargs,
+) -> Embeddings | Runnable[Any, list[float]]:
     """
     Extended init_embeddings that supports Voyage AI provider.
 
     For provider="voyage", uses VoyageAIEmbeddings directly.
     For other providers, delegates to langchain_classic.embeddings.init_embeddings.
+    When cache_path is given, the client is wrapped in a SQLite-backed
+    CachedEmbeddings so previously seen texts are not embedded again.
+    With telemetry enabled, provider calls (cache misses only) are traced.
     """
     if provider and provider.lower() == "voyage":
-        return VoyageAIEmbeddings(model=model, **kwargs)
+        embeddings = VoyageAIEmbeddings(model=model, **kwargs)
+    else:
+        embeddings = _init_embeddings(model=model, provider=provider, **kwargs)
+
+    if telemetry.enabled and isinstance(embeddings, Embeddings):
+        embeddings = TracedEmbeddings(embeddings)
+
+    if cache_path and isinstance(embeddings, Embeddings):
+        return CachedEmbeddings(
+            underlying=embeddings,
+            namespace=f"{provider or ''}:{model}",
+            cache_path=cache_path,
+        )
 
-    return _init_embeddings(model=model, provider=provider, **kwargs)
+    return embeddings
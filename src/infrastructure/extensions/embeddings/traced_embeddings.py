@@ -0,0 +1,35 @@
+from langchain_core.embeddings import Embeddings
+
+from src.infrastructure.telemetry import telemetry
+
+
+class TracedEmbeddings(Embeddings):
+    """Embeddings wrapper that records a span and call counters per provider call."""
+
+    def __init__(self, underlying: Embeddings):
+        self.underlying = underlying
+
+    @staticmethod
+    def _record(kind: str, texts: int) -> None:
+        telemetry.increment("embedding_calls", kind=kind)
+        telemetry.increment("embedding_texts", texts, kind=kind)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self._record("documents", len(texts))
+        with telemetry.span("embedding.documents", texts=len(texts)):
+            return self.underlying.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        self._record("query", 1)
+        with telemetry.span("embedding.query"):
+            return self.underlying.embed_query(text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        self._record("documents", len(texts))
+        with telemetry.span("embedding.documents", texts=len(texts)):
+            return await self.underlying.aembed_documents(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        self._record("query", 1)
+        with telemetry.span("embedding.query"):
+            return await self.underlying.aembed_query(text)
@@ -2,5 +2,16 @@ from src.infrastructure.extensions.loaders.youtube_loader_with_proxy import (
     YoutubeLoaderWithProxy,
     TranscriptFormat,
 )
+from src.infrastructure.extensions.loaders.transcript_cache import TranscriptCache
+from src.infrastructure.extensions.loaders.transcript_chunker import (
+    chunk_transcript,
+    count_tokens,
+)
 
-__all__ = ["YoutubeLoaderWithProxy", "TranscriptFormat"]
+__all__ = [
+    "YoutubeLoaderWithProxy",
+    "TranscriptFormat",
+    "TranscriptCache",
+    "chunk_transcript",
+    "count_tokens",
+]
@@ -0,0 +1,147 @@
+"""Persistent, content-addressed cache for raw YouTube transcript snippets."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+
+class TranscriptCache:
+    """
+    On-disk cache of raw transcript snippets keyed by video, language and
+    translation.
+
+    Each entry is the zlib-compressed JSON snippet list returned by the
+    transcript API. Entries are evicted least-recently-used first once the
+    cache grows past `max_bytes`, and are ignored once older than
+    `ttl_seconds` (when set).
+    """
+
+    FILE_SUFFIX = ".json.z"
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_bytes: int,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds or None
+        self._lock = threading.Lock()
+        self._size_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(
+        video_id: str,
+        language: Union[str, Sequence[str]],
+        translation: Optional[str] = None,
+    ) -> str:
+        languages = [language] if isinstance(language, str) else list(language)
+        raw_key = json.dumps([video_id, languages, translation])
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{self.FILE_SUFFIX}"
+
+    def _entries(self) -> List[Path]:
+        return list(self.cache_dir.glob(f"*/*{self.FILE_SUFFIX}"))
+
+    def get(
+        self,
+        video_id: str,
+        language: Union[str, Sequence[str]],
+        translation: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        path = self._path(self.make_key(video_id, language, translation))
+
+        try:
+            payload = json.loads(zlib.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (zlib.error, ValueError):
+            self._discard(path)
+            return None
+
+        if self.ttl_seconds and time.time() - payload["created_at"] > self.ttl_seconds:
+            self._discard(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return payload["snippets"]
+
+    def put(
+        self,
+        video_id: str,
+        language: Union[str, Sequence[str]],
+        translation: Optional[str],
+        snippets: List[Dict[str, Any]],
+    ) -> None:
+        path = self._path(self.make_key(video_id, language, translation))
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = zlib.compress(
+            json.dumps({"created_at": time.time(), "snippets": snippets}).encode(
+                "utf-8"
+            )
+        )
+
+        with self._lock:
+            current_size = self._current_size()
+            previous_size = self._file_size(path)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+
+            self._size_bytes = current_size - previous_size + len(data)
+            if self._size_bytes > self.max_bytes:
+                self._evict()
+
+    def _current_size(self) -> int:
+        if self._size_bytes is None:
+            self._size_bytes = sum(self._file_size(path) for path in self._entries())
+        return self._size_bytes
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        self._size_bytes = total
+
+    def _discard(self, path: Path) -> None:
+        with self._lock:
+            size = self._file_size(path)
+            path.unlink(missing_ok=True)
+            if self._size_bytes is not None:
+                self._size_bytes = max(0, self._size_bytes - size)
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,119 @@
+"""Token-budgeted chunking of raw transcript snippets."""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence
+
+from langchain_core.documents import Document
+
+# Roughly one BPE token per word or punctuation mark; close enough to size
+# chunks evenly without a tokenizer dependency
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+SENTENCE_END_PATTERN = re.compile(r"[.!?…][\"')\]]*$")
+# Auto-generated captions carry no punctuation; a pause this long between
+# snippets is treated as a sentence boundary too
+PAUSE_SECONDS = 1.0
+
+
+def count_tokens(text: str) -> int:
+    return len(TOKEN_PATTERN.findall(text))
+
+
+def seconds_to_timestamp(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+@dataclass(frozen=True)
+class _Piece:
+    text: str
+    start: float
+    end: float
+    tokens: int
+
+
+def _to_pieces(
+    snippets: Sequence[Dict[str, Any]], count: Callable[[str], int]
+) -> List[_Piece]:
+    pieces = []
+    for snippet in snippets:
+        text = " ".join(snippet.get("text", "").split())
+        if not text:
+            continue
+        start = float(snippet.get("start", 0))
+        pieces.append(
+            _Piece(
+                text=text,
+                start=start,
+                end=start + float(snippet.get("duration", 0)),
+                tokens=max(1, count(text)),
+            )
+        )
+    return pieces
+
+
+def _ends_sentence(pieces: List[_Piece], idx: int) -> bool:
+    if SENTENCE_END_PATTERN.search(pieces[idx].text):
+        return True
+    return idx + 1 < len(pieces) and pieces[idx + 1].start - pieces[idx].end >= PAUSE_SECONDS
+
+
+def chunk_transcript(
+    snippets: Sequence[Dict[str, Any]],
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    count: Callable[[str], int] = count_tokens,
+) -> List[Document]:
+    """
+    Pack transcript snippets (text, start, duration) into chunks.
+
+    Each chunk takes whole snippets up to `max_tokens` and ends at the last
+    sentence boundary past half the budget, or at the budget when there is
+    none. The next chunk starts with the trailing snippets of the previous
+    one, up to `overlap_tokens`. A single snippet longer than the budget is
+    kept whole.
+
+    Chunk metadata holds `start_seconds` and `end_seconds` (the end of its
+    last snippet), `start_timestamp` and the estimated `tokens`.
+    """
+    pieces = _to_pieces(snippets, count)
+    max_tokens = max(1, max_tokens)
+    overlap_tokens = min(max(0, overlap_tokens), max_tokens // 2)
+
+    chunks: List[Document] = []
+    first = 0
+    while first < len(pieces):
+        total = 0
+        last = first
+        boundary = None
+        while last < len(pieces) and (last == first or total + pieces[last].tokens <= max_tokens):
+            total += pieces[last].tokens
+            last += 1
+            if total >= max_tokens // 2 and _ends_sentence(pieces, last - 1):
+                boundary = last
+        if last < len(pieces) and boundary is not None:
+            last = boundary
+
+        chunk = pieces[first:last]
+        chunks.append(
+            Document(
+                page_content=" ".join(piece.text for piece in chunk),
+                metadata={
+                    "start_seconds": chunk[0].start,
+                    "end_seconds": round(max(piece.end for piece in chunk), 3),
+                    "start_timestamp": seconds_to_timestamp(chunk[0].start),
+                    "tokens": sum(piece.tokens for piece in chunk),
+                },
+            )
+        )
+        if last >= len(pieces):
+            break
+
+        # Step back over the overlap, always moving past the previous start
+        next_first, overlap = last, 0
+        while next_first - 1 > first and overlap + pieces[next_first - 1].tokens <= overlap_tokens:
+            next_first -= 1
+            overlap += pieces[next_first].tokens
+        first = next_first
+
+    return chunks
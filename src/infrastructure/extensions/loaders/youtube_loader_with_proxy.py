@@ -8,6 +8,8 @@ from langchain_community.document_loaders.youtube import (
 )
 from langchain_core.documents import Document
 
+from src.infrastructure.extensions.loaders.transcript_cache import TranscriptCache
+
 
 class YoutubeLoaderWithProxy(YoutubeLoader):
     """
@@ -39,6 +41,7 @@ class YoutubeLoaderWithProxy(YoutubeLoader):
         webshare_username: Optional[str] = None,
         webshare_password: Optional[str] = None,
         filter_ip_locations: Optional[List[str]] = None,
+        cache: Optional[TranscriptCache] = None,
     ):
         """
         Initialize with video ID and optional Webshare proxy config.
@@ -55,6 +58,7 @@ class YoutubeLoaderWithProxy(YoutubeLoader):
             webshare_password: Webshare proxy password (from dashboard)
             filter_ip_locations: Optional list of country codes to
                 filter IPs (e.g., ["us", "de"])
+            cache: Optional transcript cache checked before any network call
         """
         super().__init__(
             video_id=video_id,
@@ -68,6 +72,7 @@ class YoutubeLoaderWithProxy(YoutubeLoader):
         self.webshare_username = webshare_username
         self.webshare_password = webshare_password
         self.filter_ip_locations = filter_ip_locations
+        self.cache = cache
 
     @classmethod
     def from_youtube_url(
@@ -100,8 +105,30 @@ class YoutubeLoaderWithProxy(YoutubeLoader):
             **kwargs
         )
 
-    def load(self) -> List[Document]:
-        """Load YouTube transcripts with Webshare proxy support."""
+    def load_snippets(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the raw transcript snippets (text, start, duration).
+
+        The cache, when configured, is checked before any network or proxy
+        call. Returns None when transcripts are disabled for the video.
+        """
+        if self.cache is not None:
+            cached_pieces = self.cache.get(
+                self.video_id, self.language, self.translation
+            )
+            if cached_pieces is not None:
+                return cached_pieces
+
+        transcript_pieces = self._fetch_snippets()
+
+        if self.cache is not None and transcript_pieces is not None:
+            self.cache.put(
+                self.video_id, self.language, self.translation, transcript_pieces
+            )
+
+        return transcript_pieces
+
+    def _fetch_snippets(self) -> Optional[List[Dict[str, Any]]]:
         try:
             from youtube_transcript_api import (
                 FetchedTranscript,
@@ -116,10 +143,6 @@ class YoutubeLoaderWithProxy(YoutubeLoader):
                 "Please install it with `pip install youtube-transcript-api`."
             )
 
-        if self.add_video_info:
-            video_info = self._get_video_info()
-            self._metadata.update(video_info)
-
         try:
             # Create YouTubeTranscriptApi with Webshare proxy if provided
             if self.webshare_username and self.webshare_password:
@@ -134,7 +157,7 @@ class YoutubeLoaderWithProxy(YoutubeLoader):
 
             transcript_list = ytt_api.list(self.video_id)
         except TranscriptsDisabled:
-            return []
+            return None
 
         try:
             transcript = transcript_list.find_transcript(self.language)
@@ -147,7 +170,7 @@ class YoutubeLoaderWithProxy(YoutubeLoader):
         transcript_object = transcript.fetch()
 
         if isinstance(transcript_object, FetchedTranscript):
-            transcript_pieces = [
+            return [
                 {
                     "text": snippet.text,
                     "start": snippet.start,
@@ -155,9 +178,18 @@ class YoutubeLoaderWithProxy(YoutubeLoader):
                 }
                 for snippet in transcript_object.snippets
             ]
-        else:
-            # type: ignore[no-redef]
-            transcript_pieces: List[Dict[str, Any]] = transcript_object
+
+        return list(transcript_object)
+
+    def load(self) -> List[Document]:
+        """Load YouTube transcripts with Webshare proxy support."""
+        transcript_pieces = self.load_snippets()
+        if transcript_pieces is None:
+            return []
+
+        if self.add_video_info:
+            video_info = self._get_video_info()
+            self._metadata.update(video_info)
 
         if self.transcript_format == TranscriptFormat.TEXT:
             transcript = " ".join(
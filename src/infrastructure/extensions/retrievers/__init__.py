@@ -0,0 +1,16 @@
+from src.infrastructure.extensions.retrievers.bm25_index import BM25Index, tokenize
+from src.infrastructure.extensions.retrievers.bm25_retriever import (
+    PersistedBM25Retriever,
+)
+from src.infrastructure.extensions.retrievers.hybrid_retriever import (
+    HybridMultiQueryRetriever,
+    RetrievalTimings,
+)
+
+__all__ = [
+    "BM25Index",
+    "PersistedBM25Retriever",
+    "HybridMultiQueryRetriever",
+    "RetrievalTimings",
+    "tokenize",
+]
@@ -0,0 +1,367 @@
+"""Persisted BM25 keyword index stored as memory-mappable NumPy arrays."""
+
+import json
+import mmap
+import os
+import re
+import shutil
+import sys
+import threading
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from langchain_core.documents import Document
+from scipy import sparse
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class _IndexVersion:
+    """One immutable, memory-mapped version of a persisted index."""
+
+    ARRAYS = (
+        "doc_indptr",
+        "doc_terms",
+        "doc_tfs",
+        "term_indptr",
+        "term_docs",
+        "term_weights",
+        "doc_len",
+        "doc_offsets",
+    )
+
+    def __init__(self, version_dir: Path, mmap_mode: Optional[str] = "r"):
+        self.version_dir = version_dir
+        self.arrays = {
+            name: np.load(version_dir / f"{name}.npy", mmap_mode=mmap_mode)
+            for name in self.ARRAYS
+        }
+        self.meta = json.loads((version_dir / "meta.json").read_text())
+        self.vocab: List[str] = json.loads((version_dir / "vocab.json").read_text())
+        self.ids: List[str] = json.loads((version_dir / "ids.json").read_text())
+        self.term_ids = {term: term_id for term_id, term in enumerate(self.vocab)}
+        # Opened once, so the documents stay readable after a newer version
+        # replaces this one and its directory is deleted
+        self.docs = self._open_docs(version_dir / "docs.jsonl", mmap_mode)
+        self._matrix: Optional[sparse.csr_matrix] = None
+        self._nbytes: Optional[int] = None
+
+    @staticmethod
+    def _open_docs(path: Path, mmap_mode: Optional[str]) -> Union[bytes, mmap.mmap]:
+        with open(path, "rb") as docs_file:
+            if mmap_mode is None or os.fstat(docs_file.fileno()).st_size == 0:
+                return docs_file.read()
+            return mmap.mmap(docs_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def n_docs(self) -> int:
+        return len(self.ids)
+
+    @property
+    def matrix(self) -> sparse.csr_matrix:
+        """Term-by-document matrix of precomputed BM25 weights."""
+        if self._matrix is None:
+            self._matrix = sparse.csr_matrix(
+                (
+                    self.arrays["term_weights"],
+                    self.arrays["term_docs"],
+                    self.arrays["term_indptr"],
+                ),
+                shape=(len(self.vocab), self.n_docs),
+                copy=False,
+            )
+        return self._matrix
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this version: arrays, vocabulary and ids."""
+        if self._nbytes is None:
+            self._nbytes = (
+                sum(array.nbytes for array in self.arrays.values())
+                + sys.getsizeof(self.term_ids)
+                + sum(sys.getsizeof(term) for term in self.vocab)
+                + sum(sys.getsizeof(doc_id) for doc_id in self.ids)
+            )
+        return self._nbytes
+
+    def read_lines(self, rows: Iterable[int]) -> List[bytes]:
+        offsets = self.arrays["doc_offsets"]
+        return [bytes(self.docs[int(offsets[row]) : int(offsets[row + 1])]) for row in rows]
+
+    def get_documents(self, rows: Iterable[int]) -> List[Document]:
+        documents = []
+        for line in self.read_lines(rows):
+            data = json.loads(line)
+            documents.append(
+                Document(
+                    id=data["id"],
+                    page_content=data["page_content"],
+                    metadata=data["metadata"],
+                )
+            )
+        return documents
+
+
+class BM25Index:
+    """
+    BM25 index persisted per playlist under `path`.
+
+    Postings are kept as a sparse term-by-document matrix of precomputed
+    BM25 weights, so scoring a batch of queries is a single sparse product
+    followed by an argpartition top-k. They are stored both document-major
+    (so updates only tokenize the new documents) and term-major (the weight
+    matrix queries run against).
+
+    Every update writes a new version directory and atomically repoints
+    `CURRENT` at it, so readers keep a consistent memory-mapped view while
+    the index is rewritten. A version's files are mapped when it is loaded,
+    and the previous version is only deleted by the update after next, so
+    a search that picked a version before the swap can still read it.
+    """
+
+    def __init__(self, path: Union[str, Path], k1: float = 1.5, b: float = 0.75):
+        self.path = Path(path)
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._version: Optional[_IndexVersion] = None
+
+    def exists(self) -> bool:
+        return (self.path / "CURRENT").exists()
+
+    def _current_dir(self) -> Optional[Path]:
+        try:
+            name = (self.path / "CURRENT").read_text().strip()
+        except FileNotFoundError:
+            return None
+        return self.path / name
+
+    def load(self) -> Optional[_IndexVersion]:
+        """Memory-map the latest persisted version, reusing it when unchanged."""
+        version_dir = self._current_dir()
+        if version_dir is None:
+            return None
+
+        version = self._version
+        if version is None or version.version_dir != version_dir:
+            try:
+                version = _IndexVersion(version_dir)
+            except FileNotFoundError:
+                # CURRENT moved on and this version was deleted meanwhile
+                if self._current_dir() == version_dir:
+                    raise
+                return self.load()
+            self._version = version
+
+        return version
+
+    def memory_bytes(self) -> int:
+        return self._version.nbytes if self._version is not None else 0
+
+    def unload(self) -> None:
+        """Drop the memory-mapped version; the next search maps it again."""
+        self._version = None
+
+    def search_batch(
+        self, queries: Sequence[str], k: int
+    ) -> Tuple[Optional[_IndexVersion], List[List[Tuple[int, float]]]]:
+        """
+        Score several queries with one sparse product and keep each query's
+        top `k` rows as (row, score) pairs, best first.
+        """
+        version = self.load()
+        if version is None or version.n_docs == 0 or k <= 0:
+            return version, [[] for _ in queries]
+
+        rows, cols, data = [], [], []
+        for query_idx, query in enumerate(queries):
+            query_terms = Counter(
+                version.term_ids[token]
+                for token in tokenize(query)
+                if token in version.term_ids
+            )
+            rows.extend([query_idx] * len(query_terms))
+            cols.extend(query_terms.keys())
+            data.extend(query_terms.values())
+
+        query_matrix = sparse.csr_matrix(
+            (np.array(data, dtype=np.float32), (rows, cols)),
+            shape=(len(queries), len(version.vocab)),
+        )
+        scores = (query_matrix @ version.matrix).tocsr()
+
+        results = []
+        for query_idx in range(len(queries)):
+            start, end = scores.indptr[query_idx], scores.indptr[query_idx + 1]
+            docs = scores.indices[start:end]
+            values = scores.data[start:end]
+
+            if len(values) > k:
+                top = np.argpartition(-values, k - 1)[:k]
+            else:
+                top = np.arange(len(values))
+            top = top[np.argsort(-values[top], kind="stable")]
+
+            results.append(
+                [(int(docs[idx]), float(values[idx])) for idx in top if values[idx] > 0]
+            )
+
+        return version, results
+
+    def search(self, query: str, k: int) -> Tuple[Optional[_IndexVersion], List[Tuple[int, float]]]:
+        version, results = self.search_batch([query], k)
+        return version, results[0]
+
+    def search_documents_batch(self, queries: Sequence[str], k: int) -> List[List[Document]]:
+        version, results = self.search_batch(queries, k)
+        if version is None:
+            return [[] for _ in queries]
+        return [version.get_documents(row for row, _ in rows) for rows in results]
+
+    def search_documents(self, query: str, k: int) -> List[Document]:
+        return self.search_documents_batch([query], k)[0]
+
+    def add_documents(self, documents: Sequence[Document]) -> None:
+        self.update(documents=documents)
+
+    def remove(self, ids: Iterable[str]) -> None:
+        self.update(remove_ids=ids)
+
+    def update(
+        self,
+        documents: Sequence[Document] = (),
+        remove_ids: Iterable[str] = (),
+    ) -> None:
+        """Upsert `documents` by id and drop `remove_ids`, then persist a new version."""
+        documents = list(documents)
+        if any(doc.id is None for doc in documents):
+            raise ValueError("BM25Index documents must have an id")
+
+        drop = set(remove_ids) | {doc.id for doc in documents}
+
+        with self._lock:
+            current_dir = self._current_dir()
+            if current_dir is not None:
+                current = _IndexVersion(current_dir, mmap_mode=None)
+                vocab = current.vocab
+                term_ids = current.term_ids
+                arrays = current.arrays
+                keep = [row for row, doc_id in enumerate(current.ids) if doc_id not in drop]
+                ids = [current.ids[row] for row in keep]
+                lines = current.read_lines(keep)
+                doc_lengths = np.diff(arrays["doc_indptr"])
+                row_keep = np.zeros(current.n_docs, dtype=bool)
+                row_keep[keep] = True
+                nnz_keep = np.repeat(row_keep, doc_lengths)
+                nnz_counts = [doc_lengths[row_keep]]
+                doc_terms = [arrays["doc_terms"][nnz_keep]]
+                doc_tfs = [arrays["doc_tfs"][nnz_keep]]
+                doc_len = [arrays["doc_len"][row_keep]]
+            else:
+                vocab, term_ids, ids, lines = [], {}, [], []
+                nnz_counts, doc_terms, doc_tfs, doc_len = [], [], [], []
+
+            for doc in {doc.id: doc for doc in documents}.values():
+                tokens = tokenize(doc.page_content)
+                counts = Counter(tokens)
+                terms = []
+                for token in counts:
+                    if token not in term_ids:
+                        term_ids[token] = len(vocab)
+                        vocab.append(token)
+                    terms.append(term_ids[token])
+
+                ids.append(doc.id)
+                lines.append(
+                    json.dumps(
+                        {
+                            "id": doc.id,
+                            "page_content": doc.page_content,
+                            "metadata": doc.metadata,
+                        }
+                    ).encode("utf-8")
+                    + b"\n"
+                )
+                nnz_counts.append(np.array([len(terms)], dtype=np.int64))
+                doc_terms.append(np.array(terms, dtype=np.int32))
+                doc_tfs.append(np.array(list(counts.values()), dtype=np.float32))
+                doc_len.append(np.array([len(tokens)], dtype=np.float32))
+
+            self._write_version(vocab, ids, lines, nnz_counts, doc_terms, doc_tfs, doc_len)
+
+    def _write_version(self, vocab, ids, lines, nnz_counts, doc_terms, doc_tfs, doc_len):
+        n_docs = len(ids)
+        nnz_per_doc = np.concatenate(nnz_counts) if nnz_counts else np.zeros(0, np.int64)
+        doc_terms = np.concatenate(doc_terms).astype(np.int32) if doc_terms else np.zeros(0, np.int32)
+        doc_tfs = np.concatenate(doc_tfs).astype(np.float32) if doc_tfs else np.zeros(0, np.float32)
+        doc_len = np.concatenate(doc_len).astype(np.float32) if doc_len else np.zeros(0, np.float32)
+
+        doc_indptr = np.zeros(n_docs + 1, dtype=np.int64)
+        np.cumsum(nnz_per_doc, out=doc_indptr[1:])
+
+        # BM25 weight of every posting, with IDF and length normalization
+        # folded in so a query only has to sum the columns of its terms.
+        avgdl = float(doc_len.mean()) if n_docs else 0.0
+        doc_freqs = np.bincount(doc_terms, minlength=len(vocab))
+        idf = np.log((n_docs - doc_freqs + 0.5) / (doc_freqs + 0.5) + 1.0)
+        nnz_rows = np.repeat(np.arange(n_docs, dtype=np.int32), nnz_per_doc)
+        norm = self.k1 * (1 - self.b + self.b * doc_len[nnz_rows] / (avgdl or 1.0))
+        doc_weights = idf[doc_terms] * doc_tfs * (self.k1 + 1) / (doc_tfs + norm)
+
+        order = np.argsort(doc_terms, kind="stable")
+        term_docs = nnz_rows[order]
+        term_weights = doc_weights[order].astype(np.float32)
+        term_indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(doc_freqs, out=term_indptr[1:])
+
+        doc_offsets = np.zeros(n_docs + 1, dtype=np.int64)
+        np.cumsum([len(line) for line in lines], out=doc_offsets[1:])
+
+        version_name = f"v-{uuid.uuid4().hex}"
+        version_dir = self.path / version_name
+        version_dir.mkdir(parents=True)
+
+        arrays = {
+            "doc_indptr": doc_indptr,
+            "doc_terms": doc_terms,
+            "doc_tfs": doc_tfs,
+            "term_indptr": term_indptr,
+            "term_docs": term_docs,
+            "term_weights": term_weights,
+            "doc_len": doc_len,
+            "doc_offsets": doc_offsets,
+        }
+        for name, array in arrays.items():
+            np.save(version_dir / f"{name}.npy", array)
+
+        with open(version_dir / "docs.jsonl", "wb") as docs_file:
+            docs_file.writelines(lines)
+        (version_dir / "vocab.json").write_text(json.dumps(vocab))
+        (version_dir / "ids.json").write_text(json.dumps(ids))
+        (version_dir / "meta.json").write_text(
+            json.dumps(
+                {
+                    "n_docs": n_docs,
+                    "avgdl": avgdl,
+                    "k1": self.k1,
+                    "b": self.b,
+                }
+            )
+        )
+
+        previous_dir = self._current_dir()
+        tmp_current = self.path / f"CURRENT.{version_name}"
+        tmp_current.write_text(version_name)
+        os.replace(tmp_current, self.path / "CURRENT")
+
+        # Keep the version readers may still be loading; older ones go now
+        for stale_dir in self.path.glob("v-*"):
+            if stale_dir not in (version_dir, previous_dir):
+                shutil.rmtree(stale_dir, ignore_errors=True)
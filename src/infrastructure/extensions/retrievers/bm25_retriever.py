@@ -0,0 +1,44 @@
+from typing import List
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables.config import run_in_executor
+from pydantic import ConfigDict
+
+from src.infrastructure.extensions.retrievers.bm25_index import BM25Index
+
+
+class PersistedBM25Retriever(BaseRetriever):
+    """
+    Keyword retriever over a persisted BM25Index, loaded lazily on first query.
+
+    `search_batch` scores all queries with a single sparse product, which is
+    what the multi-query fan-out uses for its query variants. The Runnable
+    `batch`/`abatch` are left as inherited, so they keep their callbacks and
+    `return_exceptions` semantics.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: BM25Index
+    k: int = 4
+
+    def memory_bytes(self) -> int:
+        return self.index.memory_bytes()
+
+    def release(self) -> None:
+        self.index.unload()
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self.index.search_documents(query, self.k)
+
+    def search_batch(self, queries: List[str]) -> List[List[Document]]:
+        if not queries:
+            return []
+        return self.index.search_documents_batch(queries, self.k)
+
+    async def asearch_batch(self, queries: List[str]) -> List[List[Document]]:
+        return await run_in_executor(None, self.search_batch, queries)
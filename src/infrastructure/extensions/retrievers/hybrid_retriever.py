@@ -0,0 +1,147 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import List, Optional, Tuple
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import Runnable
+from pydantic import ConfigDict
+
+from src.infrastructure.telemetry import telemetry
+
+RetrievalTimings = dict[str, float]
+
+
+def search_batch(retriever: BaseRetriever, queries: List[str]) -> List[List[Document]]:
+    """Use the retriever's vectorised `search_batch` when it has one."""
+    if hasattr(retriever, "search_batch"):
+        return retriever.search_batch(queries)
+    return retriever.batch(queries)
+
+
+async def asearch_batch(retriever: BaseRetriever, queries: List[str]) -> List[List[Document]]:
+    if hasattr(retriever, "asearch_batch"):
+        return await retriever.asearch_batch(queries)
+    return await retriever.abatch(queries)
+
+
+class HybridMultiQueryRetriever(BaseRetriever):
+    """
+    Multi-query hybrid retriever that fans out every search concurrently.
+
+    The question is expanded into variants by `query_generator` (skipped when
+    None). The keyword and vector retrievers then score all variants at the
+    same time, and their rank lists are merged with weighted Reciprocal Rank
+    Fusion. `asearch` also returns per-stage timings in seconds.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    keyword_retriever: BaseRetriever
+    vector_retriever: BaseRetriever
+    query_generator: Optional[Runnable] = None
+    weights: List[float] = [0.4, 0.6]
+    c: int = 60
+    include_original: bool = True
+
+    def memory_bytes(self) -> int:
+        """Memory held by the sub-retrievers that report it (the BM25 index)."""
+        return sum(
+            retriever.memory_bytes()
+            for retriever in (self.keyword_retriever, self.vector_retriever)
+            if hasattr(retriever, "memory_bytes")
+        )
+
+    def release(self) -> None:
+        for retriever in (self.keyword_retriever, self.vector_retriever):
+            if hasattr(retriever, "release"):
+                retriever.release()
+
+    def _expand(self, question: str, variants: List[str]) -> List[str]:
+        queries = [variant.strip() for variant in variants if variant and variant.strip()]
+        if self.include_original or not queries:
+            queries.append(question)
+        return list(dict.fromkeys(queries))
+
+    def generate_queries(self, question: str) -> List[str]:
+        if self.query_generator is None:
+            return [question]
+        return self._expand(question, self.query_generator.invoke({"question": question}))
+
+    async def agenerate_queries(self, question: str) -> List[str]:
+        if self.query_generator is None:
+            return [question]
+        return self._expand(
+            question, await self.query_generator.ainvoke({"question": question})
+        )
+
+    def fuse(
+        self, keyword_lists: List[List[Document]], vector_lists: List[List[Document]]
+    ) -> List[Document]:
+        keyword_weight, vector_weight = self.weights
+        ranked_lists = [(docs, keyword_weight) for docs in keyword_lists] + [
+            (docs, vector_weight) for docs in vector_lists
+        ]
+
+        rrf_score: dict[str, float] = defaultdict(float)
+        unique_docs: dict[str, Document] = {}
+        for docs, weight in ranked_lists:
+            for rank, doc in enumerate(docs, start=1):
+                key = doc.id or doc.page_content
+                rrf_score[key] += weight / (rank + self.c)
+                unique_docs.setdefault(key, doc)
+
+        return sorted(
+            unique_docs.values(),
+            key=lambda doc: rrf_score[doc.id or doc.page_content],
+            reverse=True,
+        )
+
+    async def asearch(self, question: str) -> Tuple[List[Document], RetrievalTimings]:
+        timings: RetrievalTimings = {}
+        started_at = time.perf_counter()
+
+        with telemetry.span("retrieval.query_expansion") as span:
+            queries = await self.agenerate_queries(question)
+            span.set_attribute("queries", len(queries))
+        timings["query_expansion"] = time.perf_counter() - started_at
+
+        async def timed(stage: str, coro):
+            stage_started_at = time.perf_counter()
+            with telemetry.span(f"retrieval.{stage}"):
+                result = await coro
+            timings[stage] = time.perf_counter() - stage_started_at
+            return result
+
+        keyword_lists, vector_lists = await asyncio.gather(
+            timed("keyword_search", asearch_batch(self.keyword_retriever, queries)),
+            timed("vector_search", asearch_batch(self.vector_retriever, queries)),
+        )
+
+        fusion_started_at = time.perf_counter()
+        with telemetry.span("retrieval.fusion"):
+            documents = self.fuse(keyword_lists, vector_lists)
+        timings["fusion"] = time.perf_counter() - fusion_started_at
+        timings["total"] = time.perf_counter() - started_at
+
+        return documents, timings
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        queries = self.generate_queries(query)
+        return self.fuse(
+            search_batch(self.keyword_retriever, queries),
+            search_batch(self.vector_retriever, queries),
+        )
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        documents, _ = await self.asearch(query)
+        return documents
@@ -0,0 +1,11 @@
+from .telemetry import Span, Telemetry, telemetry, traced
+from .exporters import export_otlp_json, render_prometheus
+
+__all__ = [
+    "Span",
+    "Telemetry",
+    "telemetry",
+    "traced",
+    "export_otlp_json",
+    "render_prometheus",
+]
@@ -0,0 +1,185 @@
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure.telemetry.telemetry import LabelKey, Span, Telemetry
+
+METRIC_PREFIX = "yt_assistant"
+SERVICE_NAME = "yt-learning-assistant"
+SCOPE_NAME = "src.infrastructure.telemetry"
+
+
+# region PROMETHEUS
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs) + "}"
+
+
+def render_prometheus(telemetry: Telemetry) -> str:
+    """Counters and histograms in the Prometheus text exposition format."""
+    lines: list[str] = []
+
+    counters: dict[str, list[tuple[LabelKey, float]]] = {}
+    for (name, labels), value in telemetry.counters().items():
+        counters.setdefault(name, []).append((labels, value))
+    for name, series in sorted(counters.items()):
+        metric = f"{METRIC_PREFIX}_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        for labels, value in sorted(series):
+            lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+
+    histograms: dict[str, list] = {}
+    for (name, labels), histogram in telemetry.histograms().items():
+        histograms.setdefault(name, []).append((labels, histogram))
+    for name, series in sorted(histograms.items()):
+        metric = f"{METRIC_PREFIX}_{name}"
+        lines.append(f"# TYPE {metric} histogram")
+        for labels, histogram in sorted(series, key=lambda item: item[0]):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                cumulative += count
+                le = (("le", f"{bound:g}"),)
+                lines.append(f"{metric}_bucket{_format_labels(labels, le)} {cumulative}")
+            inf = (("le", "+Inf"),)
+            lines.append(f"{metric}_bucket{_format_labels(labels, inf)} {histogram.count}")
+            lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum:g}")
+            lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+
+    return "\n".join(lines) + "\n"
+
+
+# region OTLP JSON
+
+
+def _attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def _resource() -> dict:
+    return {"attributes": [_attribute("service.name", SERVICE_NAME)]}
+
+
+def _otlp_span(span: Span) -> dict:
+    otlp_span = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns),
+        "attributes": [_attribute(key, value) for key, value in span.attributes.items()],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_span_id:
+        otlp_span["parentSpanId"] = span.parent_span_id
+    return otlp_span
+
+
+def otlp_traces(spans: list[Span]) -> dict:
+    return {
+        "resourceSpans": [
+            {
+                "resource": _resource(),
+                "scopeSpans": [
+                    {"scope": {"name": SCOPE_NAME}, "spans": [_otlp_span(s) for s in spans]}
+                ],
+            }
+        ]
+    }
+
+
+def otlp_metrics(telemetry: Telemetry) -> dict:
+    start = str(telemetry.started_at_ns)
+    now = str(time.time_ns())
+
+    def labels_to_attributes(labels: LabelKey) -> list[dict]:
+        return [_attribute(key, value) for key, value in labels]
+
+    metrics: dict[str, dict] = {}
+    for (name, labels), value in sorted(telemetry.counters().items()):
+        metric = metrics.setdefault(
+            name,
+            {
+                "name": f"{METRIC_PREFIX}.{name}",
+                "sum": {"dataPoints": [], "aggregationTemporality": 2, "isMonotonic": True},
+            },
+        )
+        metric["sum"]["dataPoints"].append(
+            {
+                "attributes": labels_to_attributes(labels),
+                "startTimeUnixNano": start,
+                "timeUnixNano": now,
+                "asDouble": value,
+            }
+        )
+
+    for (name, labels), histogram in sorted(
+        telemetry.histograms().items(), key=lambda item: item[0]
+    ):
+        metric = metrics.setdefault(
+            name,
+            {
+                "name": f"{METRIC_PREFIX}.{name}",
+                "histogram": {"dataPoints": [], "aggregationTemporality": 2},
+            },
+        )
+        overflow = histogram.count - sum(histogram.bucket_counts)
+        metric["histogram"]["dataPoints"].append(
+            {
+                "attributes": labels_to_attributes(labels),
+                "startTimeUnixNano": start,
+                "timeUnixNano": now,
+                "count": str(histogram.count),
+                "sum": histogram.sum,
+                "bucketCounts": [str(c) for c in histogram.bucket_counts + [overflow]],
+                "explicitBounds": list(histogram.buckets),
+            }
+        )
+
+    return {
+        "resourceMetrics": [
+            {
+                "resource": _resource(),
+                "scopeMetrics": [{"scope": {"name": SCOPE_NAME}, "metrics": list(metrics.values())}],
+            }
+        ]
+    }
+
+
+def export_otlp_json(telemetry: Telemetry, path: str | Path) -> int:
+    """
+    Append the buffered spans and the current metrics to `path`.
+
+    Each call writes one OTLP/JSON traces request and one metrics request
+    per line, the layout of the OpenTelemetry Collector file exporter.
+    Returns the number of spans exported.
+    """
+    if not telemetry.enabled:
+        return 0
+
+    spans = telemetry.drain_spans()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as file:
+        if spans:
+            file.write(json.dumps(otlp_traces(spans)) + "\n")
+        file.write(json.dumps(otlp_metrics(telemetry)) + "\n")
+
+    return len(spans)
@@ -0,0 +1,205 @@
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Sequence
+
+from src.infrastructure.config import TELEMETRY_ENABLED, TELEMETRY_MAX_SPANS
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    start_time_ns: int
+    end_time_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Span | None] = ContextVar("telemetry_current_span", default=None)
+
+
+@dataclass
+class Histogram:
+    buckets: Sequence[float]
+    bucket_counts: list[int]
+    sum: float = 0.0
+    count: int = 0
+
+    @classmethod
+    def create(cls, buckets: Sequence[float]) -> "Histogram":
+        return cls(buckets=buckets, bucket_counts=[0] * len(buckets))
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[idx] += 1
+                break
+
+
+def label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class Telemetry:
+    """
+    In-process spans, counters and histograms for the question pipeline.
+
+    Spans nest through a context variable, so sub-stages started inside a
+    node (even in concurrent tasks) share its trace. Every finished span
+    also feeds the `span_duration_seconds` histogram. Finished spans are
+    kept in a bounded buffer until exported.
+
+    When disabled, `span()` returns a shared no-op context manager and the
+    counter methods return immediately, so instrumented code pays about one
+    attribute check per call.
+    """
+
+    def __init__(self, enabled: bool = TELEMETRY_ENABLED, max_spans: int = TELEMETRY_MAX_SPANS):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._spans: deque[Span] = deque(maxlen=max(1, max_spans))
+        self._counters: dict[tuple[str, LabelKey], float] = {}
+        self._histograms: dict[tuple[str, LabelKey], Histogram] = {}
+        self.started_at_ns = time.time_ns()
+
+    def span(self, name: str, **attributes: Any):
+        if not self.enabled:
+            return NOOP_SPAN
+        return self._span(name, attributes)
+
+    @contextmanager
+    def _span(self, name: str, attributes: dict[str, Any]) -> Iterator[Span]:
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_span_id=parent.span_id if parent else None,
+            start_time_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        started_at = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            duration = time.perf_counter() - started_at
+            span.end_time_ns = span.start_time_ns + int(duration * 1e9)
+            with self._lock:
+                self._spans.append(span)
+            self.observe("span_duration_seconds", duration, span=name)
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = (name, label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        buckets: Sequence[float] = DURATION_BUCKETS,
+        **labels: Any,
+    ) -> None:
+        if not self.enabled:
+            return
+        key = (name, label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram.create(buckets)
+            histogram.observe(value)
+
+    def counters(self) -> dict[tuple[str, LabelKey], float]:
+        with self._lock:
+            return dict(self._counters)
+
+    def histograms(self) -> dict[tuple[str, LabelKey], Histogram]:
+        with self._lock:
+            return {
+                key: Histogram(
+                    buckets=h.buckets,
+                    bucket_counts=list(h.bucket_counts),
+                    sum=h.sum,
+                    count=h.count,
+                )
+                for key, h in self._histograms.items()
+            }
+
+    def drain_spans(self) -> list[Span]:
+        with self._lock:
+            spans = list(self._spans)
+            self._spans.clear()
+        return spans
+
+
+telemetry = Telemetry()
+
+
+def traced(name: str, func: Callable) -> Callable:
+    """
+    Wrap a sync or async callable (a graph node) in a span.
+
+    The wrapper keeps the wrapped signature, so LangGraph still passes the
+    config to nodes that accept one. Returns `func` itself when telemetry is
+    disabled.
+    """
+    if not telemetry.enabled:
+        return func
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with telemetry.span(name):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with telemetry.span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,7 @@
+import tempfile
+from pathlib import Path
+
+from benchmarks.run import configure_offline_environment
+
+# The application reads its configuration at import time
+configure_offline_environment(Path(tempfile.mkdtemp(prefix="tests-")))
@@ -0,0 +1,82 @@
+import asyncio
+import uuid
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from src.application.services.chat_store import ChatStore
+from src.application.services.checkpoint_compaction import CheckpointCompactor
+from src.application.services.memory_manager import MemoryManager, thread_lock
+
+
+def build_graph(checkpointer, answering: asyncio.Event, release: asyncio.Event):
+    async def answer(state: MessagesState):
+        answering.set()
+        await release.wait()
+        return {"messages": [AIMessage(content=f"answer {len(state['messages'])}")]}
+
+    graph = StateGraph(MessagesState)
+    graph.add_node("answer", answer)
+    graph.add_edge(START, "answer")
+    graph.add_edge("answer", END)
+    return graph.compile(checkpointer=checkpointer)
+
+
+async def ask(graph, store, checkpointer, chat_id: str, question: str) -> list:
+    async with thread_lock(chat_id):
+        memory = await MemoryManager.open(checkpointer, store, chat_id)
+        await memory.get_context()
+        result = await graph.ainvoke(
+            {"messages": [HumanMessage(content=question)]},
+            config={"configurable": {"thread_id": chat_id}},
+        )
+        await memory.update_chat(result["messages"])
+        return result["messages"]
+
+
+async def run_turn_during_compaction(tmp_path):
+    chat_id = str(uuid.uuid4())
+    store = ChatStore(flush_interval=0)
+    answering, release = asyncio.Event(), asyncio.Event()
+    release.set()
+
+    async with AsyncSqliteSaver.from_conn_string(str(tmp_path / "states.db")) as checkpointer:
+        graph = build_graph(checkpointer, answering, release)
+        for idx in range(2):
+            await ask(graph, store, checkpointer, chat_id, f"question {idx}")
+        chat = await store.get_chat(uuid.UUID(chat_id))
+        # The first turn is already folded into the summary
+        await store.update_chat(chat.id, summarized_messages_count=2)
+
+        answering.clear()
+        release.clear()
+        turn = asyncio.create_task(ask(graph, store, checkpointer, chat_id, "question 2"))
+        await answering.wait()
+
+        compactor = CheckpointCompactor(
+            checkpointer, store, database_path=str(tmp_path / "states.db"), idle_seconds=0
+        )
+        compaction = asyncio.create_task(compactor.compact(vacuum=False))
+        # Compaction now waits for the turn, which is still answering
+        await asyncio.sleep(0.1)
+        assert not compaction.done()
+        release.set()
+        messages, stats = await asyncio.gather(turn, compaction)
+
+        latest = await checkpointer.aget({"configurable": {"thread_id": chat_id}})
+        chat = await store.get_chat(uuid.UUID(chat_id))
+        await store.close()
+
+    return messages, stats, latest["channel_values"]["messages"], chat
+
+
+def test_turn_during_compaction_keeps_its_messages(tmp_path):
+    messages, stats, kept, chat = asyncio.run(run_turn_during_compaction(tmp_path))
+
+    assert len(messages) == 6
+    assert stats["messages_dropped"] == 2
+    # Compaction ran after the turn saved its answer, so only the folded turn is gone
+    assert [message.id for message in kept] == [message.id for message in messages[2:]]
+    assert chat.messages_count == len(kept)
+    assert chat.summarized_messages_count == 0